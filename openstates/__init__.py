@@ -1,4 +1,5 @@
-import urllib3
+import warnings
 
-# Quell InsecureRequestWarning: Unverified HTTPS request warnings
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+# Quell InsecureRequestWarning: Unverified HTTPS request warnings, matching
+# the message so urllib3 needn't be imported until a scrape makes a request
+warnings.filterwarnings("ignore", message="Unverified HTTPS request")
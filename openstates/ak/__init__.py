@@ -1,9 +1,6 @@
 from pupa.scrape import Jurisdiction, Organization
 
-from openstates.utils import url_xpath
-
-from .bills import AKBillScraper
-from .events import AKEventScraper
+from openstates.utils import url_xpath, LazyScrapers
 
 settings = dict(SCRAPELIB_TIMEOUT=600)
 
@@ -13,7 +10,9 @@ class Alaska(Jurisdiction):
     classification = "government"
     name = "Alaska"
     url = "http://w3.legis.state.ak.us/"
-    scrapers = {"bills": AKBillScraper, "events": AKEventScraper}
+    scrapers = LazyScrapers(
+        __name__, {"bills": "bills:AKBillScraper", "events": "events:AKEventScraper"}
+    )
     legislative_sessions = [
         {
             "_scraped_name": "28th Legislature (2013-2014)",
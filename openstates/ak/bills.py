@@ -1,10 +1,10 @@
 import re
 import datetime
 
-import lxml.html
-
 from pupa.scrape import Scraper, Bill, VoteEvent
 
+from openstates.utils import parse_response, absolute
+
 
 class AKBillScraper(Scraper):
     _fiscal_dept_mapping = {
@@ -81,8 +81,7 @@ class AKBillScraper(Scraper):
         }
 
         bill_list_url = f"https://www.akleg.gov/basis/Bill/Range/{session}"
-        doc = lxml.html.fromstring(self.get(bill_list_url).text)
-        doc.make_links_absolute(bill_list_url)
+        doc = parse_response(self.get(bill_list_url))
         for bill_link in doc.xpath("//tr//td[1]//nobr[1]//a[1]"):
             bill_abbr = bill_link.text
             if " " in bill_abbr:
@@ -93,7 +92,7 @@ class AKBillScraper(Scraper):
                 bill_abbr = bill_abbr[:2]
             bill_id = bill_link.text.replace(" ", "")
             bill_type = bill_types[bill_abbr[1:]]
-            bill_url = bill_link.get("href").replace(" ", "")
+            bill_url = absolute(bill_link).replace(" ", "")
             if bill_abbr in ["SB", "SR", "SCR", "SJR"]:
                 chamber = "upper"
             else:
@@ -102,8 +101,7 @@ class AKBillScraper(Scraper):
             yield from self.scrape_bill(chamber, session, bill_id, bill_type, bill_url)
 
     def scrape_bill(self, chamber, session, bill_id, bill_type, url):
-        doc = lxml.html.fromstring(self.get(url).text)
-        doc.make_links_absolute(url)
+        doc = parse_response(self.get(url))
 
         title = doc.xpath('//span[text()="Title"]')[0].getparent()
         if title:
@@ -186,7 +184,7 @@ class AKBillScraper(Scraper):
             if re.search(r"Y(\d+)", action):
                 vote_href = journal.xpath(".//a/@href")
                 if vote_href:
-                    vote_href = vote_href[0].replace(" ", "")
+                    vote_href = absolute(vote_href[0]).replace(" ", "")
                     yield from self.parse_vote(
                         bill,
                         journal_entry_number,
@@ -220,23 +218,21 @@ class AKBillScraper(Scraper):
         )
         bill.add_source(text_list_url)
 
-        text_doc = lxml.html.fromstring(self.get(text_list_url).text)
-        text_doc.make_links_absolute(text_list_url)
+        text_doc = parse_response(self.get(text_list_url))
         for link in text_doc.xpath('//a[contains(@href, "/Text/")]'):
             name = link.text_content()
-            text_url = link.get("href")
+            text_url = absolute(link)
             bill.add_version_link(name, text_url, media_type="text/html")
 
         # Get documents - to do
         doc_list_url = (
             f"https://www.akleg.gov/basis/Bill/Detail/{session}?Root={bill_id}#tab5_4"
         )
-        doc_list = lxml.html.fromstring(self.get(doc_list_url).text)
-        doc_list.make_links_absolute(doc_list_url)
+        doc_list = parse_response(self.get(doc_list_url))
         bill.add_source(doc_list_url)
         for href in doc_list.xpath('//a[contains(@href, "get_documents")][@onclick]'):
             h_name = href.text_content()
-            h_href = href.attrib["href"]
+            h_href = absolute(href)
             if h_name.strip():
                 try:
                     bill.add_document_link(h_name, h_href)
@@ -1,8 +1,6 @@
 from pupa.scrape import Jurisdiction, Organization
 
-from .bills import ALBillScraper
-from .events import ALEventScraper
-from .people import ALPersonScraper
+from openstates.utils import LazyScrapers
 
 
 class Alabama(Jurisdiction):
@@ -10,11 +8,14 @@ class Alabama(Jurisdiction):
     classification = "government"
     name = "Alabama"
     url = "http://www.legislature.state.al.us/"
-    scrapers = {
-        "bills": ALBillScraper,
-        "events": ALEventScraper,
-        "people": ALPersonScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": "bills:ALBillScraper",
+            "events": "events:ALEventScraper",
+            "people": "people:ALPersonScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "Regular Session 2011",
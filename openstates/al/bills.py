@@ -5,6 +5,7 @@ import datetime
 import lxml.html
 import scrapelib
 from pupa.scrape import Scraper, Bill, VoteEvent
+from openstates.utils import parse_response
 from .common import SESSION_SITE_IDS
 
 TIMEZONE = pytz.timezone("US/Eastern")
@@ -68,9 +69,7 @@ class ALBillScraper(Scraper):
         # Standard GET responses must have an ASP.NET VIEWSTATE
         # If they don't, it means the page is a trivial error message
         return bool(
-            lxml.html.fromstring(response.text).xpath(
-                '//input[@id="__VIEWSTATE"]/@value'
-            )
+            parse_response(response).xpath('//input[@id="__VIEWSTATE"]/@value')
             or response.request.method != "GET"
         )
 
@@ -81,7 +80,7 @@ class ALBillScraper(Scraper):
             "http://alisondb.legislature.state.al.us/" "Alison/SelectSession.aspx"
         )
 
-        doc = lxml.html.fromstring(self.get(url=SESSION_SET_URL).text)
+        doc = parse_response(self.get(url=SESSION_SET_URL))
         (viewstate,) = doc.xpath('//input[@id="__VIEWSTATE"]/@value')
         (viewstategenerator,) = doc.xpath('//input[@id="__VIEWSTATEGENERATOR"]/@value')
 
@@ -172,7 +171,7 @@ class ALBillScraper(Scraper):
             "%20House%20of%20Origin&BODY=999999"
         )
 
-        doc = lxml.html.fromstring(self.get(url=BILL_TYPE_URL).text)
+        doc = parse_response(self.get(url=BILL_TYPE_URL))
         (viewstate,) = doc.xpath('//input[@id="__VIEWSTATE"]/@value')
         (viewstategenerator,) = doc.xpath('//input[@id="__VIEWSTATEGENERATOR"]/@value')
         form = {
@@ -466,7 +465,7 @@ class ALBillScraper(Scraper):
                 vote_id, vote_chamber, bill_id, self.session_id
             )
         )
-        doc = lxml.html.fromstring(self.get(url=url).text)
+        doc = parse_response(self.get(url=url))
 
         voters = {"Y": [], "N": [], "P": [], "A": []}
 
@@ -1,11 +1,5 @@
 from pupa.scrape import Jurisdiction, Organization
-from openstates.utils import url_xpath
-
-from .people import ARLegislatorScraper
-from .bills import ARBillScraper
-
-# from .committees import ARCommitteeScraper
-# from .events import AREventScraper
+from openstates.utils import url_xpath, LazyScrapers
 
 
 class Arkansas(Jurisdiction):
@@ -13,12 +7,15 @@ class Arkansas(Jurisdiction):
     classification = "government"
     name = "Arkansas"
     url = "http://www.arkleg.state.ar.us"
-    scrapers = {
-        "people": ARLegislatorScraper,
-        # 'committees': ARCommitteeScraper,
-        "bills": ARBillScraper,
-        # 'events': AREventScraper
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:ARLegislatorScraper",
+            # "committees": "committees:ARCommitteeScraper",
+            "bills": "bills:ARBillScraper",
+            # "events": "events:AREventScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "Regular Session, 2011",
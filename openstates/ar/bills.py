@@ -1,25 +1,54 @@
 import re
-import csv
-import urllib
+import sqlite3
 import datetime
 import pytz
 from pupa.scrape import Scraper, Bill, VoteEvent
 
 import lxml.html
 
-from .common import get_slug_for_session
+from .common import get_slug_for_session, iter_utf_16_ftp_rows
 
 TIMEZONE = pytz.timezone("US/Central")
 
 
-def get_utf_16_ftp_content(url):
-    # Rough to do this within Scrapelib, as it doesn't allow custom decoding
-    raw = urllib.request.urlopen(url).read().decode("utf-16")
-    # Also, legislature may use `NUL` bytes when a cell is empty
-    NULL_BYTE_CODE = "\x00"
-    text = raw.replace(NULL_BYTE_CODE, "")
-    text = text.replace("\r", "")
-    return text
+def classify_action(action):
+    action_type = []
+    if action.startswith("Filed"):
+        action_type.append("introduction")
+    elif action.startswith("Read first time") or action.startswith(
+        "Read the first time"
+    ):
+        action_type.append("reading-1")
+    if re.match("Read the first time, .*, read the second time", action):
+        action_type.append("reading-2")
+    elif action.startswith("Read the third time and passed"):
+        action_type.append("passage")
+        action_type.append("reading-3")
+    elif action.startswith("Read the third time"):
+        action_type.append("reading-3")
+    elif action.startswith("DELIVERED TO GOVERNOR"):
+        action_type.append("executive-receipt")
+    elif action.startswith("Notification"):
+        action_type.append("executive-signature")
+
+    if "referred to" in action:
+        action_type.append("referral-committee")
+
+    if "Returned by the Committee" in action:
+        if "recommendation that it Do Pass" in action:
+            action_type.append("committee-passage-favorable")
+        else:
+            action_type.append("committee-passage")
+
+    if re.match(r"Amendment No\. \d+ read and adopted", action):
+        action_type.append("amendment-introduction")
+        action_type.append("amendment-passage")
+
+    return action_type
+
+
+MEASURES_URL = "ftp://www.arkleg.state.ar.us/SessionInformation/LegislativeMeasures.txt"
+ACTIONS_URL = "ftp://www.arkleg.state.ar.us/SessionInformation/ChamberActions.txt"
 
 
 class ARBillScraper(Scraper):
@@ -29,19 +58,18 @@ class ARBillScraper(Scraper):
             self.info("no session specified, using %s", session)
         self.slug = get_slug_for_session(session)
         chambers = [chamber] if chamber else ["upper", "lower"]
-        self.bills = {}
 
-        for Chamber in chambers:
-            yield from self.scrape_bill(Chamber, session)
-        self.scrape_actions()
-        for bill_id, bill in self.bills.items():
-            yield bill
-
-    def scrape_bill(self, chamber, session):
-        url = "ftp://www.arkleg.state.ar.us/SessionInformation/LegislativeMeasures.txt"
-        page = csv.reader(get_utf_16_ftp_content(url).splitlines(), delimiter="|")
+        # actions are joined onto each bill as it is built, so bills can be
+        # yielded right away instead of being held until every file is read
+        actions = self.scrape_actions()
+        try:
+            for Chamber in chambers:
+                yield from self.scrape_bill(Chamber, session, actions)
+        finally:
+            actions.close()
 
-        for row in page:
+    def scrape_bill(self, chamber, session, actions):
+        for row in iter_utf_16_ftp_rows(MEASURES_URL):
             bill_chamber = {"H": "lower", "S": "upper"}[row[0]]
 
             if bill_chamber != chamber:
@@ -68,7 +96,7 @@ class ARBillScraper(Scraper):
                 title=row[3],
                 classification=bill_type,
             )
-            bill.add_source(url)
+            bill.add_source(MEASURES_URL)
 
             primary = row[11]
             if not primary:
@@ -90,66 +118,53 @@ class ARBillScraper(Scraper):
 
             yield from self.scrape_bill_page(bill)
 
-            self.bills[bill_id] = bill
-
-    def scrape_actions(self):
-        url = "ftp://www.arkleg.state.ar.us/SessionInformation/ChamberActions.txt"
-        page = csv.reader(get_utf_16_ftp_content(url).splitlines(), delimiter="|")
+            self.add_actions(
+                bill,
+                actions.execute(
+                    "SELECT date, action, actor FROM actions"
+                    " WHERE bill_id = ? ORDER BY rowid",
+                    (bill_id,),
+                ),
+            )
 
-        for row in page:
-            bill_id = "%s%s %s" % (row[1], row[2], row[3])
+            yield bill
 
-            if bill_id not in self.bills:
-                continue
-            # different term
-            if row[10] != self.slug:
-                continue
+    def scrape_actions(self):
+        """
+        Indexes this session's action rows by bill id in a temporary SQLite
+        database, so each bill looks up its own instead of the whole
+        session's actions being held in memory.
+        """
+        # an empty name is a private on-disk database, removed on close
+        db = sqlite3.connect("")
+        db.execute(
+            "CREATE TABLE actions (bill_id TEXT, date TEXT, action TEXT, actor TEXT)"
+        )
+        db.executemany(
+            "INSERT INTO actions VALUES (?, ?, ?, ?)",
+            (
+                ("%s%s %s" % (row[1], row[2], row[3]), row[5], row[6], row[7])
+                for row in iter_utf_16_ftp_rows(ACTIONS_URL)
+                # different term
+                if row[10] == self.slug
+            ),
+        )
+        db.execute("CREATE INDEX actions_bill_id ON actions (bill_id)")
+        return db
 
-            actor = {"H": "lower", "S": "upper"}[row[7].upper()]
+    def add_actions(self, bill, rows):
+        for date, action, actor in rows:
+            actor = {"H": "lower", "S": "upper"}[actor.upper()]
 
             date = TIMEZONE.localize(
-                datetime.datetime.strptime(row[5], "%Y-%m-%d %H:%M:%S.%f")
+                datetime.datetime.strptime(date, "%Y-%m-%d %H:%M:%S.%f")
             )
             date = "{:%Y-%m-%d}".format(date)
-            action = row[6]
-
-            action_type = []
-            if action.startswith("Filed"):
-                action_type.append("introduction")
-            elif action.startswith("Read first time") or action.startswith(
-                "Read the first time"
-            ):
-                action_type.append("reading-1")
-            if re.match("Read the first time, .*, read the second time", action):
-                action_type.append("reading-2")
-            elif action.startswith("Read the third time and passed"):
-                action_type.append("passage")
-                action_type.append("reading-3")
-            elif action.startswith("Read the third time"):
-                action_type.append("reading-3")
-            elif action.startswith("DELIVERED TO GOVERNOR"):
-                action_type.append("executive-receipt")
-            elif action.startswith("Notification"):
-                action_type.append("executive-signature")
-
-            if "referred to" in action:
-                action_type.append("referral-committee")
-
-            if "Returned by the Committee" in action:
-                if "recommendation that it Do Pass" in action:
-                    action_type.append("committee-passage-favorable")
-                else:
-                    action_type.append("committee-passage")
-
-            if re.match(r"Amendment No\. \d+ read and adopted", action):
-                action_type.append("amendment-introduction")
-                action_type.append("amendment-passage")
 
+            action_type = classify_action(action)
             if not action:
                 action = "[No text provided]"
-            self.bills[bill_id].add_action(
-                action, date, chamber=actor, classification=action_type
-            )
+            bill.add_action(action, date, chamber=actor, classification=action_type)
 
     def scrape_bill_page(self, bill):
         # We need to scrape each bill page in order to grab associated votes.
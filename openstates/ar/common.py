@@ -1,3 +1,14 @@
+import os
+import csv
+import ftplib
+import tempfile
+import urllib.parse
+
+from pupa import settings
+
+from openstates.utils import cache_path, JSONStore, replay
+
+
 def get_slug_for_session(session):
     # Session-slugs in the Arkansas LIS are the four-digit year, plus:
     # `R` for regular session
@@ -10,3 +21,56 @@ def get_slug_for_session(session):
         return session
     else:
         return "{}R".format(session)
+
+
+def fetch_ftp_file(url):
+    """
+    Download a file from the legislature's FTP server into the pupa cache,
+    skipping the download if the cached copy matches the remote MDTM.
+    Returns the local path.
+    """
+    parsed = urllib.parse.urlparse(url)
+    path = cache_path("ar-ftp", parsed.hostname, parsed.path.lstrip("/"))
+    mtimes = JSONStore("ar-ftp", "mtimes")
+    key = parsed.hostname + parsed.path
+
+    with ftplib.FTP(parsed.hostname, timeout=settings.SCRAPELIB_TIMEOUT) as ftp:
+        ftp.login()
+        try:
+            # MDTM replies "213 YYYYMMDDHHMMSS"
+            mtime = ftp.sendcmd("MDTM " + parsed.path)[4:18]
+        except ftplib.error_perm:
+            mtime = None
+
+        # a recording has to hold the file itself for a replay to read it
+        if (
+            mtime is not None
+            and not replay.recording()
+            and os.path.exists(path)
+            and mtimes.get(key) == mtime
+        ):
+            return path
+
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                ftp.retrbinary("RETR " + parsed.path, f.write)
+            os.replace(tmp, path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+        if mtime is not None:
+            mtimes.set(key, mtime)
+
+    return path
+
+
+def iter_utf_16_ftp_rows(url, delimiter="|"):
+    """
+    Yield the rows of one of the pipe-delimited UTF-16 data files on the
+    legislature's FTP server, decoding incrementally from the local cache.
+    """
+    # legislature may use `NUL` characters when a cell is empty
+    with open(fetch_ftp_file(url), encoding="utf-16", newline="\n") as f:
+        lines = (line.replace("\x00", "").replace("\r", "").rstrip("\n") for line in f)
+        yield from csv.reader(lines, delimiter=delimiter)
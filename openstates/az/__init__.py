@@ -4,11 +4,7 @@ import requests
 
 from pupa.scrape import Jurisdiction, Organization
 
-from .people import AZPersonScraper
-
-# from .committees import AZCommitteeScraper
-# from .events import AZEventScraper
-from .bills import AZBillScraper
+from openstates.utils import LazyScrapers
 
 
 class Arizona(Jurisdiction):
@@ -16,12 +12,15 @@ class Arizona(Jurisdiction):
     classification = "government"
     name = "Arizona"
     url = "http://www.azleg.gov/"
-    scrapers = {
-        "people": AZPersonScraper,
-        # 'committees': AZCommitteeScraper,
-        # 'events': AZEventScraper,
-        "bills": AZBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:AZPersonScraper",
+            # "committees": "committees:AZCommitteeScraper",
+            # "events": "events:AZEventScraper",
+            "bills": "bills:AZBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2009 - Forty-ninth Legislature - First Regular Session",
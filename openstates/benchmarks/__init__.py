@@ -0,0 +1,169 @@
+"""
+    Offline parsing benchmarks.
+
+    Each case runs one parsing function against a recorded fixture, with no
+    network access, and reports throughput and peak memory so that changes
+    to hot parsing code can be compared against a stored baseline:
+
+        python -m openstates.benchmarks            # run everything
+        python -m openstates.benchmarks tx nm      # only some jurisdictions
+        python -m openstates.benchmarks --save     # record a new baseline
+"""
+import os
+import json
+import time
+import tracemalloc
+from collections import OrderedDict
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+# name -> Case, in registration order
+CASES = OrderedDict()
+
+
+class SkipCase(Exception):
+    """Raised by a case's setup when it can't run here (e.g. no pdftotext)."""
+
+
+class Case(object):
+    """A parsing function to benchmark.
+
+    Args:
+        name (str): Unique name, prefixed with the jurisdiction,
+            e.g. ``"tx.record_votes"``.
+        func (callable): Called with the result of ``setup``; returns the
+            number of objects it produced.
+        setup (callable): Loads fixtures. Not timed.
+    """
+
+    def __init__(self, name, func, setup=None):
+        self.name = name
+        self.func = func
+        self.setup = setup
+
+    @property
+    def jurisdiction(self):
+        return self.name.split(".", 1)[0]
+
+    def run(self, repeat):
+        """Runs the case, returning a dict of measurements."""
+        fixture = self.setup() if self.setup else None
+
+        # one-time work such as SQLAlchemy mapper configuration is left out
+        # of both measurements, so throughput doesn't depend on ``repeat``
+        self.func(fixture)
+
+        tracemalloc.start()
+        try:
+            self.func(fixture)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # time without tracemalloc, which slows allocation-heavy code a lot
+        objects = 0
+        start = time.perf_counter()
+        for _ in range(repeat):
+            objects += self.func(fixture)
+        seconds = time.perf_counter() - start
+
+        return {
+            "repeat": repeat,
+            "objects": objects,
+            "seconds": seconds,
+            "per_sec": objects / seconds if seconds else 0.0,
+            "peak_kb": peak / 1024.0,
+        }
+
+
+def case(name, setup=None):
+    """Decorator registering a benchmark case."""
+
+    def decorator(func):
+        CASES[name] = Case(name, func, setup)
+        return func
+
+    return decorator
+
+
+def fixture_path(*parts):
+    return os.path.join(FIXTURES, *parts)
+
+
+def run(jurisdictions=None, repeat=20):
+    """Runs the registered cases.
+
+    Args:
+        jurisdictions (List[str]): Only run cases for these, defaults to all.
+        repeat (int): Timed calls per case.
+    Returns:
+        OrderedDict: Case name to measurements, or to ``{"skipped": reason}``.
+    """
+    # importing registers the cases
+    from . import cases  # noqa
+
+    results = OrderedDict()
+    for name, c in CASES.items():
+        if jurisdictions and c.jurisdiction not in jurisdictions:
+            continue
+        try:
+            results[name] = c.run(repeat)
+        except SkipCase as e:
+            results[name] = {"skipped": str(e)}
+    return results
+
+
+def load_baseline(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except IOError:
+        return {}
+
+
+def save_baseline(path, results):
+    baseline = load_baseline(path)
+    for name, result in results.items():
+        if "skipped" not in result:
+            baseline[name] = result
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+
+
+def compare(results, baseline, tolerance=0.25):
+    """Finds cases that got slower or hungrier than the baseline.
+
+    Args:
+        results (dict): Output of ``run``.
+        baseline (dict): Previously saved results.
+        tolerance (float): Allowed relative change before it counts.
+    Returns:
+        List[str]: A description of each regression.
+    Raises:
+        ValueError: A case was run with a different ``repeat`` than its
+            baseline, so the two aren't comparable.
+    """
+    regressions = []
+    for name, result in results.items():
+        old = baseline.get(name)
+        if not old or "skipped" in result:
+            continue
+        if old.get("repeat") != result["repeat"]:
+            raise ValueError(
+                "{}: baseline was run with --repeat {}, not {}".format(
+                    name, old.get("repeat"), result["repeat"]
+                )
+            )
+        if result["per_sec"] < old["per_sec"] * (1 - tolerance):
+            regressions.append(
+                "{}: {:.0f} objects/sec, was {:.0f}".format(
+                    name, result["per_sec"], old["per_sec"]
+                )
+            )
+        if result["peak_kb"] > old["peak_kb"] * (1 + tolerance):
+            regressions.append(
+                "{}: {:.0f} KiB peak, was {:.0f}".format(
+                    name, result["peak_kb"], old["peak_kb"]
+                )
+            )
+    return regressions
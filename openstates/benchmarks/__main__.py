@@ -0,0 +1,58 @@
+import os
+import sys
+import argparse
+
+from . import run, load_baseline, save_baseline, compare
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m openstates.benchmarks",
+        description="Time parsing code against recorded fixtures.",
+    )
+    parser.add_argument("jurisdictions", nargs="*", help="e.g. tx nm, default all")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="relative slowdown or memory growth that counts as a regression",
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="store these results as the baseline"
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.jurisdictions, repeat=args.repeat)
+
+    print("{:<32} {:>14} {:>10}".format("case", "objects/sec", "peak KiB"))
+    for name, result in results.items():
+        if "skipped" in result:
+            print("{:<32} skipped: {}".format(name, result["skipped"]))
+        else:
+            print(
+                "{:<32} {:>14.0f} {:>10.0f}".format(
+                    name, result["per_sec"], result["peak_kb"]
+                )
+            )
+
+    if args.save:
+        save_baseline(args.baseline, results)
+        print("saved baseline to {}".format(args.baseline))
+        return 0
+
+    try:
+        regressions = compare(results, load_baseline(args.baseline), args.tolerance)
+    except ValueError as e:
+        print("can't compare against {}: {}".format(args.baseline, e))
+        return 2
+    for regression in regressions:
+        print("REGRESSION " + regression)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
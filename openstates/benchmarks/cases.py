@@ -0,0 +1,137 @@
+"""
+    Benchmark cases, one or more per jurisdiction.
+
+    Fixtures are read in ``setup`` so only parsing is timed.  Functions that
+    mutate the tree they are given (``clean_journal``) re-parse it on each
+    call, which is what the scraper does for every page anyway.
+"""
+import os
+import shutil
+import tempfile
+
+import lxml.html
+from pupa.utils.generic import convert_pdf
+
+from openstates.transformers import fix_bill_id
+from openstates.ca.actions import CACategorizer
+from openstates.ca.bills import clean_title, get_digest
+from openstates.ca.models import CABillVersion
+from openstates.il.bills import find_columns_and_parse
+from openstates.nm import NewMexico
+from openstates.nm.votes import NMVoteScraper
+from openstates.tx.votes import clean_journal, record_votes
+from . import case, fixture_path, SkipCase
+
+
+def read_fixture(name, mode="r"):
+    encoding = None if "b" in mode else "utf-8"
+    with open(fixture_path(name), mode, encoding=encoding) as f:
+        return f.read()
+
+
+# shared ###################################################################
+
+
+def _bill_ids():
+    return read_fixture("bill_ids.txt").split()
+
+
+@case("all.fix_bill_id", setup=_bill_ids)
+def bench_fix_bill_id(bill_ids):
+    for bill_id in bill_ids:
+        fix_bill_id(bill_id)
+    return len(bill_ids)
+
+
+# ca #######################################################################
+
+
+def _ca_actions():
+    return CACategorizer(), read_fixture("ca_actions.txt").splitlines()
+
+
+@case("ca.categorize", setup=_ca_actions)
+def bench_ca_categorize(fixture):
+    categorizer, actions = fixture
+    for action in actions:
+        categorizer.categorize(action)
+    return len(actions)
+
+
+def _ca_version():
+    return read_fixture("ca_bill_version.xml")
+
+
+@case("ca.version_title_digest", setup=_ca_version)
+def bench_ca_version_title_digest(bill_xml):
+    # a fresh version each call, the parsed xml is cached on the instance
+    version = CABillVersion(bill_xml=bill_xml)
+    clean_title(version.title)
+    clean_title(version.short_title)
+    get_digest(version.xml)
+    return 1
+
+
+# il #######################################################################
+
+
+def _il_vote_lines():
+    blocks = read_fixture("il_vote_lines.txt").split("\n\n")
+    return [block.strip("\n").splitlines() for block in blocks]
+
+
+@case("il.find_columns_and_parse", setup=_il_vote_lines)
+def bench_il_find_columns_and_parse(blocks):
+    votes = 0
+    for lines in blocks:
+        votes += len(find_columns_and_parse(lines))
+    return votes
+
+
+# nm #######################################################################
+
+
+def _nm_vote_text():
+    if not shutil.which("pdftotext"):
+        raise SkipCase("pdftotext is not installed")
+
+    test_data = os.path.join(
+        os.path.dirname(os.path.dirname(__file__)), "nm", "tests", "testData"
+    )
+    texts = {}
+    for chamber in ("house", "senate"):
+        texts[chamber] = convert_pdf(
+            os.path.join(test_data, "2017_vote_{}.pdf".format(chamber)), type="xml"
+        )
+
+    scraper = NMVoteScraper(NewMexico(), tempfile.gettempdir())
+    return scraper, texts
+
+
+@case("nm.vote_grid", setup=_nm_vote_text)
+def bench_nm_vote_grid(fixture):
+    scraper, texts = fixture
+    house = scraper.parse_house_vote(texts["house"], "house.pdf", "2017", "HB 1")
+    senate = scraper.parse_senate_vote(texts["senate"], "senate.pdf", "2017", "SB 1")
+    return len(house.votes) + len(senate.votes)
+
+
+# tx #######################################################################
+
+
+def _tx_journal():
+    return read_fixture("tx_journal.html", "rb")
+
+
+@case("tx.clean_journal", setup=_tx_journal)
+def bench_tx_clean_journal(page):
+    root = lxml.html.fromstring(page)
+    clean_journal(root)
+    return 1
+
+
+@case("tx.record_votes", setup=_tx_journal)
+def bench_tx_record_votes(page):
+    root = lxml.html.fromstring(page)
+    clean_journal(root)
+    return sum(len(v.votes) for v in record_votes(root, "86R", "upper"))
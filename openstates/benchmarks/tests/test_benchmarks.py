@@ -0,0 +1,49 @@
+import unittest
+
+from openstates.benchmarks import CASES, Case, compare
+from openstates.benchmarks import cases  # noqa: F401, registers CASES
+
+
+class TestCase(unittest.TestCase):
+    def test_run(self):
+        c = Case("xx.count", lambda words: len(words), setup=lambda: ["a", "b"])
+        result = c.run(repeat=3)
+        self.assertEqual(c.jurisdiction, "xx")
+        self.assertEqual(result["objects"], 6)
+        self.assertEqual(result["repeat"], 3)
+        self.assertGreater(result["per_sec"], 0)
+        self.assertGreaterEqual(result["peak_kb"], 0)
+
+
+class TestCases(unittest.TestCase):
+    def test_tx_record_votes_parses_names(self):
+        # a fixture whose roll calls don't parse would time an empty loop
+        self.assertGreater(CASES["tx.record_votes"].run(repeat=1)["objects"], 0)
+
+
+class TestCompare(unittest.TestCase):
+    baseline = {"xx.count": {"repeat": 20, "per_sec": 1000.0, "peak_kb": 100.0}}
+
+    def test_within_tolerance(self):
+        results = {"xx.count": {"repeat": 20, "per_sec": 900.0, "peak_kb": 110.0}}
+        self.assertEqual(compare(results, self.baseline), [])
+
+    def test_regressions(self):
+        results = {"xx.count": {"repeat": 20, "per_sec": 500.0, "peak_kb": 200.0}}
+        self.assertEqual(len(compare(results, self.baseline)), 2)
+
+    def test_different_repeat(self):
+        results = {"xx.count": {"repeat": 3, "per_sec": 1000.0, "peak_kb": 100.0}}
+        with self.assertRaises(ValueError):
+            compare(results, self.baseline)
+
+    def test_skipped_and_new_cases(self):
+        results = {
+            "xx.count": {"skipped": "no pdftotext"},
+            "yy.new": {"repeat": 20, "per_sec": 1.0, "peak_kb": 1.0},
+        }
+        self.assertEqual(compare(results, self.baseline), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,14 +2,7 @@ import re
 
 from pupa.scrape import Jurisdiction, Organization
 
-from openstates.utils import url_xpath
-from .bills import CABillScraper
-
-# from .events import CAEventScraper
-from .people import CAPersonScraper
-
-# from .committees import CACommitteeScraper
-
+from openstates.utils import url_xpath, LazyScrapers
 
 settings = dict(SCRAPELIB_RPM=30)
 
@@ -19,12 +12,15 @@ class California(Jurisdiction):
     classification = "government"
     name = "California"
     url = "http://www.legislature.ca.gov/"
-    scrapers = {
-        "bills": CABillScraper,
-        # 'events': CAEventScraper,
-        "people": CAPersonScraper,
-        # 'committees': CACommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": "bills:CABillScraper",
+            # "events": "events:CAEventScraper",
+            "people": "people:CAPersonScraper",
+            # "committees": "committees:CACommitteeScraper",
+        },
+    )
     legislative_sessions = [
         {
             "classification": "primary",
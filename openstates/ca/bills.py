@@ -328,17 +328,7 @@ class CABillScraper(Scraper):
 
             # Get digest test (aka "summary") from latest version.
             if bill.versions:
-                version = bill.versions[-1]
-                nsmap = version.xml.nsmap
-                xpath = "//caml:DigestText/xhtml:p"
-                els = version.xml.xpath(xpath, namespaces=nsmap)
-                chunks = []
-                for el in els:
-                    t = etree_text_content(el)
-                    t = re.sub(r"\s+", " ", t)
-                    t = re.sub(r"\)(\S)", lambda m: ") %s" % m.group(1), t)
-                    chunks.append(t)
-                summary = "\n\n".join(chunks)
+                summary = get_digest(bill.versions[-1].xml)
 
             for version in bill.versions:
                 if not version.bill_xml:
@@ -645,3 +635,15 @@ class CABillScraper(Scraper):
 
 def etree_text_content(el):
     return html.fromstring(etree.tostring(el)).text_content()
+
+
+def get_digest(xml):
+    """ digest text (aka "summary") of a bill version's XML """
+    els = xml.xpath("//caml:DigestText/xhtml:p", namespaces=xml.nsmap)
+    chunks = []
+    for el in els:
+        t = etree_text_content(el)
+        t = re.sub(r"\s+", " ", t)
+        t = re.sub(r"\)(\S)", lambda m: ") %s" % m.group(1), t)
+        chunks.append(t)
+    return "\n\n".join(chunks)
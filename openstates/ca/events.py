@@ -39,29 +39,38 @@ class CAEventScraper(Scraper):
 
     def scrape(self, chamber=None):
         chambers = [chamber] if chamber is not None else ["upper", "lower"]
+        hearings_by_chamber = self.load_hearings()
         for chamber in chambers:
-            yield from self.scrape_chamber(chamber)
-
-    def scrape_chamber(self, chamber):
-        grouped_hearings = defaultdict(list)
-
+            yield from self.scrape_chamber(chamber, hearings_by_chamber[chamber])
+
+    def load_hearings(self):
+        """
+        Loads every committee hearing for both chambers using one query for
+        locations and one for hearings, grouped as
+        ``chamber -> (location, date) -> [hearings]``.
+        """
+        # location codes aren't unique across session years, so keep the
+        # first description for each code, like the old per-hearing lookup
+        locations = {}
+        for code, description in self.session.query(
+            CALocation.location_code, CALocation.description
+        ):
+            locations.setdefault(code, description)
+
+        hearings_by_chamber = defaultdict(lambda: defaultdict(list))
         for hearing in self.session.query(CACommitteeHearing):
-            location = (
-                self.session.query(CALocation)
-                .filter_by(location_code=hearing.location_code)[0]
-                .description
-            )
+            location = locations[hearing.location_code]
 
             date = self._tz.localize(hearing.hearing_date)
 
             chamber_abbr = location[0:3]
             event_chamber = {"Asm": "lower", "Sen": "upper"}[chamber_abbr]
 
-            if event_chamber != chamber:
-                continue
+            hearings_by_chamber[event_chamber][(location, date)].append(hearing)
 
-            grouped_hearings[(location, date)].append(hearing)
+        return hearings_by_chamber
 
+    def scrape_chamber(self, chamber, grouped_hearings):
         for ((location, date), hearings) in grouped_hearings.items():
 
             # Get list of bill_ids from the database.
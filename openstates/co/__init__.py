@@ -1,12 +1,7 @@
 import re
-from openstates.utils import url_xpath
+from openstates.utils import url_xpath, LazyScrapers
 
 from pupa.scrape import Jurisdiction, Organization
-from .people import COLegislatorScraper
-
-# from .committees import COCommitteeScraper
-from .bills import COBillScraper
-from .events import COEventScraper
 
 
 class Colorado(Jurisdiction):
@@ -14,12 +9,15 @@ class Colorado(Jurisdiction):
     classification = "government"
     name = "Colorado"
     url = "http://leg.colorado.gov/"
-    scrapers = {
-        "people": COLegislatorScraper,
-        # 'committees': COCommitteeScraper,
-        "bills": COBillScraper,
-        "events": COEventScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:COLegislatorScraper",
+            # "committees": "committees:COCommitteeScraper",
+            "bills": "bills:COBillScraper",
+            "events": "events:COEventScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2011 Regular Session",
@@ -2,9 +2,7 @@ import lxml.html
 import scrapelib
 from pupa.scrape import Jurisdiction, Organization
 
-from .people import CTPersonScraper
-from .bills import CTBillScraper
-from .events import CTEventScraper
+from openstates.utils import LazyScrapers
 
 settings = {"SCRAPELIB_RPM": 20}
 
@@ -16,11 +14,14 @@ class Connecticut(Jurisdiction):
     classification = "government"
     name = "Connecticut"
     url = "http://www.cga.ct.gov/"
-    scrapers = {
-        "people": CTPersonScraper,
-        "bills": CTBillScraper,
-        "events": CTEventScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:CTPersonScraper",
+            "bills": "bills:CTBillScraper",
+            "events": "events:CTEventScraper",
+        },
+    )
     legislative_sessions = [
         {"_scraped_name": "2011", "identifier": "2011", "name": "2011 Regular Session"},
         {"_scraped_name": "2012", "identifier": "2012", "name": "2012 Regular Session"},
@@ -4,10 +4,14 @@ from operator import itemgetter
 from collections import defaultdict
 
 from pupa.scrape import Scraper, Bill, VoteEvent as Vote
+from openstates.utils import ordered_map
 from .utils import parse_directory_listing, open_csv
 
 import lxml.html
 
+BILL_INFO_URL = "ftp://ftp.cga.ct.gov/pub/data/bill_info.csv"
+BILL_HISTORY_URL = "ftp://ftp.cga.ct.gov/pub/data/bill_history.csv"
+
 
 class SkipBill(Exception):
     pass
@@ -15,41 +19,65 @@ class SkipBill(Exception):
 
 class CTBillScraper(Scraper):
     latest_only = True
+    workers = 4
 
     def scrape(self, chamber=None, session=None):
         if session is None:
             session = self.latest_session()
             self.info("no session specified, using %s", session)
         chambers = [chamber] if chamber is not None else ["upper", "lower"]
-        self.bills = defaultdict(list)
         self._committee_names = {}
         self._introducers = defaultdict(set)
         self._subjects = defaultdict(list)
-        self.scrape_committee_names()
-        self.scrape_subjects()
+        self._history = defaultdict(list)
+        self._bill_info = None
+
+        # the FTP CSVs are independent, so download and index them at once
+        list(
+            ordered_map(
+                lambda load: load(),
+                [
+                    self.scrape_committee_names,
+                    self.scrape_subjects,
+                    self.scrape_bill_history,
+                    self.load_bill_info,
+                ],
+                workers=4,
+            )
+        )
         self.scrape_introducers("upper")
         self.scrape_introducers("lower")
         yield from self.scrape_bill_info(session, chambers)
         # for chamber in chambers:
         #     self.scrape_versions(chamber, session)
-        self.scrape_bill_history()
 
-        for bill in self.bills.values():
-            yield bill[0]
+    def load_bill_info(self):
+        self._bill_info = open_csv(self.get(BILL_INFO_URL))
 
     def scrape_bill_info(self, session, chambers):
-        info_url = "ftp://ftp.cga.ct.gov/pub/data/bill_info.csv"
-        data = self.get(info_url)
-        page = open_csv(data)
+        # status & vote pages are fetched on a pool; bills are finished and
+        # emitted here in bill_info.csv order
+        for bill, votes in ordered_map(
+            self.scrape_bill_pages,
+            self.build_bills(session, chambers),
+            workers=self.workers,
+        ):
+            yield from votes
+            self.add_bill_history(bill)
+            yield bill
 
+    def build_bills(self, session, chambers):
         chamber_map = {"H": "lower", "S": "upper"}
+        # bill_info.csv can list a bill more than once
+        seen = set()
 
-        for row in page:
+        for row in self._bill_info:
             bill_id = row["bill_num"]
             chamber = chamber_map[bill_id[0]]
 
-            if chamber not in chambers:
+            if chamber not in chambers or bill_id in seen:
                 continue
+            seen.add(bill_id)
 
             # assert that the bill data is from this session, CT is tricky
             assert row["sess_year"] == session
@@ -68,7 +96,7 @@ class CTBillScraper(Scraper):
                 classification=bill_type,
                 chamber=chamber,
             )
-            bill.add_source(info_url)
+            bill.add_source(BILL_INFO_URL)
 
             for introducer in self._introducers[bill_id]:
                 bill.add_sponsorship(
@@ -78,16 +106,18 @@ class CTBillScraper(Scraper):
                     entity_type="person",
                 )
 
-            try:
-                for subject in self._subjects[bill_id]:
-                    bill.subject.append(subject)
+            for subject in self._subjects[bill_id]:
+                bill.subject.append(subject)
 
-                self.bills[bill_id] = [bill, chamber]
+            yield bill
 
-                yield from self.scrape_bill_page(bill)
-            except SkipBill:
-                self.warning("no such bill: " + bill_id)
-                pass
+    def scrape_bill_pages(self, bill):
+        """ fetches a bill's status & vote pages, runs on a worker thread """
+        try:
+            return bill, list(self.scrape_bill_page(bill))
+        except SkipBill:
+            self.warning("no such bill: " + bill.identifier)
+            return bill, []
 
     def scrape_bill_page(self, bill):
         # Removes leading zeroes in the bill number.
@@ -210,23 +240,17 @@ class CTBillScraper(Scraper):
         yield vote
 
     def scrape_bill_history(self):
-        history_url = "ftp://ftp.cga.ct.gov/pub/data/bill_history.csv"
-        page = self.get(history_url)
+        page = self.get(BILL_HISTORY_URL)
         page = open_csv(page)
 
-        action_rows = defaultdict(list)
-
         for row in page:
-            bill_id = row["bill_num"]
-
-            if bill_id in self.bills:
-                action_rows[bill_id].append(row)
-
-        for (bill_id, actions) in action_rows.items():
-            bill = self.bills[bill_id][0]
+            self._history[row["bill_num"]].append(row)
 
+    def add_bill_history(self, bill):
+        actions = self._history.pop(bill.identifier, None)
+        if actions:
             actions.sort(key=itemgetter("act_date"))
-            act_chamber = self.bills[bill_id][1]
+            act_chamber = {"H": "lower", "S": "upper"}[bill.identifier[0]]
 
             for row in actions:
                 date = row["act_date"]
@@ -341,17 +365,28 @@ class CTBillScraper(Scraper):
         page = lxml.html.fromstring(page)
         page.make_links_absolute(url)
 
+        members = []
         for link in page.xpath("//a[contains(@href, 'MemberBills')]"):
             name = link.xpath("../../td[2]/a/text()")[0].encode("utf-8").strip()
             # we encode the URL here because there are weird characters that
             # cause problems
             url = link.attrib["href"].encode("utf-8")
-            self.scrape_introducer(name, url)
+            members.append((name, url))
+
+        for name, bill_ids in ordered_map(
+            lambda member: self.scrape_introducer(*member),
+            members,
+            workers=self.workers,
+        ):
+            for bill_id in bill_ids:
+                self._introducers[bill_id].add(name)
 
     def scrape_introducer(self, name, url):
         page = self.get(url, verify=False).text
         page = lxml.html.fromstring(page)
 
-        for link in page.xpath("//a[contains(@href, 'billstatus')]"):
-            bill_id = link.text.strip()
-            self._introducers[bill_id].add(name)
+        bill_ids = [
+            link.text.strip()
+            for link in page.xpath("//a[contains(@href, 'billstatus')]")
+        ]
+        return name, bill_ids
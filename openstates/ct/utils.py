@@ -1,14 +1,65 @@
+import io
 import re
+import codecs
 import datetime
+import threading
 import collections
 import chardet
 import csv
-from io import StringIO
+
+# enough of a file for chardet to make up its mind, without scanning
+# multi-megabyte files like bill_history.csv byte by byte
+ENCODING_SAMPLE_SIZE = 64 * 1024
+
+# url -> encoding, the FTP data files don't change encoding between fetches
+_encodings = {}
+_encodings_lock = threading.Lock()
+
+
+def _decode_as_cp1252(error):
+    # bytes past the sample that don't fit the detected encoding are
+    # almost always Windows-1252 punctuation
+    bad = error.object[error.start : error.end]
+    return bad.decode("cp1252", errors="replace"), error.end
+
+
+codecs.register_error("ct-cp1252", _decode_as_cp1252)
+
+
+def detect_encoding(content, url=None):
+    """Guesses the encoding of a data file from its first few KiB.
+
+    Args:
+        content (bytes): The file.
+        url (str): Where it came from, the answer is remembered per URL.
+    Returns:
+        str: A codec name.
+    """
+    if url in _encodings:
+        return _encodings[url]
+
+    sample = content[:ENCODING_SAMPLE_SIZE]
+    if sample.isascii():
+        encoding = "utf-8"
+    else:
+        encoding = chardet.detect(sample)["encoding"] or "utf-8"
+        if encoding == "ascii":
+            encoding = "utf-8"
+
+    if url:
+        with _encodings_lock:
+            _encodings[url] = encoding
+    return encoding
 
 
 def open_csv(data):
-    char_encoding = chardet.detect(data.content)["encoding"]
-    return csv.DictReader(StringIO(data.content.decode(char_encoding)))
+    """Returns a DictReader over a downloaded CSV, decoding as it's read."""
+    content = data.content
+    encoding = detect_encoding(content, data.url)
+    text = io.TextIOWrapper(
+        io.BytesIO(content), encoding=encoding, errors="ct-cp1252", newline=""
+    )
+    return csv.DictReader(text)
 
 
 Listing = collections.namedtuple("Listing", "mtime size filename")
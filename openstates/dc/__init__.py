@@ -1,11 +1,7 @@
 from pupa.scrape import Jurisdiction, Organization
 
-from .people import DCPersonScraper
+from openstates.utils import LazyScrapers
 
-# from .committees import DCCommitteeScraper
-from .bills import DCBillScraper
-
-# from .events import DCEventScraper
 from .utils import api_request
 
 
@@ -14,12 +10,15 @@ class DistrictOfColumbia(Jurisdiction):
     classification = "government"
     name = "District of Columbia"
     url = "https://dc.gov"
-    scrapers = {
-        "people": DCPersonScraper,
-        # 'committees': DCCommitteeScraper,
-        # 'events': DCEventScraper,
-        "bills": DCBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:DCPersonScraper",
+            # "committees": "committees:DCCommitteeScraper",
+            # "events": "events:DCEventScraper",
+            "bills": "bills:DCBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "19",
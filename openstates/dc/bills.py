@@ -1,15 +1,16 @@
 import datetime
-import json
 import pytz
 import re
 
 from pupa.scrape import Scraper, Bill, VoteEvent
 
-from .utils import api_request
+from openstates.utils import JSONStore, ordered_map
+from .utils import api_request, get_legislation, search_legislation, SEARCH_PAGE_SIZE
 
 
 class DCBillScraper(Scraper):
     _TZ = pytz.timezone("US/Eastern")
+    workers = 4
 
     _action_classifiers = (
         ("Introduced", "introduction"),
@@ -33,8 +34,6 @@ class DCBillScraper(Scraper):
 
         # get member id matching for vote parsing
         member_ids = self.get_member_ids()[session]
-        per_page = 10  # seems like it gives 10 no matter what.
-        start_record = 0
 
         params = {
             "request": {
@@ -42,7 +41,7 @@ class DCBillScraper(Scraper):
                 "iColumns": 4,
                 "sColumns": "",
                 "iDisplayStart": 0,
-                "iDisplayLength": per_page,
+                "iDisplayLength": SEARCH_PAGE_SIZE,
                 "mDataProp_0": "ShortTitle",
                 "mDataProp_1": "Title",
                 "mDataProp_2": "LegislationCategories",
@@ -74,277 +73,258 @@ class DCBillScraper(Scraper):
                 "IncludeDocumentSearch": "false",
             },
         }
-        param_json = json.dumps(params)
-        response = api_request("/GetPublicAdvancedSearch", data=param_json)
-        # the response is a terrible string-of-nested-json-strings. Yuck.
-        response = response["d"]
-        data = response["aaData"]
-
-        while len(data) > 0:
-            for bill in data:
-                # sometimes they're in there more than once, so we'll keep track
-                bill_id = bill["Title"]
-                if bill_id.startswith("AG"):
-                    # actually an agenda, skip
-                    continue
-                bill_params = {"legislationId": bill_id}
-                bill_info = api_request("/GetPublicData", data=json.dumps(bill_params))
-                bill_info = bill_info["d"]["data"]
-                bill_source_url = "http://lims.dccouncil.us/Legislation/" + bill_id
-
-                legislation_info = bill_info["Legislation"][0]
-                title = legislation_info["ShortTitle"]
-
-                if bill_id.startswith("R") or bill_id.startswith("CER"):
-                    bill_type = "resolution"
-                else:
-                    bill_type = "bill"
+        # search windows and each bill's GetPublicData payload are fetched
+        # concurrently; payloads are cached by the search row's Modified value
+        store = JSONStore("dc", session, "legislation")
+        rows = (
+            row
+            for row in search_legislation(params, workers=self.workers)
+            # actually an agenda, skip
+            if not row["Title"].startswith("AG")
+        )
+        for row, bill_info in ordered_map(
+            lambda row: (
+                row,
+                get_legislation(row["Title"], row.get("Modified"), store),
+            ),
+            rows,
+            workers=self.workers,
+        ):
+            bill_id = row["Title"]
+            bill_source_url = "http://lims.dccouncil.us/Legislation/" + bill_id
+
+            legislation_info = bill_info["Legislation"][0]
+            title = legislation_info["ShortTitle"]
+
+            if bill_id.startswith("R") or bill_id.startswith("CER"):
+                bill_type = "resolution"
+            else:
+                bill_type = "bill"
+
+            bill = Bill(
+                bill_id,
+                legislative_session=session,
+                title=title,
+                classification=bill_type,
+            )
+
+            # sponsors and cosponsors
+            if "Introducer" in legislation_info:
+                introducers = legislation_info["Introducer"]
+            else:
+                # sometimes there are introducers, sometimes not.
+                # Set Introducers to empty array to avoid downstream breakage,
+                # but log bills without introducers
+                self.logger.warning("No Introducer: {0}".format(bill.identifier))
+                introducers = []
+
+            try:
+                # sometimes there are cosponsors, sometimes not.
+                cosponsors = legislation_info["CoSponsor"]
+            except KeyError:
+                cosponsors = []
+
+            for i in introducers:
+                name = i["Name"]
+                # they messed up Phil Mendelson's name
+                if name == "Phil Pmendelson":
+                    name = "Phil Mendelson"
+                bill.add_sponsorship(
+                    name,
+                    classification="primary",
+                    entity_type="person",
+                    primary=True,
+                )
 
-                bill = Bill(
-                    bill_id,
-                    legislative_session=session,
-                    title=title,
-                    classification=bill_type,
+            for s in cosponsors:
+                name = s["Name"]
+                if name == "Phil Pmendelson":
+                    name = "Phil Mendelson"
+                bill.add_sponsorship(
+                    name=name,
+                    classification="cosponsor",
+                    entity_type="person",
+                    primary=False,
                 )
 
-                # sponsors and cosponsors
-                if "Introducer" in legislation_info:
-                    introducers = legislation_info["Introducer"]
-                else:
-                    # sometimes there are introducers, sometimes not.
-                    # Set Introducers to empty array to avoid downstream breakage,
-                    # but log bills without introducers
-                    self.logger.warning("No Introducer: {0}".format(bill.identifier))
-                    introducers = []
-
-                try:
-                    # sometimes there are cosponsors, sometimes not.
-                    cosponsors = legislation_info["CoSponsor"]
-                except KeyError:
-                    cosponsors = []
-
-                for i in introducers:
-                    name = i["Name"]
-                    # they messed up Phil Mendelson's name
-                    if name == "Phil Pmendelson":
-                        name = "Phil Mendelson"
-                    bill.add_sponsorship(
-                        name,
-                        classification="primary",
-                        entity_type="person",
-                        primary=True,
+            # if it's become law, add the law number as an alternate title
+            if "LawNumber" in legislation_info:
+                law_num = legislation_info["LawNumber"]
+                if law_num:
+                    bill.add_title(law_num)
+
+            # also sometimes it's got an act number
+            if "ActNumber" in legislation_info:
+                act_num = legislation_info["ActNumber"]
+                if act_num:
+                    bill.add_title(act_num)
+
+            # sometimes AdditionalInformation has a previous bill name
+            if "AdditionalInformation" in legislation_info:
+                add_info = legislation_info["AdditionalInformation"]
+                if "previously" in add_info.lower():
+                    prev_title = (
+                        add_info.lower()
+                        .replace("previously", "")
+                        .strip()
+                        .replace(" ", "")
+                    )
+                    bill.add_title(prev_title.upper())
+                elif add_info:
+                    bill.extras["additional_information"] = add_info
+
+            if "WithDrawnDate" in legislation_info:
+                withdrawn_date = self.date_format(legislation_info["WithDrawnDate"])
+                withdrawn_by = legislation_info["WithdrawnBy"][0]["Name"].strip()
+                if withdrawn_by == "the Mayor":
+
+                    bill.add_action(
+                        "withdrawn",
+                        withdrawn_date,
+                        chamber="executive",
+                        classification="withdrawal",
                     )
 
-                for s in cosponsors:
-                    name = s["Name"]
-                    if name == "Phil Pmendelson":
-                        name = "Phil Mendelson"
-                    bill.add_sponsorship(
-                        name=name,
-                        classification="cosponsor",
-                        entity_type="person",
-                        primary=False,
+                elif "committee" in withdrawn_by.lower():
+                    a = bill.add_action(
+                        "withdrawn", withdrawn_date, classification="withdrawal"
                     )
+                    a.add_related_entity(withdrawn_by, entity_type="organization")
+                else:
+                    a = bill.add_action(
+                        "withdrawn", withdrawn_date, classification="withdrawal"
+                    )
+                    a.add_related_entity(withdrawn_by, entity_type="person")
 
-                # if it's become law, add the law number as an alternate title
-                if "LawNumber" in legislation_info:
-                    law_num = legislation_info["LawNumber"]
-                    if law_num:
-                        bill.add_title(law_num)
-
-                # also sometimes it's got an act number
-                if "ActNumber" in legislation_info:
-                    act_num = legislation_info["ActNumber"]
-                    if act_num:
-                        bill.add_title(act_num)
-
-                # sometimes AdditionalInformation has a previous bill name
-                if "AdditionalInformation" in legislation_info:
-                    add_info = legislation_info["AdditionalInformation"]
-                    if "previously" in add_info.lower():
-                        prev_title = (
-                            add_info.lower()
-                            .replace("previously", "")
-                            .strip()
-                            .replace(" ", "")
-                        )
-                        bill.add_title(prev_title.upper())
-                    elif add_info:
-                        bill.extras["additional_information"] = add_info
+            for action in bill_info["LegislationBillHistory"]:
+                action_name = action["Description"]
+                action_date = datetime.datetime.strptime(
+                    action["ActionDate"], "%Y/%m/%d %H:%M:%S"
+                )
+                action_date = self._TZ.localize(action_date)
+                action_class = self.classify_action(action_name)
 
-                if "WithDrawnDate" in legislation_info:
-                    withdrawn_date = self.date_format(legislation_info["WithDrawnDate"])
-                    withdrawn_by = legislation_info["WithdrawnBy"][0]["Name"].strip()
-                    if withdrawn_by == "the Mayor":
+                if "mayor" in action_name.lower():
+                    actor = "executive"
+                else:
+                    actor = "legislature"
 
-                        bill.add_action(
-                            "withdrawn",
-                            withdrawn_date,
-                            chamber="executive",
-                            classification="withdrawal",
-                        )
+                a = bill.add_action(
+                    action_name,
+                    action_date,
+                    classification=action_class,
+                    chamber=actor,
+                )
 
-                    elif "committee" in withdrawn_by.lower():
-                        a = bill.add_action(
-                            "withdrawn", withdrawn_date, classification="withdrawal"
-                        )
-                        a.add_related_entity(withdrawn_by, entity_type="organization")
-                    else:
-                        a = bill.add_action(
-                            "withdrawn", withdrawn_date, classification="withdrawal"
-                        )
-                        a.add_related_entity(withdrawn_by, entity_type="person")
+                if action_class is not None and "referral-committee" in action_class:
+                    if "CommitteeReferral" in legislation_info:
+                        committees = []
+                        for committee in legislation_info["CommitteeReferral"]:
+                            if committee["Name"].lower() == "retained by the council":
+                                committees = []
+                                break
+                            else:
+                                committees.append(committee["Name"])
+                        if committees != []:
+                            for com in committees:
+                                a.add_related_entity(com, entity_type="organization")
+                    if "CommitteeReferralComments" in legislation_info:
+                        for committee in legislation_info["CommitteeReferralComments"]:
+                            a.add_related_entity(
+                                committee["Name"], entity_type="organization"
+                            )
 
-                for action in bill_info["LegislationBillHistory"]:
-                    action_name = action["Description"]
-                    action_date = datetime.datetime.strptime(
-                        action["ActionDate"], "%Y/%m/%d %H:%M:%S"
-                    )
-                    action_date = self._TZ.localize(action_date)
-                    action_class = self.classify_action(action_name)
+            # deal with actions involving the mayor
+            mayor = bill_info["MayorReview"]
+            if mayor != []:
+                mayor = mayor[0]
 
-                    if "mayor" in action_name.lower():
-                        actor = "executive"
-                    else:
-                        actor = "legislature"
+                if "TransmittedDate" in mayor:
+                    transmitted_date = self.date_format(mayor["TransmittedDate"])
 
-                    a = bill.add_action(
-                        action_name,
-                        action_date,
-                        classification=action_class,
-                        chamber=actor,
+                # if returned but not signed, it was vetoed
+                elif "ReturnedDate" in mayor:
+                    veto_date = self.date_format(mayor["ReturnedDate"])
+
+                    bill.add_action(
+                        "vetoed",
+                        veto_date,
+                        chamber="executive",
+                        classification="executive-veto",
                     )
 
-                    if (
-                        action_class is not None
-                        and "referral-committee" in action_class
-                    ):
-                        if "CommitteeReferral" in legislation_info:
-                            committees = []
-                            for committee in legislation_info["CommitteeReferral"]:
-                                if (
-                                    committee["Name"].lower()
-                                    == "retained by the council"
-                                ):
-                                    committees = []
-                                    break
-                                else:
-                                    committees.append(committee["Name"])
-                            if committees != []:
-                                for com in committees:
-                                    a.add_related_entity(
-                                        com, entity_type="organization"
-                                    )
-                        if "CommitteeReferralComments" in legislation_info:
-                            for committee in legislation_info[
-                                "CommitteeReferralComments"
-                            ]:
-                                a.add_related_entity(
-                                    committee["Name"], entity_type="organization"
-                                )
-
-                # deal with actions involving the mayor
-                mayor = bill_info["MayorReview"]
-                if mayor != []:
-                    mayor = mayor[0]
-
-                    if "TransmittedDate" in mayor:
-                        transmitted_date = self.date_format(mayor["TransmittedDate"])
-
-                    # if returned but not signed, it was vetoed
-                    elif "ReturnedDate" in mayor:
-                        veto_date = self.date_format(mayor["ReturnedDate"])
+                    # if it was returned and enacted but not signed, there was a veto override
+                    if "EnactedDate" in mayor:
+                        override_date = self.date_format(mayor["EnactedDate"])
 
                         bill.add_action(
-                            "vetoed",
-                            veto_date,
-                            chamber="executive",
-                            classification="executive-veto",
+                            "veto override",
+                            override_date,
+                            classification="veto-override-passage",
                         )
 
-                        # if it was returned and enacted but not signed, there was a veto override
-                        if "EnactedDate" in mayor:
-                            override_date = self.date_format(mayor["EnactedDate"])
+                if "AttachmentPath" in mayor:
+                    # documents relating to the mayor's review
+                    self.add_documents(mayor["AttachmentPath"], bill)
 
-                            bill.add_action(
-                                "veto override",
-                                override_date,
-                                classification="veto-override-passage",
-                            )
+            congress = bill_info["CongressReview"]
+            if len(congress) > 0:
+                congress = congress[0]
+                if "TransmittedDate" in congress:
+                    transmitted_date = self.date_format(congress["TransmittedDate"])
 
-                    if "AttachmentPath" in mayor:
-                        # documents relating to the mayor's review
-                        self.add_documents(mayor["AttachmentPath"], bill)
-
-                congress = bill_info["CongressReview"]
-                if len(congress) > 0:
-                    congress = congress[0]
-                    if "TransmittedDate" in congress:
-                        transmitted_date = self.date_format(congress["TransmittedDate"])
+                    bill.add_action(
+                        "Transmitted to Congress for review", transmitted_date
+                    )
 
-                        bill.add_action(
-                            "Transmitted to Congress for review", transmitted_date
-                        )
+            # deal with committee actions
+            if "DateRead" in legislation_info:
+                date = legislation_info["DateRead"]
+            elif "IntroductionDate" in legislation_info:
+                date = legislation_info["IntroductionDate"]
+            else:
+                self.logger.warning(
+                    "we can't find anything that looks like an action date. Skipping"
+                )
+                continue
+            date = self.date_format(date)
 
-                # deal with committee actions
-                if "DateRead" in legislation_info:
-                    date = legislation_info["DateRead"]
-                elif "IntroductionDate" in legislation_info:
-                    date = legislation_info["IntroductionDate"]
+            # deal with random docs floating around
+            docs = bill_info["OtherDocuments"]
+            for d in docs:
+                if "AttachmentPath" in d:
+                    self.add_documents(d["AttachmentPath"], bill)
                 else:
-                    self.logger.warning(
-                        "we can't find anything that looks like an "
-                        "action date. Skipping"
-                    )
-                    continue
-                date = self.date_format(date)
-
-                # deal with random docs floating around
-                docs = bill_info["OtherDocuments"]
-                for d in docs:
-                    if "AttachmentPath" in d:
-                        self.add_documents(d["AttachmentPath"], bill)
-                    else:
-                        self.logger.warning(
-                            "Document path missing from 'Other Documents'"
-                        )
-
-                if "MemoLink" in legislation_info:
-                    self.add_documents(legislation_info["MemoLink"], bill)
-
-                if "AttachmentPath" in legislation_info:
-                    self.add_documents(legislation_info["AttachmentPath"], bill)
-
-                # full council votes
-                votes = bill_info["VotingSummary"]
-                for vote in votes:
-                    v = self.process_vote(vote, bill, member_ids)
-                    if v:
-                        v.add_source(bill_source_url)
-                        yield v
-
-                # deal with committee votes
-                if "CommitteeMarkup" in bill_info:
-                    committee_info = bill_info["CommitteeMarkup"]
-                    if len(committee_info) > 0:
-                        for committee_action in committee_info:
-                            v = self.process_committee_vote(committee_action, bill)
-                            if v:
-                                v.add_source(bill_source_url)
-                                yield v
-                        if "AttachmentPath" in committee_info:
-                            self.add_documents(vote["AttachmentPath"], bill)
-
-                bill.add_source(bill_source_url)
-                yield bill
-
-            # get next page
-            start_record += per_page
-            params["request"]["iDisplayStart"] = start_record
-            param_json = json.dumps(params)
-            response = api_request("/GetPublicAdvancedSearch", data=param_json)
-            response = response["d"]
-            data = response["aaData"]
+                    self.logger.warning("Document path missing from 'Other Documents'")
+
+            if "MemoLink" in legislation_info:
+                self.add_documents(legislation_info["MemoLink"], bill)
+
+            if "AttachmentPath" in legislation_info:
+                self.add_documents(legislation_info["AttachmentPath"], bill)
+
+            # full council votes
+            votes = bill_info["VotingSummary"]
+            for vote in votes:
+                v = self.process_vote(vote, bill, member_ids)
+                if v:
+                    v.add_source(bill_source_url)
+                    yield v
+
+            # deal with committee votes
+            if "CommitteeMarkup" in bill_info:
+                committee_info = bill_info["CommitteeMarkup"]
+                if len(committee_info) > 0:
+                    for committee_action in committee_info:
+                        v = self.process_committee_vote(committee_action, bill)
+                        if v:
+                            v.add_source(bill_source_url)
+                            yield v
+                    if "AttachmentPath" in committee_info:
+                        self.add_documents(vote["AttachmentPath"], bill)
+
+            bill.add_source(bill_source_url)
+            yield bill
 
     def get_member_ids(self):
         # three levels: from session to member_id to name
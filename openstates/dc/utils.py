@@ -1,15 +1,24 @@
+import copy
 import json
 import requests
+from pupa import settings
 
+from openstates.utils import ordered_map, RateLimiter
+from openstates.utils.concurrency import DEFAULT_WORKERS
 
 API_BASE_URL = "http://lims.dccouncil.us/_layouts/15/uploader/AdminProxy.aspx"
 API_HEADERS = {"Content-Type": "application/json", "User-Agent": "openstates"}
 
+# plain requests calls skip scrapelib's throttle; keep the search workers
+# to the rate a scraper would be held to
+api_rate = RateLimiter(settings.SCRAPELIB_RPM)
+
 
 def api_request(path, **kwargs):
     url = "{}{}".format(API_BASE_URL, path)
     headers = dict(API_HEADERS)
     headers.update(kwargs.pop("headers", {}))
+    api_rate.wait()
     response = requests.post(url, headers=headers, **kwargs)
     response.raise_for_status()
     return decode_json(response.json())
@@ -27,3 +36,65 @@ def decode_json(stringy_json):
         if len(stringy_json) > 0 and stringy_json[0] in ["[", "{"]:
             return decode_json(json.loads(stringy_json))
     return stringy_json
+
+
+# the search endpoint returns 10 rows no matter what iDisplayLength says
+SEARCH_PAGE_SIZE = 10
+
+
+def search_page(params, start):
+    """ returns one GetPublicAdvancedSearch window, starting at ``start`` """
+    params = copy.deepcopy(params)
+    params["request"]["iDisplayStart"] = start
+    params["request"]["iDisplayLength"] = SEARCH_PAGE_SIZE
+    return api_request("/GetPublicAdvancedSearch", data=json.dumps(params))["d"]
+
+
+def search_legislation(params, workers=DEFAULT_WORKERS):
+    """
+    Yields every GetPublicAdvancedSearch row for ``params``, in order.
+
+    The first window tells us the total record count, so the remaining
+    windows are requested concurrently by offset. If the count is missing,
+    windows are walked one at a time until an empty one comes back.
+    """
+    first = search_page(params, 0)
+    yield from first["aaData"]
+
+    total = first.get("iTotalDisplayRecords", first.get("iTotalRecords"))
+    if total is not None:
+        offsets = range(SEARCH_PAGE_SIZE, int(total), SEARCH_PAGE_SIZE)
+        for page in ordered_map(
+            lambda start: search_page(params, start), offsets, workers=workers
+        ):
+            yield from page["aaData"]
+    elif first["aaData"]:
+        start = SEARCH_PAGE_SIZE
+        while True:
+            data = search_page(params, start)["aaData"]
+            if not data:
+                break
+            yield from data
+            start += SEARCH_PAGE_SIZE
+
+
+def get_legislation(legislation_id, modified=None, store=None):
+    """
+    Returns the GetPublicData payload for a piece of legislation.
+
+    If a ``store`` is given, payloads are cached in it along with the
+    search row's ``Modified`` value, and only refetched when that changes.
+    """
+    if store is not None and modified:
+        cached = store.get(legislation_id)
+        if cached and cached["modified"] == modified:
+            return cached["data"]
+
+    data = api_request(
+        "/GetPublicData", data=json.dumps({"legislationId": legislation_id})
+    )
+    data = data["d"]["data"]
+
+    if store is not None and modified:
+        store.set(legislation_id, {"modified": modified, "data": data})
+    return data
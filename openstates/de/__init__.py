@@ -1,10 +1,4 @@
-from .people import DEPersonScraper
-from .bills import DEBillScraper
-
-# from .events import DEEventScraper
-# from .committees import DECommitteeScraper
-
-from openstates.utils import url_xpath
+from openstates.utils import url_xpath, LazyScrapers
 
 from pupa.scrape import Jurisdiction, Organization
 
@@ -14,12 +8,15 @@ class Delaware(Jurisdiction):
     classification = "government"
     name = "Delaware"
     url = "http://legis.delaware.gov/"
-    scrapers = {
-        "people": DEPersonScraper,
-        "bills": DEBillScraper,
-        # 'events': DEEventScraper,
-        # 'committees': DECommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:DEPersonScraper",
+            "bills": "bills:DEBillScraper",
+            # "events": "events:DEEventScraper",
+            # "committees": "committees:DECommitteeScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "1998 - 2000 (GA 140)",
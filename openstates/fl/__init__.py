@@ -1,12 +1,8 @@
 # encoding=utf-8
 import logging
 from pupa.scrape import Jurisdiction, Organization
-from .bills import FlBillScraper
-from .people import FlPersonScraper
 
-# from .committees import FlCommitteeScraper
-# from .events import FlEventScraper
-from openstates.utils import url_xpath
+from openstates.utils import url_xpath, LazyScrapers
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
@@ -17,12 +13,15 @@ class Florida(Jurisdiction):
     name = "Florida"
     url = "http://myflorida.com"
 
-    scrapers = {
-        "bills": FlBillScraper,
-        "people": FlPersonScraper,
-        # "committees": FlCommitteeScraper,
-        # "events": FlEventScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": "bills:FlBillScraper",
+            "people": "people:FlPersonScraper",
+            # "committees": "committees:FlCommitteeScraper",
+            # "events": "events:FlEventScraper",
+        },
+    )
     legislative_sessions = [
         {
             "name": "2011 Regular Session",
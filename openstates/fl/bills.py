@@ -1,10 +1,73 @@
 import re
+import json
+import hashlib
 import datetime
 from urllib.parse import urlencode
 from collections import defaultdict
+import requests
 from pupa.scrape import Scraper, Bill, VoteEvent
 from pupa.utils import format_datetime
 from spatula import Page, PDF, Spatula
+from openstates.utils import (
+    XPathFields,
+    JSONStore,
+    ordered_map,
+    parse_response,
+    absolute,
+)
+
+HOUSE_BILLS_URL = "http://www.myfloridahouse.gov/Sections/Bills/bills.aspx"
+
+# the House site's own ids for sessions
+HOUSE_SESSION_IDS = {
+    "2020": "89",
+    "2019": "87",
+    "2018": "86",
+    "2017A": "85",
+    "2017": "83",
+    "2016": "80",
+    "2015C": "82",
+    "2015B": "81",
+    "2015A": "79",
+    "2015": "76",
+    "2014O": "78",
+    "2014A": "77",
+    "2016O": "84",
+}
+
+
+def house_bill_key(text):
+    """Normalizes a bill number, e.g. ``CS/HB 0004`` to ``HB 4``."""
+    match = re.search(r"\b([HS][A-Z]*)\s+0*(\d+\w*)\b", text)
+    return "{} {}".format(*match.groups()) if match else None
+
+
+def cached_response(url, html):
+    """Wraps a page kept from an earlier fetch as a ``requests`` response."""
+    response = requests.Response()
+    response._content = html.encode("utf-8")
+    response.encoding = "utf-8"
+    response.status_code = 200
+    response.url = url
+    return response
+
+
+def house_vote_links(page):
+    """Reads the "See Votes" links off a House bill page.
+
+    Returns:
+        (list, str): The vote pages' URLs, and a fingerprint of the links and
+        the rows they sit in, which carry the vote counts.  The rest of the
+        page, its ASP.NET viewstate and timestamps, changes on every request
+        and is left out.
+    """
+    links = page.xpath('//a[text()="See Votes"]')
+    rows = sorted(
+        [link.get("href"), " ".join(link.xpath("string(ancestor::tr[1])").split())]
+        for link in links
+    )
+    fingerprint = hashlib.sha1(json.dumps(rows).encode("utf-8")).hexdigest()
+    return [absolute(link) for link in links], fingerprint
 
 
 class StartPage(Page):
@@ -90,7 +153,7 @@ class BillDetail(Page):
             self.process_analysis()
             self.process_amendments()
             yield from self.process_votes()
-            yield from self.scrape_page_items(HousePage, bill=self.obj)
+            yield from self.scraper.scrape_house_votes(self.obj)
 
     def process_versions(self):
         try:
@@ -451,9 +514,12 @@ class HousePage(Page):
 
     This will fetch all the House committee votes for the
     given bill, and add the votes to that object.
+
+    Only needed for bills missing from the session's House index, see
+    ``FlBillScraper.scrape_house_votes``.
     """
 
-    url = "http://www.myfloridahouse.gov/Sections/Bills/bills.aspx"
+    url = HOUSE_BILLS_URL
     list_xpath = '//a[contains(@href, "/Bills/billsdetail.aspx?BillId=")]/@href'
 
     def do_request(self):
@@ -461,21 +527,7 @@ class HousePage(Page):
         bill_number = re.search(
             r"^\w+\s(\d+\w*)$", self.kwargs["bill"].identifier
         ).group(1)
-        session_number = {
-            "2020": "89",
-            "2019": "87",
-            "2018": "86",
-            "2017A": "85",
-            "2017": "83",
-            "2016": "80",
-            "2015C": "82",
-            "2015B": "81",
-            "2015A": "79",
-            "2015": "76",
-            "2014O": "78",
-            "2014A": "77",
-            "2016O": "84",
-        }[self.kwargs["bill"].legislative_session]
+        session_number = HOUSE_SESSION_IDS[self.kwargs["bill"].legislative_session]
 
         form = {"Chamber": "B", "SessionId": session_number, "BillNumber": bill_number}
         return self.scraper.get(self.url + "?" + urlencode(form))
@@ -492,21 +544,40 @@ class HouseBillPage(Page):
 
 
 class HouseComVote(Page):
+    """A House committee roll call.
+
+    Pass ``response`` to parse a page that has already been fetched.
+    """
+
+    fields = XPathFields(
+        date='//span[contains(@id, "lblDate")]/text()',
+        yeas='//span[contains(@id, "lblYeas")]/text()',
+        nays='//span[contains(@id, "lblNays")]/text()',
+        missed='//span[contains(@id, "lblMissed")]/text()',
+        committee='//span[contains(@id, "lblCommittee")]/text()',
+        action='//span[contains(@id, "lblAction")]/text()',
+        members='//ul[contains(@class, "vote-list")]/li',
+    )
+
+    def do_request(self):
+        if "response" in self.kwargs:
+            return self.kwargs["response"]
+        return super().do_request()
+
     def handle_page(self):
-        (date,) = self.doc.xpath('//span[contains(@id, "lblDate")]/text()')
+        fields = self.fields.extract(self.doc)
+        (date,) = fields["date"]
         date = format_datetime(
             datetime.datetime.strptime(date, "%m/%d/%Y %I:%M:%S %p"), "US/Eastern"
         )
 
-        yes_count = int(self.doc.xpath('//span[contains(@id, "lblYeas")]/text()')[0])
-        no_count = int(self.doc.xpath('//span[contains(@id, "lblNays")]/text()')[0])
-        other_count = int(
-            self.doc.xpath('//span[contains(@id, "lblMissed")]/text()')[0]
-        )
+        yes_count = int(fields["yeas"][0])
+        no_count = int(fields["nays"][0])
+        other_count = int(fields["missed"][0])
         result = "pass" if yes_count > no_count else "fail"
 
-        (committee,) = self.doc.xpath('//span[contains(@id, "lblCommittee")]/text()')
-        (action,) = self.doc.xpath('//span[contains(@id, "lblAction")]/text()')
+        (committee,) = fields["committee"]
+        (action,) = fields["action"]
         motion = "{} ({})".format(action, committee)
 
         vote = VoteEvent(
@@ -522,7 +593,7 @@ class HouseComVote(Page):
         vote.set_count("no", no_count)
         vote.set_count("not voting", other_count)
 
-        for member_vote in self.doc.xpath('//ul[contains(@class, "vote-list")]/li'):
+        for member_vote in fields["members"]:
             if not member_vote.text_content().strip():
                 continue
 
@@ -576,6 +647,8 @@ class SubjectPDF(PDF):
 
 
 class FlBillScraper(Scraper, Spatula):
+    workers = 4
+
     def scrape(self, session=None):
         # FL published a bad bill in 2019, #143
         self.raise_errors = False
@@ -591,7 +664,77 @@ class FlBillScraper(Scraper, Spatula):
         )
         subjects = self.scrape_page(SubjectPDF, subject_url)
 
+        self.house_index = self.build_house_index(session)
+        self.house_vote_cache = JSONStore("fl", session, "house-votes")
+
         url = "http://flsenate.gov/Session/Bills/{}?chamber=both".format(session)
         yield from self.scrape_page_items(
             StartPage, url, session=session, subjects=subjects
         )
+
+    def build_house_index(self, session):
+        """
+        Maps bill numbers to their page on the House site, which is where
+        House committee votes are.  The session's listing is crawled once,
+        rather than searching for each bill, and kept between runs.
+        """
+        store = JSONStore("fl", "house-index")
+        index = store.get(session, {})
+
+        form = {"Chamber": "B", "SessionId": HOUSE_SESSION_IDS[session]}
+        page = parse_response(self.get(HOUSE_BILLS_URL + "?" + urlencode(form)))
+        for link in page.xpath(
+            '//a[contains(@href, "/Bills/billsdetail.aspx?BillId=")]'
+        ):
+            key = house_bill_key(link.text_content())
+            if key:
+                index[key] = absolute(link)
+
+        store.set(session, index)
+        return index
+
+    def scrape_house_votes(self, bill):
+        """
+        Yields the House committee votes on a bill.
+
+        Vote pages are fetched concurrently, and only when the bill's votes
+        listed on its House page have changed since they were last fetched
+        (see ``house_vote_links``); otherwise they are parsed from the copies
+        kept from that run.
+        """
+        key = house_bill_key(bill.identifier)
+        url = self.house_index.get(key)
+        if url is None:
+            yield from self.scrape_page_items(HousePage, bill=bill)
+            return
+
+        vote_urls, fingerprint = house_vote_links(parse_response(self.get(url)))
+        cached = self.house_vote_cache.get(key)
+        if cached and cached["fingerprint"] == fingerprint:
+            pages = cached["pages"]
+        else:
+            pages = []
+            responses = ordered_map(self.get, vote_urls, workers=self.workers)
+            for vote_url, response in zip(vote_urls, responses):
+                # raise_errors is off, so error pages come back as responses
+                if response.ok:
+                    pages.append((vote_url, response.text))
+                else:
+                    self.warning(
+                        "skipping House vote page %s: HTTP %s",
+                        vote_url,
+                        response.status_code,
+                    )
+            # cached only when complete, so the next run retries failures
+            if len(pages) == len(vote_urls):
+                self.house_vote_cache.set(
+                    key, {"fingerprint": fingerprint, "pages": pages}
+                )
+
+        for vote_url, html in pages:
+            yield from self.scrape_page_items(
+                HouseComVote,
+                vote_url,
+                bill=bill,
+                response=cached_response(vote_url, html),
+            )
@@ -0,0 +1,88 @@
+import tempfile
+import unittest
+from unittest import mock
+
+from pupa.scrape import Bill
+
+from openstates.fl.bills import FlBillScraper, cached_response
+from openstates.utils import JSONStore
+
+BILL_URL = "http://www.myfloridahouse.gov/Sections/Bills/billsdetail.aspx?BillId=1"
+
+BILL_PAGE = """
+<form>
+  <input type="hidden" name="__VIEWSTATE" value="{viewstate}">
+  <span>Page generated {viewstate}</span>
+  <table>
+    <tr>
+      <td>Judiciary Committee</td>
+      <td>Yeas {yeas} Nays 0</td>
+      <td><a href="/Sections/Committees/votes.aspx?VoteId=7">See Votes</a></td>
+    </tr>
+  </table>
+</form>
+"""
+
+
+class TestHouseVotes(unittest.TestCase):
+    def setUp(self):
+        cache = tempfile.TemporaryDirectory()
+        patcher = mock.patch("pupa.settings.CACHE_DIR", cache.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(cache.cleanup)
+
+        self.scraper = FlBillScraper.__new__(FlBillScraper)
+        self.scraper.workers = 1
+        self.scraper.house_index = {"HB 1": BILL_URL}
+        self.scraper.house_vote_cache = JSONStore("fl", "2020", "house-votes")
+        self.scraper.get = self.get
+        self.scraper.warning = lambda *args: None
+        self.scraper.scrape_page_items = lambda page, url, **kwargs: iter([url])
+        self.bill = Bill("HB 1", "2020", "A bill")
+        self.fetched = []
+        self.vote_status = 200
+
+    def get(self, url):
+        self.fetched.append(url)
+        if url == BILL_URL:
+            html = BILL_PAGE.format(viewstate=self.viewstate, yeas=self.yeas)
+            return cached_response(url, html)
+        response = cached_response(url, "<p>roll call</p>")
+        response.status_code = self.vote_status
+        return response
+
+    def scrape(self, viewstate, yeas=12):
+        self.viewstate, self.yeas = viewstate, yeas
+        self.fetched = []
+        return list(self.scraper.scrape_house_votes(self.bill))
+
+    def test_cached_across_viewstates(self):
+        vote_url = (
+            "http://www.myfloridahouse.gov/Sections/Committees/votes.aspx?VoteId=7"
+        )
+        self.assertEqual(self.scrape("AAAA"), [vote_url])
+        self.assertEqual(self.fetched, [BILL_URL, vote_url])
+
+        # same votes, new viewstate: the vote page comes from the cache
+        self.assertEqual(self.scrape("BBBB"), [vote_url])
+        self.assertEqual(self.fetched, [BILL_URL])
+
+        # the counts changed: fetched again
+        self.scrape("CCCC", yeas=11)
+        self.assertEqual(self.fetched, [BILL_URL, vote_url])
+
+    def test_failed_vote_page_not_cached(self):
+        self.vote_status = 500
+        self.assertEqual(self.scrape("AAAA"), [])
+
+        # retried on the next run even though the votes listed are the same
+        self.vote_status = 200
+        self.assertEqual(len(self.scrape("AAAA")), 1)
+        self.assertEqual(len(self.fetched), 2)
+        self.scrape("AAAA")
+        self.assertEqual(self.fetched, [BILL_URL])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,6 @@
 from pupa.scrape import Jurisdiction, Organization
 
-from .util import get_client, backoff
-from .bills import GABillScraper
-from .people import GAPersonScraper
-
-# from .committees import GACommitteeScraper
+from openstates.utils import LazyScrapers
 
 
 class Georgia(Jurisdiction):
@@ -12,11 +8,14 @@ class Georgia(Jurisdiction):
     classification = "government"
     name = "Georgia"
     url = "http://www.legis.ga.gov/"
-    scrapers = {
-        "bills": GABillScraper,
-        "people": GAPersonScraper,
-        # 'committee': GACommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": "bills:GABillScraper",
+            "people": "people:GAPersonScraper",
+            # "committee": "committees:GACommitteeScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2011-2012 Regular Session",
@@ -86,6 +85,9 @@ class Georgia(Jurisdiction):
         yield lower
 
     def get_session_list(self):
+        # suds is only needed once a GA scrape actually starts
+        from .util import get_client, backoff
+
         sessions = get_client("Session").service
 
         # sessions = [x for x in backoff(sessions.GetSessions)['Session']]
@@ -1,11 +1,7 @@
 from pupa.scrape import Jurisdiction, Organization
-from openstates.utils.lxmlize import url_xpath
-from .people import HIPersonScraper
-
-from .events import HIEventScraper
-from .bills import HIBillScraper
 
-# from .committees import HICommitteeScraper
+from openstates.utils import LazyScrapers
+from openstates.utils.lxmlize import url_xpath
 
 settings = dict(SCRAPELIB_TIMEOUT=300)
 
@@ -16,12 +12,15 @@ class Hawaii(Jurisdiction):
     classification = "government"
     name = "Hawaii"
     url = "http://capitol.hawaii.gov"
-    scrapers = {
-        "people": HIPersonScraper,
-        "bills": HIBillScraper,
-        # 'committees': HICommitteeScraper,
-        "events": HIEventScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:HIPersonScraper",
+            "bills": "bills:HIBillScraper",
+            # "committees": "committees:HICommitteeScraper",
+            "events": "events:HIEventScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2012",
@@ -1,11 +1,7 @@
 import re
 from pupa.scrape import Jurisdiction, Organization
 
-from openstates.utils import url_xpath
-from .people import IAPersonScraper
-from .bills import IABillScraper
-from .votes import IAVoteScraper
-from .events import IAEventScraper
+from openstates.utils import url_xpath, LazyScrapers
 
 
 class Iowa(Jurisdiction):
@@ -13,12 +9,15 @@ class Iowa(Jurisdiction):
     classification = "government"
     name = "Iowa"
     url = "https://www.legis.iowa.gov/"
-    scrapers = {
-        "people": IAPersonScraper,
-        "bills": IABillScraper,
-        "votes": IAVoteScraper,
-        "events": IAEventScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:IAPersonScraper",
+            "bills": "bills:IABillScraper",
+            "votes": "votes:IAVoteScraper",
+            "events": "events:IAEventScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "General Assembly: 84",
@@ -2,6 +2,7 @@ import re
 import datetime
 import lxml.html
 import requests
+from openstates.utils import parse_response
 from pupa.scrape import Scraper, Bill
 
 
@@ -23,7 +24,7 @@ class IABillScraper(Scraper):
 
         session_id = self.get_session_id(session)
         url = base_url % (session_id, bill_offset)
-        page = lxml.html.fromstring(self.get(url).text)
+        page = parse_response(self.get(url))
 
         if chamber == "upper":
             bname = "senateBills"
@@ -61,7 +62,7 @@ class IABillScraper(Scraper):
             bill.add_subject(subject.strip())
 
     def scrape_bill(self, chamber, session, session_id, bill_id, url):
-        sidebar = lxml.html.fromstring(self.get(url).text)
+        sidebar = parse_response(self.get(url))
         sidebar.make_links_absolute("https://www.legis.iowa.gov")
 
         hist_url = (
@@ -74,7 +75,7 @@ class IABillScraper(Scraper):
             self.warning("500 error on {}, skipping".format(hist_url))
             return
 
-        page = lxml.html.fromstring(req.text)
+        page = parse_response(req)
         page.make_links_absolute("https://www.legis.iowa.gov")
 
         title = page.xpath(
@@ -1,8 +1,7 @@
 from pupa.scrape import Jurisdiction, Organization
-from .people import IDPersonScraper
 
-# from .committees import IDCommitteeScraper
-from .bills import IDBillScraper
+from openstates.utils import LazyScrapers
+
 from openstates.utils.lxmlize import url_xpath
 
 
@@ -11,11 +10,14 @@ class Idaho(Jurisdiction):
     classification = "government"
     name = "Idaho"
     url = "http://www.legislature.idaho.gov"
-    scrapers = {
-        "people": IDPersonScraper,
-        # 'committees': IDCommitteeScraper,
-        "bills": IDBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:IDPersonScraper",
+            # "committees": "committees:IDCommitteeScraper",
+            "bills": "bills:IDBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2011 Session",
@@ -1,11 +1,6 @@
 # encoding=utf-8
-from openstates.utils import url_xpath
+from openstates.utils import url_xpath, LazyScrapers
 from pupa.scrape import Jurisdiction, Organization
-from .bills import IlBillScraper
-from .people import IlPersonScraper
-from .events import IlEventScraper
-
-# from .committees import IlCommitteeScraper
 
 
 class Illinois(Jurisdiction):
@@ -13,12 +8,15 @@ class Illinois(Jurisdiction):
     classification = "government"
     name = "Illinois"
     url = "http://www.ilga.gov/"
-    scrapers = {
-        "bills": IlBillScraper,
-        "people": IlPersonScraper,
-        "events": IlEventScraper,
-        # "committees": IlCommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": "bills:IlBillScraper",
+            "people": "people:IlPersonScraper",
+            "events": "events:IlEventScraper",
+            # "committees": "committees:IlCommitteeScraper",
+        },
+    )
     legislative_sessions = [
         {
             "name": "90th Regular Session",
@@ -2,12 +2,15 @@
 import re
 import os
 import datetime
+import functools
 import pytz
 import scrapelib
 import lxml.html
 from pupa.scrape import Scraper, Bill, VoteEvent
 from pupa.utils import convert_pdf
 
+from openstates.utils.names import NameResolver
+
 central = pytz.timezone("US/Central")
 
 # from ._utils import canonicalize_url
@@ -734,13 +737,7 @@ class IlBillScraper(Scraper):
 
         votes = find_columns_and_parse(vote_lines)
         for name, vcode in votes.items():
-            if name == "Mr. Speaker":
-                name = session_details[session]["speaker"]
-            elif name == "Mr. President":
-                name = session_details[session]["president"]
-            else:
-                # Converts "Davis,William" to "Davis, William".
-                name = re.sub(r"\,([a-zA-Z])", r", \1", name)
+            name = voter_names(session)(name)
 
             if vcode == "Y":
                 yes_votes.append(name)
@@ -857,6 +854,22 @@ class IlBillScraper(Scraper):
             self.debug("[%s] Don't know how to refine [%s]" % (bill_id, action))
 
 
+def clean_voter_name(name):
+    # Converts "Davis,William" to "Davis, William".
+    return re.sub(r"\,([a-zA-Z])", r", \1", name)
+
+
+@functools.lru_cache()
+def voter_names(session):
+    return NameResolver(
+        clean=clean_voter_name,
+        aliases={
+            "Mr. Speaker": session_details[session]["speaker"],
+            "Mr. President": session_details[session]["president"],
+        },
+    )
+
+
 def find_columns_and_parse(vote_lines):
     columns = find_columns(vote_lines)
     votes = {}
@@ -3,10 +3,7 @@ import os
 import requests
 from pupa.scrape import Jurisdiction, Organization
 
-from .people import INPersonScraper
-
-# from .committees import INCommitteeScraper
-from .bills import INBillScraper
+from openstates.utils import LazyScrapers
 
 
 class Indiana(Jurisdiction):
@@ -14,11 +11,14 @@ class Indiana(Jurisdiction):
     classification = "government"
     name = "Indiana"
     url = "http://www.in.gov/"
-    scrapers = {
-        "people": INPersonScraper,
-        # 'committees': INCommitteeScraper,
-        "bills": INBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:INPersonScraper",
+            # "committees": "committees:INCommitteeScraper",
+            "bills": "bills:INBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "First Regular Session 116th General Assembly (2009)",
@@ -1,12 +1,6 @@
 from pupa.scrape import Jurisdiction, Organization
 
-from openstates.utils import url_xpath
-
-from openstates.ks.bills import KSBillScraper
-from openstates.ks.people import KSPersonScraper
-
-# from openstates.ks.committees import KSCommitteeScraper
-
+from openstates.utils import url_xpath, LazyScrapers
 
 # Kansas API's 429 error response includes:
 # You have received this notification because this IP address is querying
@@ -20,11 +14,14 @@ class Kansas(Jurisdiction):
     classification = "government"
     name = "Kansas"
     url = "http://www.kslegislature.org/"
-    scrapers = {
-        "bills": KSBillScraper,
-        "people": KSPersonScraper,
-        # 'committees': KSCommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": "bills:KSBillScraper",
+            "people": "people:KSPersonScraper",
+            # "committees": "committees:KSCommitteeScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "b2011_12",
@@ -1,11 +1,13 @@
 import re
 import json
+import hashlib
 import datetime
 import requests
 
 import lxml.html
 from pupa.scrape import Scraper, Bill, VoteEvent
 
+from openstates.utils import JSONStore, ordered_map
 from . import ksapi
 
 
@@ -14,6 +16,8 @@ def _clean_spaces(title):
 
 
 class KSBillScraper(Scraper):
+    workers = 4
+
     def scrape(self, chamber=None, session=None):
         if session is None:
             session = self.latest_session()
@@ -21,104 +25,137 @@ class KSBillScraper(Scraper):
 
         chambers = [chamber] if chamber is not None else ["upper", "lower"]
 
+        # one bill_status request serves both chambers
+        bills_by_chamber = self.get_bill_status()
+        self.page_cache = JSONStore("ks", session, "bill-pages")
+
         for chamber in chambers:
-            yield from self.scrape_chamber(chamber, session)
+            yield from self.scrape_chamber(chamber, session, bills_by_chamber[chamber])
 
-    def scrape_chamber(self, chamber, session):
-        chamber_name = "Senate" if chamber == "upper" else "House"
-        chamber_letter = chamber_name[0]
-        # perhaps we should save this data so we can make one request for both?
-        bill_request = self.get(ksapi.url + "bill_status/").text
-        bill_request_json = json.loads(bill_request)
-        bills = bill_request_json["content"]
+    def get_bill_status(self):
+        """
+        Fetches the session's bill_status payload once, dropping duplicate
+        bill numbers and splitting it into ``{chamber: [bill_data, ...]}``.
+        """
+        bills = self.get(ksapi.url + "bill_status/").json()["content"]
 
+        bills_by_chamber = {"upper": [], "lower": []}
         # there are duplicates
         seen_ids = set()
-
         for bill_data in bills:
-
             bill_id = bill_data["BILLNO"]
-
-            # filter other chambers
-            if not bill_id.startswith(chamber_letter):
-                continue
-            # filter duplicates
             if bill_id in seen_ids:
                 continue
-
             seen_ids.add(bill_id)
 
-            if "CR" in bill_id:
-                btype = "concurrent resolution"
-            elif "R" in bill_id:
-                btype = "resolution"
-            elif "B" in bill_id:
-                btype = "bill"
-
-            title = bill_data["SHORTTITLE"] or bill_data["LONGTITLE"]
-
-            # main
-            bill = Bill(bill_id, session, title, chamber=chamber, classification=btype)
-            bill.extras = {"status": bill_data["STATUS"]}
-
-            bill.add_source(ksapi.url + "bill_status/" + bill_id.lower())
-
-            if bill_data["LONGTITLE"] and bill_data["LONGTITLE"] != bill.title:
-                bill.add_title(bill_data["LONGTITLE"])
-
-            # An "original sponsor" is the API's expression of "primary sponsor"
-            for primary_sponsor in bill_data["ORIGINAL_SPONSOR"]:
-                bill.add_sponsorship(
-                    name=primary_sponsor,
-                    entity_type="organization"
-                    if "committee" in primary_sponsor.lower()
-                    else "person",
-                    primary=True,
-                    classification="original sponsor",
-                )
-            for sponsor in bill_data["SPONSOR_NAMES"]:
-                if sponsor in bill_data["ORIGINAL_SPONSOR"]:
-                    continue
-                bill.add_sponsorship(
-                    name=sponsor,
-                    entity_type="organization"
-                    if "committee" in sponsor.lower()
-                    else "person",
-                    primary=False,
-                    classification="cosponsor",
-                )
+            chamber = {"S": "upper", "H": "lower"}.get(bill_id[0])
+            if chamber:
+                bills_by_chamber[chamber].append(bill_data)
 
-            # history is backwards
-            for event in reversed(bill_data["HISTORY"]):
-                actor = "upper" if event["chamber"] == "Senate" else "lower"
-
-                date = event["session_date"]
-                # append committee names if present
-                if "committee_names" in event:
-                    action = (
-                        event["status"] + " " + " and ".join(event["committee_names"])
-                    )
-                else:
-                    action = event["status"]
-
-                if event["action_code"] not in ksapi.action_codes:
-                    self.warning(
-                        "unknown action code on %s: %s %s"
-                        % (bill_id, event["action_code"], event["status"])
-                    )
-                    atype = None
-                else:
-                    atype = ksapi.action_codes[event["action_code"]]
-                bill.add_action(action, date, chamber=actor, classification=atype)
+        return bills_by_chamber
 
+    def scrape_chamber(self, chamber, session, bills):
+        # HTML and vote pages are fetched on a pool, then parsed in order
+        for bill, pages in ordered_map(
+            lambda bill_data: self.build_bill(bill_data, chamber, session),
+            bills,
+            workers=self.workers,
+        ):
             # Versions are exposed in `bill_data['versions'],
             # but lack any descriptive text or identifiers;
             # continue to scrape these from the HTML
-            yield from self.scrape_html(bill, session)
+            yield from self.scrape_html(bill, pages)
 
             yield bill
 
-    def scrape_html(self, bill, session):
+    def build_bill(self, bill_data, chamber, session):
+        """
+        Builds a bill from its bill_status record and fetches its HTML pages.
+        Runs on a worker thread.
+        """
+        bill_id = bill_data["BILLNO"]
+
+        if "CR" in bill_id:
+            btype = "concurrent resolution"
+        elif "R" in bill_id:
+            btype = "resolution"
+        elif "B" in bill_id:
+            btype = "bill"
+
+        title = bill_data["SHORTTITLE"] or bill_data["LONGTITLE"]
+
+        # main
+        bill = Bill(bill_id, session, title, chamber=chamber, classification=btype)
+        bill.extras = {"status": bill_data["STATUS"]}
+
+        bill.add_source(ksapi.url + "bill_status/" + bill_id.lower())
+
+        if bill_data["LONGTITLE"] and bill_data["LONGTITLE"] != bill.title:
+            bill.add_title(bill_data["LONGTITLE"])
+
+        # An "original sponsor" is the API's expression of "primary sponsor"
+        for primary_sponsor in bill_data["ORIGINAL_SPONSOR"]:
+            bill.add_sponsorship(
+                name=primary_sponsor,
+                entity_type="organization"
+                if "committee" in primary_sponsor.lower()
+                else "person",
+                primary=True,
+                classification="original sponsor",
+            )
+        for sponsor in bill_data["SPONSOR_NAMES"]:
+            if sponsor in bill_data["ORIGINAL_SPONSOR"]:
+                continue
+            bill.add_sponsorship(
+                name=sponsor,
+                entity_type="organization"
+                if "committee" in sponsor.lower()
+                else "person",
+                primary=False,
+                classification="cosponsor",
+            )
+
+        # history is backwards
+        for event in reversed(bill_data["HISTORY"]):
+            actor = "upper" if event["chamber"] == "Senate" else "lower"
+
+            date = event["session_date"]
+            # append committee names if present
+            if "committee_names" in event:
+                action = (
+                    event["status"] + " " + " and ".join(event["committee_names"])
+                )
+            else:
+                action = event["status"]
+
+            if event["action_code"] not in ksapi.action_codes:
+                self.warning(
+                    "unknown action code on %s: %s %s"
+                    % (bill_id, event["action_code"], event["status"])
+                )
+                atype = None
+            else:
+                atype = ksapi.action_codes[event["action_code"]]
+            bill.add_action(action, date, chamber=actor, classification=atype)
+
+        return bill, self.get_bill_pages(bill, session, bill_data)
+
+    def get_bill_pages(self, bill, session, bill_data):
+        """
+        Returns the bill's HTML page and vote pages as
+        ``{"url", "html", "votes": {link: text or None}}``.
+
+        Pages are cached alongside a digest of the bill's bill_status
+        record; the record changes whenever anything about the bill does,
+        so bills whose record is unchanged skip their HTML & vote fetches.
+        """
+        fingerprint = hashlib.sha1(
+            json.dumps(bill_data, sort_keys=True).encode("utf8")
+        ).hexdigest()
+        cached = self.page_cache.get(bill.identifier)
+        if cached and cached["fingerprint"] == fingerprint:
+            return cached
+
         meta = next(
             each
             for each in self.jurisdiction.legislative_sessions
@@ -131,7 +168,27 @@ class KSBillScraper(Scraper):
             base_url = "http://www.kslegislature.org/li/%s/year1/measures/" % slug
 
         url = base_url + bill.identifier.lower() + "/"
-        doc = lxml.html.fromstring(self.get(url).text)
+        html = self.get(url).text
+        doc = lxml.html.fromstring(html)
+        doc.make_links_absolute(url)
+
+        all_links = doc.xpath(
+            "//table[@class='bottom']/tbody[@class='tab-content-sub']/tr/td/a/@href"
+        )
+        votes = {}
+        for i in all_links:
+            if "vote_view" in i:
+                votes[str(i)] = self.get_vote_page(str(i))
+
+        pages = {"fingerprint": fingerprint, "url": url, "html": html, "votes": votes}
+        # don't remember a bill whose vote pages didn't all come through
+        if None not in votes.values():
+            self.page_cache.set(bill.identifier, pages)
+        return pages
+
+    def scrape_html(self, bill, pages):
+        url = pages["url"]
+        doc = lxml.html.fromstring(pages["html"])
         doc.make_links_absolute(url)
 
         bill.add_source(url)
@@ -157,16 +214,9 @@ class KSBillScraper(Scraper):
                         title + " - Fiscal Note", sn_url, on_duplicate="ignore"
                     )
 
-        all_links = doc.xpath(
-            "//table[@class='bottom']/tbody[@class='tab-content-sub']/tr/td/a/@href"
-        )
-        vote_members_urls = []
-        for i in all_links:
-            if "vote_view" in i:
-                vote_members_urls.append(str(i))
-        if len(vote_members_urls) > 0:
-            for link in vote_members_urls:
-                yield from self.parse_vote(bill, link)
+        for link, text in pages["votes"].items():
+            if text is not None:
+                yield from self.parse_vote(bill, link, text)
 
         history_rows = doc.xpath('//tbody[starts-with(@id, "history-tab")]/tr')
         for row in history_rows:
@@ -185,7 +235,8 @@ class KSBillScraper(Scraper):
                     _clean_spaces(amendment_name), amendment, on_duplicate="ignore"
                 )
 
-    def parse_vote(self, bill, link):
+    def get_vote_page(self, link):
+        """ returns the text of a vote page, or None if it is unusable """
         # Server sometimes sends proper error headers,
         # sometimes not
         try:
@@ -193,15 +244,18 @@ class KSBillScraper(Scraper):
             text = requests.get(link).text
         except requests.exceptions.HTTPError as err:
             self.warning("{} fetching vote {}, skipping".format(err, link))
-            return
+            return None
 
         if "Varnish cache server" in text:
             self.warning(
                 "Scrape rate is too high, try re-scraping with "
                 "The --rpm set to a lower number"
             )
-            return
+            return None
+
+        return text
 
+    def parse_vote(self, bill, link, text):
         if "Page Not Found" in text or "Page Unavailable" in text:
             self.warning("missing vote, skipping")
             return
@@ -2,12 +2,7 @@ import re
 
 from pupa.scrape import Jurisdiction, Organization
 
-from openstates.utils import url_xpath
-
-from .people import KYPersonScraper
-
-# from .committees import KYCommitteeScraper
-from .bills import KYBillScraper
+from openstates.utils import url_xpath, LazyScrapers
 
 
 class Kentucky(Jurisdiction):
@@ -15,11 +10,14 @@ class Kentucky(Jurisdiction):
     classification = "government"
     name = "Kentucky"
     url = "http://www.lrc.ky.gov/"
-    scrapers = {
-        "people": KYPersonScraper,
-        # 'committees': KYCommitteeScraper,
-        "bills": KYBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:KYPersonScraper",
+            # "committees": "committees:KYCommitteeScraper",
+            "bills": "bills:KYBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2011 Regular Session",
@@ -1,10 +1,5 @@
-from openstates.utils import url_xpath
+from openstates.utils import url_xpath, LazyScrapers
 from pupa.scrape import Jurisdiction, Organization
-from .people import LAPersonScraper
-
-# from .committees import LACommitteeScraper
-# from .events import LAEventScraper
-from .bills import LABillScraper
 
 
 class Louisiana(Jurisdiction):
@@ -12,12 +7,15 @@ class Louisiana(Jurisdiction):
     classification = "government"
     name = "Louisiana"
     url = "http://www.legis.la.gov/"
-    scrapers = {
-        "people": LAPersonScraper,
-        # "committees": LACommitteeScraper,
-        # 'events': LAEventScraper,
-        "bills": LABillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:LAPersonScraper",
+            # "committees": "committees:LACommitteeScraper",
+            # "events": "events:LAEventScraper",
+            "bills": "bills:LABillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2009 Regular Session",
@@ -6,10 +6,17 @@ import re
 from collections import defaultdict
 from pupa.scrape import Scraper, Bill, VoteEvent
 from pupa.utils import convert_pdf
-from openstates.utils import LXMLMixin
+from openstates.utils import (
+    LXMLMixin,
+    PostBackSession,
+    ordered_map,
+    post_back_args,
+    prefetch,
+)
 
 
 class LABillScraper(Scraper, LXMLMixin):
+    workers = 4
     _chambers = {"S": "upper", "H": "lower", "J": "legislature"}
 
     _bill_types = {
@@ -53,43 +60,16 @@ class LABillScraper(Scraper, LXMLMixin):
 
         return bill_abbreviations
 
-    def do_post_back(self, page, event_target, event_argument):
-        form = page.xpath("//form[@id='aspnetForm']")[0]
-        block = {
-            name: value
-            for name, value in [(obj.name, obj.value) for obj in form.xpath(".//input")]
-        }
-        block["__EVENTTARGET"] = event_target
-        block["__EVENTARGUMENT"] = event_argument
-        if form.method == "GET":
-            ret = lxml.html.fromstring(self.get(form.action, data=block).text)
-        elif form.method == "POST":
-            ret = lxml.html.fromstring(self.post(form.action, data=block).text)
-        else:
-            raise AssertionError(
-                "Unrecognized request type found: {}".format(form.method)
-            )
-
-        ret.make_links_absolute(form.action)
-        return ret
+    def next_page_args(self, page):
+        hrefs = page.xpath("//a[text()=' > ']")
+        if hrefs == [] or "disabled" in hrefs[0].attrib:
+            return None
+        return post_back_args(hrefs[0].attrib["href"])
 
     def bill_pages(self, url):
-        response = self.get(url, allow_redirects=False)
-        page = lxml.html.fromstring(response.text)
-        page.make_links_absolute(url)
-        yield page
-
-        while True:
-            hrefs = page.xpath("//a[text()=' > ']")
-            if hrefs == [] or "disabled" in hrefs[0].attrib:
-                return
-
-            href = hrefs[0].attrib["href"]
-            tokens = re.match(r".*\(\'(?P<token>.*)\',\'.*", href).groupdict()
-
-            page = self.do_post_back(page, tokens["token"], "")
-            if page:
-                yield page
+        return PostBackSession(self).pages(
+            url, self.next_page_args, allow_redirects=False
+        )
 
     def scrape_bare_page(self, url):
         try:
@@ -114,7 +94,18 @@ class LABillScraper(Scraper, LXMLMixin):
                     session_id, bill_abbreviation
                 )
                 bills_found = False
-                for bill_page in self.bill_pages(bill_list_url):
+
+                def scrape_bill_url(bill_url):
+                    return list(
+                        self.scrape_bill_page(
+                            chamber, session, bill_url, bill_abbreviation
+                        )
+                    )
+
+                # the next page's postback runs while this page's bills
+                # are being fetched
+                for bill_page in prefetch(self.bill_pages(bill_list_url)):
+                    bill_urls = []
                     for bill in bill_page.xpath(
                         "//a[contains(@href, 'BillInfo.aspx') and text()='more...']"
                     ):
@@ -122,10 +113,12 @@ class LABillScraper(Scraper, LXMLMixin):
                         if bill_url in seen_bill_urls:
                             continue
                         seen_bill_urls.add(bill_url)
-                        bills_found = True
-                        yield from self.scrape_bill_page(
-                            chamber, session, bill_url, bill_abbreviation
-                        )
+                        bill_urls.append(bill_url)
+                    bills_found = bills_found or bool(bill_urls)
+                    for objs in ordered_map(
+                        scrape_bill_url, bill_urls, workers=self.workers
+                    ):
+                        yield from objs
                 if not bills_found:
                     # If a session only has one legislative item of a given type
                     # (eg, some special sessions only have one `HB`), the bill list
@@ -4,11 +4,7 @@ import requests
 import lxml.html
 from pupa.scrape import Jurisdiction, Organization
 
-from .people import MAPersonScraper
-
-# from .committees import MACommitteeScraper
-from .bills import MABillScraper
-from .events import MAEventScraper
+from openstates.utils import LazyScrapers
 
 
 class Massachusetts(Jurisdiction):
@@ -16,12 +12,15 @@ class Massachusetts(Jurisdiction):
     classification = "government"
     name = "Massachusetts"
     url = "http://mass.gov"
-    scrapers = {
-        "people": MAPersonScraper,
-        # 'committees': MACommitteeScraper,
-        "bills": MABillScraper,
-        "events": MAEventScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:MAPersonScraper",
+            # "committees": "committees:MACommitteeScraper",
+            "bills": "bills:MABillScraper",
+            "events": "events:MAEventScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "186th",
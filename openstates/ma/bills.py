@@ -1,11 +1,14 @@
 import re
 import requests
 import os
+import threading
+import collections
 from datetime import datetime
 import lxml.html
 from pupa.scrape import Scraper, Bill, VoteEvent
 from pupa.utils import convert_pdf
 
+from openstates.utils import ordered_map, parse_response
 from .actions import Categorizer
 
 
@@ -16,6 +19,7 @@ class MABillScraper(Scraper):
     session_filters = {}
     chamber_filters = {}
     house_pdf_cache = {}
+    workers = 4
 
     chamber_map = {"lower": "House", "upper": "Senate"}
     chamber_map_reverse = {
@@ -30,6 +34,9 @@ class MABillScraper(Scraper):
         # forcing these values so that 500s come back as skipped bills
         self.raise_errors = False
         self.verify = False
+        # one lock per PDF, so threads only wait on a download they also need
+        self._house_pdf_locks = collections.defaultdict(threading.Lock)
+        self._house_pdf_locks_lock = threading.Lock()
 
     def format_bill_number(self, raw):
         return raw.replace("Bill ", "").replace(".", " ").strip()
@@ -75,16 +82,30 @@ class MABillScraper(Scraper):
 
         # Pull the search page to get the filters
         search_url = "https://malegislature.gov/Bills/Search?SearchTerms=&Page=1"
-        page = lxml.html.fromstring(self.get(search_url).text)
+        page = parse_response(self.get(search_url))
         self.session_filters = self.get_refiners(page, "lawsgeneralcourt")
         self.chamber_filters = self.get_refiners(page, "lawsbranchname")
 
+        # the page count is known up front, so listing pages are fetched
+        # concurrently and feed a pool that scrapes each bill's detail,
+        # cosponsor & action pages; results keep the listing's bill order
         lastPage = self.get_max_pages(session, chamber)
-        for pageNumber in range(1, lastPage + 1):
-            bills = self.list_bills(session, chamber, pageNumber)
-            for bill in bills:
-                bill = self.format_bill_number(bill).replace(" ", "")
-                yield from self.scrape_bill(session, bill, chamber)
+        listings = ordered_map(
+            lambda pageNumber: self.list_bills(session, chamber, pageNumber),
+            range(1, lastPage + 1),
+            workers=self.workers,
+        )
+        bill_ids = (
+            self.format_bill_number(bill).replace(" ", "")
+            for bills in listings
+            for bill in bills
+        )
+        for bills in ordered_map(
+            lambda bill_id: list(self.scrape_bill(session, bill_id, chamber)),
+            bill_ids,
+            workers=self.workers,
+        ):
+            yield from bills
 
     def list_bills(self, session, chamber, pageNumber):
         session_filter = self.session_filters[session]
@@ -101,7 +122,7 @@ class MABillScraper(Scraper):
             )
         )
 
-        page = lxml.html.fromstring(self.get(search_url).text)
+        page = parse_response(self.get(search_url))
         resultRows = page.xpath('//table[@id="searchTable"]/tbody/tr/td[2]/a/text()')
         return resultRows
 
@@ -118,7 +139,7 @@ class MABillScraper(Scraper):
             "Refinements%5Blawsgeneralcourt%5D={}&&"
             "Refinements%5Blawsbranchname%5D={}".format(session_filter, chamber_filter)
         )
-        page = lxml.html.fromstring(self.get(search_url).text)
+        page = parse_response(self.get(search_url))
 
         if page.xpath('//ul[contains(@class,"pagination-sm")]/li[last()]/a/@onclick'):
             maxPage = page.xpath(
@@ -257,15 +278,16 @@ class MABillScraper(Scraper):
         )
         if max_page:
             max_page = re.sub(r"[^\d]", "", max_page[0]).strip()
+            # https://malegislature.gov/Bills/189/S3/BillHistory?pageNumber=2
+            # already on one of the bill pool's threads, so fetched in turn
             for counter in range(2, int(max_page) + 1):
                 page = self.get_action_page(bill_url, counter)
                 # XXX: yield from
                 self.scrape_action_page(bill, page)
-                # https://malegislature.gov/Bills/189/S3/BillHistory?pageNumber=2
 
     def get_action_page(self, bill_url, page_number):
         actions_url = "{}/BillHistory?pageNumber={}".format(bill_url, page_number)
-        return lxml.html.fromstring(self.get_as_ajax(actions_url).text)
+        return parse_response(self.get_as_ajax(actions_url))
 
     def scrape_action_page(self, bill, page):
         action_rows = page.xpath("//tbody/tr")
@@ -371,13 +393,17 @@ class MABillScraper(Scraper):
 
     def get_house_pdf(self, vurl):
         """ cache house PDFs since they are done by year """
-        if vurl not in self.house_pdf_cache:
-            (path, resp) = self.urlretrieve(vurl)
-            pdflines = convert_pdf(path, "text")
-            os.remove(path)
-            self.house_pdf_cache[vurl] = pdflines.decode("utf-8").replace(
-                u"\u2019", "'"
-            )
+        # bills are scraped on several threads, only fetch each PDF once
+        with self._house_pdf_locks_lock:
+            lock = self._house_pdf_locks[vurl]
+        with lock:
+            if vurl not in self.house_pdf_cache:
+                (path, resp) = self.urlretrieve(vurl)
+                pdflines = convert_pdf(path, "text")
+                os.remove(path)
+                self.house_pdf_cache[vurl] = pdflines.decode("utf-8").replace(
+                    u"\u2019", "'"
+                )
         return self.house_pdf_cache[vurl]
 
     def scrape_house_vote(self, vote, vurl, supplement):
@@ -1,12 +1,6 @@
 from pupa.scrape import Jurisdiction, Organization
 
-from openstates.utils import url_xpath
-
-from .bills import MDBillScraper
-from .people import MDPersonScraper
-from .events import MDEventScraper
-
-# from .committees import MDCommitteeScraper
+from openstates.utils import url_xpath, LazyScrapers
 
 
 class Maryland(Jurisdiction):
@@ -14,12 +8,15 @@ class Maryland(Jurisdiction):
     classification = "government"
     name = "Maryland"
     url = "http://mgaleg.maryland.gov/webmga/frm1st.aspx?tab=home"
-    scrapers = {
-        "bills": MDBillScraper,
-        "people": MDPersonScraper,
-        "events": MDEventScraper,
-        # 'committees': MDCommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": "bills:MDBillScraper",
+            "people": "people:MDPersonScraper",
+            "events": "events:MDEventScraper",
+            # "committees": "committees:MDCommitteeScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2007 Regular Session",
@@ -1,11 +1,5 @@
 from pupa.scrape import Jurisdiction, Organization
-from openstates.utils import url_xpath
-
-from .bills import MEBillScraper
-from .people import MEPersonScraper
-from .events import MEEventScraper
-
-# from .committees import MECommitteeScraper
+from openstates.utils import url_xpath, LazyScrapers
 
 
 class Maine(Jurisdiction):
@@ -13,12 +7,15 @@ class Maine(Jurisdiction):
     classification = "government"
     name = "Maine"
     url = "http://legislature.maine.gov"
-    scrapers = {
-        "bills": MEBillScraper,
-        "people": MEPersonScraper,
-        "events": MEEventScraper,
-        # 'committees': MECommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": "bills:MEBillScraper",
+            "people": "people:MEPersonScraper",
+            "events": "events:MEEventScraper",
+            # "committees": "committees:MECommitteeScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "121st Legislature",
@@ -2,6 +2,7 @@ import re
 import html
 import socket
 import datetime
+import functools
 
 import requests
 import lxml.html
@@ -9,13 +10,16 @@ import scrapelib
 
 from pupa.scrape import Scraper, Bill, VoteEvent
 
+from openstates.utils import ordered_map, prefetch
 from .actions import Categorizer
 
 BLACKLISTED_BILL_IDS = {"128": ("SP 601", "SP 602"), "129": ()}
+PAGE_SIZE = 25
 
 
 class MEBillScraper(Scraper):
     categorizer = Categorizer()
+    workers = 4
 
     def scrape(self, chamber=None, session=None):
         chambers = [chamber] if chamber is not None else ["upper", "lower"]
@@ -49,25 +53,37 @@ class MEBillScraper(Scraper):
         r = request_session.post(url=search_url, data=form_data)
         r.raise_for_status()
 
-        yield from self._recursively_process_bills(
-            request_session=request_session, chamber=chamber, session=session
+        # result pages are walked on a background thread (a page ahead of the
+        # bills being scraped), and each bill's detail, vote and action pages
+        # are fetched on a bounded pool; bills come back in search order
+        bills = prefetch(
+            self._iter_search_results(
+                request_session=request_session, chamber=chamber, session=session
+            ),
+            depth=PAGE_SIZE,
         )
+        scrape_bill = functools.partial(self._scrape_bill_and_votes, chamber=chamber)
+        for bill, votes in ordered_map(scrape_bill, bills, workers=self.workers):
+            yield from votes
+            yield bill
 
-    def _recursively_process_bills(
-        self, request_session, chamber, session, first_item=1
-    ):
+    def _iter_search_results(self, request_session, chamber, session):
         """
-        Once a search has been initiated, this function will save a
+        Once a search has been initiated, this function will yield a
         Bill object for every Paper from the given chamber
         """
 
         url = "http://legislature.maine.gov/LawMakerWeb/searchresults.asp"
-        r = request_session.get(url, params={"StartWith": first_item})
-        r.raise_for_status()
-
-        bills = lxml.html.fromstring(r.text).xpath("//tr/td/b/a")
         seen = set()
-        if bills:
+        first_item = 1
+        while True:
+            r = request_session.get(url, params={"StartWith": first_item})
+            r.raise_for_status()
+
+            bills = lxml.html.fromstring(r.text).xpath("//tr/td/b/a")
+            if not bills:
+                break
+
             for bill in bills:
                 bill_id_slug = bill.xpath("./@href")[0]
                 if bill_id_slug == "summary.asp?ID=280068396":
@@ -80,7 +96,7 @@ class MEBillScraper(Scraper):
                 if bill_id in BLACKLISTED_BILL_IDS[session]:
                     continue
 
-                # avoid duplicates
+                # avoid duplicates, including across result pages
                 if bill_id in seen:
                     continue
                 seen.add(bill_id)
@@ -92,18 +108,14 @@ class MEBillScraper(Scraper):
                     chamber=chamber,
                 )
                 bill.add_source(bill_url)
-
-                yield from self.scrape_bill(bill, chamber)
                 yield bill
 
-            # Make a recursive call to this function, for the next page
-            PAGE_SIZE = 25
-            yield from self._recursively_process_bills(
-                request_session=request_session,
-                chamber=chamber,
-                session=session,
-                first_item=first_item + PAGE_SIZE,
-            )
+            first_item += PAGE_SIZE
+
+    def _scrape_bill_and_votes(self, bill, chamber):
+        # runs on a worker thread, so gather the votes instead of yielding
+        votes = list(self.scrape_bill(bill, chamber))
+        return bill, votes
 
     def scrape_bill(self, bill, chamber):
         url = bill.sources[0]["url"]
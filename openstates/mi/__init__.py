@@ -1,10 +1,5 @@
 from pupa.scrape import Jurisdiction, Organization
-from openstates.utils import url_xpath
-from .bills import MIBillScraper
-from .events import MIEventScraper
-from .people import MIPersonScraper
-
-# from .committees import MICommitteeScraper
+from openstates.utils import url_xpath, LazyScrapers
 
 
 class Michigan(Jurisdiction):
@@ -12,12 +7,15 @@ class Michigan(Jurisdiction):
     classification = "government"
     name = "Michigan"
     url = "http://www.legislature.mi.gov"
-    scrapers = {
-        "bills": MIBillScraper,
-        "events": MIEventScraper,
-        "people": MIPersonScraper,
-        # 'committees': MICommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": "bills:MIBillScraper",
+            "events": "events:MIEventScraper",
+            "people": "people:MIPersonScraper",
+            # "committees": "committees:MICommitteeScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2011-2012",
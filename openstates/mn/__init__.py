@@ -1,14 +1,6 @@
 from pupa.scrape import Jurisdiction, Organization
 
-from openstates.utils import url_xpath
-
-from .bills import MNBillScraper
-
-# from .committees import MNCommitteeScraper
-from .people import MNPersonScraper
-from .vote_events import MNVoteScraper
-
-# from .events import MNEventScraper
+from openstates.utils import url_xpath, LazyScrapers
 
 """
 Minnesota legislative data can be found at the Office of the Revisor
@@ -27,13 +19,16 @@ class Minnesota(Jurisdiction):
     classification = "government"
     name = "Minnesota"
     url = "http://state.mn.us/"
-    scrapers = {
-        "bills": MNBillScraper,
-        # "committees": MNCommitteeScraper,
-        "people": MNPersonScraper,
-        "votes": MNVoteScraper,
-        # "events": MNEventScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": "bills:MNBillScraper",
+            # "committees": "committees:MNCommitteeScraper",
+            "people": "people:MNPersonScraper",
+            "votes": "vote_events:MNVoteScraper",
+            # "events": "events:MNEventScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "86th Legislature, 2009-2010",
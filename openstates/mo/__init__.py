@@ -1,14 +1,6 @@
 from pupa.scrape import Jurisdiction, Organization
 
-from openstates.utils import url_xpath
-
-from openstates.mo.bills import MOBillScraper
-from openstates.mo.events import MOEventScraper
-
-# from openstates.mo.votes import MOVoteScraper
-from openstates.mo.people import MOPersonScraper
-
-# from openstates.mo.committees import MOCommitteeScraper
+from openstates.utils import url_xpath, LazyScrapers
 
 
 class Missouri(Jurisdiction):
@@ -16,13 +8,16 @@ class Missouri(Jurisdiction):
     classification = "government"
     name = "Missouri"
     url = "http://www.moga.mo.gov/"
-    scrapers = {
-        "bills": MOBillScraper,
-        # 'votes': MOVoteScraper,
-        "events": MOEventScraper,
-        "people": MOPersonScraper,
-        # 'committees': MOCommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": "bills:MOBillScraper",
+            # "votes": "votes:MOVoteScraper",
+            "events": "events:MOEventScraper",
+            "people": "people:MOPersonScraper",
+            # "committees": "committees:MOCommitteeScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2019 Regular Session",
@@ -1,10 +1,5 @@
 from pupa.scrape import Jurisdiction, Organization
-from openstates.utils import url_xpath
-
-from .people import MSLegislatorScraper
-
-# from .committees import MSCommitteeScraper
-from .bills import MSBillScraper
+from openstates.utils import url_xpath, LazyScrapers
 
 
 class Mississippi(Jurisdiction):
@@ -12,11 +7,14 @@ class Mississippi(Jurisdiction):
     classification = "government"
     name = "Mississippi"
     url = "http://www.legislature.ms.gov/"
-    scrapers = {
-        "people": MSLegislatorScraper,
-        # "committees": MSCommitteeScraper,
-        "bills": MSBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:MSLegislatorScraper",
+            # "committees": "committees:MSCommitteeScraper",
+            "bills": "bills:MSBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2008 Regular Session",
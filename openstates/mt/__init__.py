@@ -1,10 +1,8 @@
 from pupa.scrape import Jurisdiction, Organization
 
-from openstates.utils.lxmlize import url_xpath
-from .people import MTPersonScraper
+from openstates.utils import LazyScrapers
 
-# from .committees import MTCommitteeScraper
-from .bills import MTBillScraper
+from openstates.utils.lxmlize import url_xpath
 
 
 class Montana(Jurisdiction):
@@ -12,11 +10,14 @@ class Montana(Jurisdiction):
     classification = "government"
     name = "Montana"
     url = "http://leg.mt.gov/"
-    scrapers = {
-        "people": MTPersonScraper,
-        # 'committees': MTCommitteeScraper,
-        "bills": MTBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:MTPersonScraper",
+            # "committees": "committees:MTCommitteeScraper",
+            "bills": "bills:MTBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "20111",
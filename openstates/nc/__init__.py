@@ -1,9 +1,7 @@
 import lxml
 from pupa.scrape import Jurisdiction, Organization
-from .people import NCPersonScraper
 
-# from .committees import NCCommitteeScraper
-from .bills import NCBillScraper
+from openstates.utils import LazyScrapers
 
 
 class NorthCarolina(Jurisdiction):
@@ -11,11 +9,14 @@ class NorthCarolina(Jurisdiction):
     classification = "government"
     name = "North Carolina"
     url = "http://www.ncleg.net/"
-    scrapers = {
-        "people": NCPersonScraper,
-        # 'committees': NCCommitteeScraper,
-        "bills": NCBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:NCPersonScraper",
+            # "committees": "committees:NCCommitteeScraper",
+            "bills": "bills:NCBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "1985-1986 Session",
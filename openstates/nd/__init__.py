@@ -1,9 +1,6 @@
 from pupa.scrape import Jurisdiction, Organization
 
-# from .committees import NDCommitteeScraper
-from .votes import NDVoteScraper
-from .people import NDPersonScraper
-from .bills import NDBillScraper
+from openstates.utils import LazyScrapers
 
 
 class NorthDakota(Jurisdiction):
@@ -11,12 +8,15 @@ class NorthDakota(Jurisdiction):
     classification = "government"
     name = "North Dakota"
     url = "http://www.legis.nd.gov/"
-    scrapers = {
-        "people": NDPersonScraper,
-        "votes": NDVoteScraper,
-        # 'committees': NDCommitteeScraper,
-        "bills": NDBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:NDPersonScraper",
+            "votes": "votes:NDVoteScraper",
+            # "committees": "committees:NDCommitteeScraper",
+            "bills": "bills:NDBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "62nd Legislative Assembly (2011-12)",
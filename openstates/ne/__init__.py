@@ -1,10 +1,6 @@
 from pupa.scrape import Jurisdiction, Organization
 
-from openstates.utils import url_xpath
-from openstates.ne.bills import NEBillScraper
-from openstates.ne.people import NEPersonScraper
-
-# from openstates.ne.committees import NECommitteeScraper
+from openstates.utils import url_xpath, LazyScrapers
 
 
 class Nebraska(Jurisdiction):
@@ -12,11 +8,14 @@ class Nebraska(Jurisdiction):
     classification = "government"
     name = "Nebraska"
     url = "http://nebraskalegislature.gov/"
-    scrapers = {
-        "bills": NEBillScraper,
-        "people": NEPersonScraper,
-        # 'committees': NECommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": "bills:NEBillScraper",
+            "people": "people:NEPersonScraper",
+            # "committees": "committees:NECommitteeScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "102nd Legislature 1st and 2nd Sessions",
@@ -1,9 +1,7 @@
 import datetime
 from pupa.scrape import Jurisdiction, Organization
-from .people import NHPersonScraper
 
-# from .committees import NHCommitteeScraper
-from .bills import NHBillScraper
+from openstates.utils import LazyScrapers
 
 
 class NewHampshire(Jurisdiction):
@@ -11,18 +9,45 @@ class NewHampshire(Jurisdiction):
     classification = "government"
     name = "New Hampshire"
     url = "http://gencourt.state.nh.us"
-    scrapers = {
-        "people": NHPersonScraper,
-        # 'committees': NHCommitteeScraper,
-        "bills": NHBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:NHPersonScraper",
+            # "committees": "committees:NHCommitteeScraper",
+            "bills": "bills:NHBillScraper",
+        },
+    )
     legislative_sessions = [
-        {"identifier": "2011", "name": "2011 Regular Session"},
-        {"identifier": "2012", "name": "2012 Regular Session"},
-        {"identifier": "2013", "name": "2013 Regular Session"},
-        {"identifier": "2014", "name": "2014 Regular Session"},
-        {"identifier": "2015", "name": "2015 Regular Session"},
-        {"identifier": "2016", "name": "2016 Regular Session"},
+        {
+            "identifier": "2011",
+            "name": "2011 Regular Session",
+            "end_date": "2011-06-30",
+        },
+        {
+            "identifier": "2012",
+            "name": "2012 Regular Session",
+            "end_date": "2012-06-30",
+        },
+        {
+            "identifier": "2013",
+            "name": "2013 Regular Session",
+            "end_date": "2013-06-30",
+        },
+        {
+            "identifier": "2014",
+            "name": "2014 Regular Session",
+            "end_date": "2014-06-30",
+        },
+        {
+            "identifier": "2015",
+            "name": "2015 Regular Session",
+            "end_date": "2015-06-30",
+        },
+        {
+            "identifier": "2016",
+            "name": "2016 Regular Session",
+            "end_date": "2016-06-30",
+        },
         {
             "identifier": "2017",
             "name": "2017 Regular Session",
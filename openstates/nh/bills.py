@@ -6,6 +6,9 @@ import pytz
 from pupa.scrape import Scraper, Bill, VoteEvent as Vote
 
 from openstates.nh.legacyBills import NHLegacyBillScraper
+from openstates.utils import BillStore, SessionSnapshots
+from openstates.utils.actions import PatternClassifier
+from openstates.utils.names import NameResolver
 
 
 body_code = {"lower": "H", "upper": "S"}
@@ -37,12 +40,8 @@ action_classifiers = [
 VERSION_URL = "http://www.gencourt.state.nh.us/legislation/%s/%s.html"
 AMENDMENT_URL = "http://www.gencourt.state.nh.us/legislation/amendments/%s.html"
 
-
-def classify_action(action):
-    for regex, classification in action_classifiers:
-        if re.match(regex, action):
-            return classification
-    return None
+classify_action = PatternClassifier(action_classifiers)
+voter_names = NameResolver()
 
 
 def extract_amendment_id(action):
@@ -56,9 +55,25 @@ class NHBillScraper(Scraper):
         if not session:
             session = self.latest_session()
             self.info("no session specified, using %s", session)
+        # names the people scrape saved, so their other_names resolve to them.
+        # pupa update clears the data directory before scraping, so there
+        # are only any when people are scraped first in the same run:
+        #   pupa update nh people bills
+        people = voter_names.add_people(self.datadir)
+        if people:
+            self.info("resolving voter names against %d people", people)
+        else:
+            self.warning(
+                "no people in %s, scrape people before bills to resolve "
+                "voter names against them",
+                self.datadir,
+            )
         chambers = [chamber] if chamber else ["upper", "lower"]
+        snapshots = SessionSnapshots(self)
         for chamber in chambers:
-            yield from self.scrape_chamber(chamber, session)
+            yield from snapshots(
+                self.scrape_chamber(chamber, session), session, chamber
+            )
 
     def scrape_chamber(self, chamber, session):
         if int(session) < 2017:
@@ -70,8 +85,8 @@ class NHBillScraper(Scraper):
             return
 
         # bill basics
-        self.bills = {}  # LSR->Bill
-        self.bills_by_id = {}  # need a second table to attach votes
+        self.bills = BillStore()  # LSR->Bill
+        self.lsr_by_id = {}  # need a second table to attach votes
         self.versions_by_lsr = {}  # mapping of bill ID to lsr
         self.amendments_by_lsr = {}
 
@@ -165,7 +180,7 @@ class NHBillScraper(Scraper):
                         media_type="application/pdf",
                     )
 
-                self.bills_by_id[bill_id] = self.bills[lsr]
+                self.lsr_by_id[bill_id] = lsr
 
         # load legislators
         self.legislators = {}
@@ -250,10 +265,10 @@ class NHBillScraper(Scraper):
         yield from self.scrape_votes(session)
 
         # save all bills
-        for bill in self.bills:
+        for lsr, bill in self.bills.drain():
             # bill.add_source(zip_url)
-            self.add_source(self.bills[bill], bill, session)
-            yield self.bills[bill]
+            self.add_source(bill, lsr, session)
+            yield bill
 
     def add_source(self, bill, lsr, session):
         bill_url = (
@@ -335,7 +350,7 @@ class NHBillScraper(Scraper):
             # absent = int(line[8])
             motion = line[11].strip() or "[not available]"
 
-            if session_yr == session and bill_id in self.bills_by_id:
+            if session_yr == session and bill_id in self.lsr_by_id:
                 actor = "lower" if body == "H" else "upper"
                 time = dt.datetime.strptime(timestamp, "%m/%d/%Y %I:%M:%S %p")
                 time = pytz.timezone("America/New_York").localize(time).isoformat()
@@ -347,7 +362,7 @@ class NHBillScraper(Scraper):
                     motion_text=motion,
                     result="pass" if passed else "fail",
                     classification="passage",
-                    bill=self.bills_by_id[bill_id],
+                    bill=self.bills[self.lsr_by_id[bill_id]],
                 )
                 vote.set_count("yes", yeas)
                 vote.set_count("no", nays)
@@ -370,9 +385,9 @@ class NHBillScraper(Scraper):
             if not bill_id:
                 continue
 
-            if session_yr == session and bill_id.strip() in self.bills_by_id:
+            if session_yr == session and bill_id.strip() in self.lsr_by_id:
                 try:
-                    leg = " ".join(self.legislators[employee]["name"].split())
+                    leg = voter_names(self.legislators[employee]["name"])
                 except KeyError:
                     self.warning("Error, can't find person %s" % employee)
                     continue
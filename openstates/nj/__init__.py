@@ -1,11 +1,6 @@
 from pupa.scrape import Jurisdiction, Organization
 
-from openstates.utils import url_xpath
-from .bills import NJBillScraper
-from .events import NJEventScraper
-from .people import NJPersonScraper
-
-# from .committees import NJCommitteeScraper
+from openstates.utils import url_xpath, LazyScrapers
 
 # don't retry- if a file isn't on FTP just let it go
 settings = dict(SCRAPELIB_RETRY_ATTEMPTS=0)
@@ -16,12 +11,15 @@ class NewJersey(Jurisdiction):
     classification = "government"
     name = "New Jersey"
     url = "http://www.njleg.state.nj.us/"
-    scrapers = {
-        "bills": NJBillScraper,
-        "events": NJEventScraper,
-        "people": NJPersonScraper,
-        # 'committees': NJCommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": "bills:NJBillScraper",
+            "events": "events:NJEventScraper",
+            "people": "people:NJPersonScraper",
+            # "committees": "committees:NJCommitteeScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2008-2009",
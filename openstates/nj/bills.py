@@ -10,6 +10,7 @@ from datetime import datetime
 import scrapelib
 from pupa.scrape import Scraper, Bill, VoteEvent
 
+from openstates.utils import BillStore
 from .utils import MDBMixin
 
 TIMEZONE = pytz.timezone("US/Eastern")
@@ -257,8 +258,8 @@ class NJBillScraper(Scraper, MDBMixin):
         # Main Bill information
         main_bill_csv = self.access_to_csv("MainBill")
 
-        # keep a dictionary of bills (mapping bill_id to Bill obj)
-        bill_dict = {}
+        # bills by bill_id, spilling to disk as the session is large
+        bill_dict = BillStore()
 
         for rec in main_bill_csv:
             bill_type = rec["BillType"].strip()
@@ -516,7 +517,7 @@ class NJBillScraper(Scraper, MDBMixin):
 
         phony_bill_count = 0
         # save all bills at the end
-        for bill in bill_dict.values():
+        for _, bill in bill_dict.drain():
             # add sources
             if not bill.actions and not bill.versions:
                 self.warning("probable phony bill detected %s", bill.identifier)
@@ -1,9 +1,12 @@
 import os
 import re
 import csv
+import shutil
 import zipfile
 import subprocess
 
+from openstates.utils import cache_path, fetched_this_run
+
 
 def clean_committee_name(comm_name):
     comm_name = comm_name.strip()
@@ -24,18 +27,25 @@ def chamber_name(chamber):
 
 class MDBMixin(object):
     def _init_mdb(self, year):
+        # every NJ scraper reads the same database, the runner fetches it once
+        # up front and the scrapers it starts pick it up from the cache
+        path = cache_path("nj", "DB%s.mdb" % year)
+        if fetched_this_run(path):
+            self.mdbfile = path
+            return
+
         if year < 2018:
-            self.mdbfile = "DB%s.mdb" % year
             url = "ftp://www.njleg.state.nj.us/ag/%sdata/DB%s.zip" % (year, year)
             fname, resp = self.urlretrieve(url)
             zf = zipfile.ZipFile(fname)
-            zf.extract(self.mdbfile)
+            zf.extract(os.path.basename(path), os.path.dirname(path))
             os.remove(fname)
         else:
             url = "ftp://www.njleg.state.nj.us/ag/%sdata/DB%s.mdb" % (year, year)
             fname, resp = self.urlretrieve(url)
-            self.mdbfile = fname
-            self.info("mdb filename = " + fname)
+            shutil.move(fname, path)
+        self.mdbfile = path
+        self.info("mdb filename = " + path)
 
     # stolen from nm/bills.py
     def access_to_csv(self, table):
@@ -44,3 +54,15 @@ class MDBMixin(object):
         pipe = subprocess.Popen(commands, stdout=subprocess.PIPE, close_fds=True).stdout
         csvfile = csv.DictReader(line.decode() for line in pipe)
         return csvfile
+
+
+if __name__ == "__main__":
+    # fetch the current session's database ahead of the scrapers
+    import tempfile
+    from openstates.nj import NewJersey
+    from openstates.nj.bills import NJBillScraper
+
+    jurisdiction = NewJersey()
+    scraper = NJBillScraper(jurisdiction, tempfile.gettempdir())
+    session = scraper.latest_session()
+    scraper._init_mdb(((int(session) - 209) * 2) + 2000)
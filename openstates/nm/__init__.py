@@ -1,10 +1,5 @@
 from pupa.scrape import Jurisdiction, Organization
-from openstates.utils import url_xpath
-from .people import NMPersonScraper
-
-# from .committees import NMCommitteeScraper
-from .bills import NMBillScraper
-from .votes import NMVoteScraper
+from openstates.utils import url_xpath, LazyScrapers
 
 
 class NewMexico(Jurisdiction):
@@ -12,12 +7,15 @@ class NewMexico(Jurisdiction):
     classification = "government"
     name = "New Mexico"
     url = "https://www.nmlegis.gov"
-    scrapers = {
-        "people": NMPersonScraper,
-        # 'committees': NMCommitteeScraper,
-        "bills": NMBillScraper,
-        "votes": NMVoteScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:NMPersonScraper",
+            # "committees": "committees:NMCommitteeScraper",
+            "bills": "bills:NMBillScraper",
+            "votes": "votes:NMVoteScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2011 Regular",
@@ -0,0 +1,52 @@
+import tempfile
+import unittest
+
+from openstates.nm import NewMexico
+from openstates.nm.votes import NMVoteScraper
+
+# the layout pdftohtml gives a senate roll call, cut down to three members
+SENATE_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<pdf2xml>
+<page number="1" top="0" left="0" height="1000" width="800">
+<text top="20" left="50" width="80" height="12">01/18/2017</text>
+<text top="100" left="200" width="30" height="12"><b>YES</b></text>
+<text top="100" left="250" width="20" height="12"><b>NO</b></text>
+<text top="100" left="290" width="30" height="12"><b>ABS</b></text>
+<text top="141" left="50" width="60" height="12"><b>JONES</b></text>
+<text top="120" left="215" width="10" height="12">X</text>
+<text top="120" left="50" width="60" height="12">ONEILL</text>
+<text top="140" left="262" width="8" height="12">X</text>
+<text top="160" left="50" width="60" height="12">BROWN</text>
+<text top="160" left="310" width="8" height="12">X</text>
+<text top="180" left="50" width="60" height="12">TOTAL</text>
+<text top="180" left="215" width="10" height="12">1</text>
+<text top="180" left="262" width="8" height="12">1</text>
+<text top="180" left="310" width="8" height="12">1</text>
+</page>
+</pdf2xml>
+"""
+
+
+class TestVoteGrid(unittest.TestCase):
+    def setUp(self):
+        self.scraper = NMVoteScraper(NewMexico(), tempfile.gettempdir())
+
+    def test_senate_grid(self):
+        vote = self.scraper.parse_senate_vote(SENATE_XML, "sv.pdf", "2017", "SB 1")
+        self.assertEqual(vote.start_date, "2017-01-18")
+        self.assertEqual(vote.result, "fail")
+        self.assertEqual(
+            [(v["option"], v["voter_name"]) for v in vote.votes],
+            [("yes", "O'NEILL"), ("no", "JONES"), ("absent", "BROWN")],
+        )
+
+    def test_senate_totals_checked(self):
+        bad = SENATE_XML.replace(
+            'left="262" width="8" height="12">1', 'left="262" width="8" height="12">2'
+        )
+        with self.assertRaises(ValueError):
+            self.scraper.parse_senate_vote(bad, "sv.pdf", "2017", "SB 1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,15 +2,16 @@ import os
 import re
 import operator
 from datetime import datetime
-from bisect import bisect_left
 
 import lxml.html
-import lxml.etree
 import scrapelib
 
 from pupa.scrape import Scraper, VoteEvent
 from pupa.utils.generic import convert_pdf
 
+from openstates.utils.names import NameResolver
+from openstates.utils.textgrid import text_boxes, TextGrid, Columns
+
 # Senate vote header
 s_vote_header = re.compile(r"(YES)|(NO)|(ABS)|(EXC)|(REC)")
 # House vote header
@@ -19,6 +20,9 @@ h_vote_header = re.compile(r"(YEA(?!S))|(NAY(?!S))|(EXCUSED(?!:))|(ABSENT(?!:))"
 # Date regex for senate and house parser
 date_regex = re.compile(r"([0-1][0-9]/[0-3][0-9]/\d+)")
 
+# Cells in the same grid row can be a pixel or two apart, mixed fonts
+ROW_TOLERANCE = 2
+
 
 def convert_sv_char(c):
     """ logic for shifting senate vote characters to real ASCII """
@@ -33,26 +37,6 @@ def convert_sv_char(c):
             return c
 
 
-def match_header(row_cols, cell_x):
-    """ Map the data column to the header column, has to be done once for each
-        column. The columns of the headers(yes/no/etc) do not mach up *perfect*
-        with data in the grid due to random preceding whitespace and mixed
-        fonts"""
-    row_cols.sort()
-    c = bisect_left(row_cols, cell_x)
-    if c == 0:
-        return row_cols[0]
-    elif c == len(row_cols):
-        return row_cols[-1]
-
-    before = row_cols[c - 1]
-    after = row_cols[c]
-    if after - cell_x < cell_x - before:
-        return after
-    else:
-        return before
-
-
 def session_slug(session):
     session_type = "Special" if session.endswith("S") else "Regular"
     return "{}%20{}".format(session[2:4], session_type)
@@ -67,8 +51,12 @@ corrected_names = {
 }
 
 
-def correct_name(name):
-    return corrected_names[name] if name in corrected_names else name
+def convert_sv_name(text):
+    return "".join(convert_sv_char(c) for c in text)
+
+
+# Fix some odd encoding issues
+voter_names = NameResolver(clean=convert_sv_name, aliases=corrected_names)
 
 
 def build_vote(session, bill_id, url, vote_record, chamber, motion_text):
@@ -297,24 +285,18 @@ class NMVoteScraper(Scraper):
             "other": [],
         }
         row_heads = {}
-        column_map = {}
-        rows = {}
+        cells = []
         t_begin = 0
         t_stop = 0
         sane_row = 0
         # Take the mixed up text tag cells and separate header/special and
         # non-header cells.
         # Metadata hints that this doc is done by hand, tags appear in
-        # chrono order not visual
-        for tag in lxml.etree.XML(v_text).xpath("//text/b") + lxml.etree.XML(
-            v_text
-        ).xpath("//text"):
-            if tag.text is None:
-                continue
-            row_value = tag.text.strip()
-            if "top" not in tag.keys():
-                tag = tag.getparent()
-            top = int(tag.attrib["top"])
+        # chrono order not visual, so bold cells come first as they always
+        # have (later ones win when setting the table end point)
+        for box in sorted(text_boxes(v_text), key=lambda box: not box.bold):
+            row_value = box.text
+            top = box.top
             # name overrides
             if row_value in overrides:
                 row_value = overrides[row_value]
@@ -340,59 +322,41 @@ class NMVoteScraper(Scraper):
                         date_regex.search(row_value).group(), "%m/%d/%Y"
                     )
             elif vote_header.match(row_value):
-                row_heads[
-                    int(tag.attrib["left"]) + int(tag.attrib["width"])
-                ] = row_value
+                row_heads[box.right] = row_value
                 # Set the header begin sanity value
                 if t_begin == 0:
                     t_begin = top
             else:
-                # Create dictionary of row params and x,y
-                # location- y:{value, x, x(offset)}
-                if top in rows:
-                    rows[top].append(
-                        (row_value, int(tag.attrib["left"]), int(tag.attrib["width"]))
-                    )
-                else:
-                    rows[top] = [
-                        (row_value, int(tag.attrib["left"]), int(tag.attrib["width"]))
-                    ]
+                cells.append(box._replace(text=row_value))
+
+        grid = TextGrid(cells, tolerance=ROW_TOLERANCE)
+        # The columns of the headers(yes/no/etc) do not mach up *perfect*
+        # with data in the grid due to random preceding whitespace and mixed
+        # fonts, so each vote goes to the nearest header
+        columns = Columns(row_heads)
 
         # Mark the votes in the datagrid
-        for row_x, cells in rows.items():
-            if t_begin < row_x <= t_stop:
-                # Resort the row cells to go left to right, due to possile
-                # table pane switching
-                cells.sort(key=operator.itemgetter(1))
-                # Each vote grid is made up of split tables with two active
-                # columns
-                for x in range(0, len(cells), 2):
-                    if table_stop in cells[x][0]:
-                        break
-                    if x + 1 >= len(cells):
-                        self.warning("No vote found for {}".format(cells[x]))
-                        continue
-                    if cells[x + 1][1] not in column_map:
-                        # Called one time for each column heading
-                        # Map the data grid column to the header columns
-                        column_map[cells[x + 1][1]] = match_header(
-                            list(row_heads.keys()), cells[x + 1][1] + cells[x + 1][2]
-                        )
-                    vote_cast = row_heads[column_map[cells[x + 1][1]]]
-
-                    # Fix some odd encoding issues
-                    name = correct_name(
-                        "".join(convert_sv_char(c) for c in cells[x][0])
-                    )
-                    if "Y" == vote_cast[0]:
-                        vote_record["yes"].append(name)
-                    elif "N" == vote_cast[0]:
-                        vote_record["no"].append(name)
-                    elif "E" == vote_cast[0]:
-                        vote_record["excused"].append(name)
-                    elif "A" == vote_cast[0]:
-                        vote_record["absent"].append(name)
-                    else:
-                        vote_record["other"].append(name)
-
-        return vote_record, row_heads, rows[sane_row]
+        for row in grid.rows_between(t_begin, t_stop):
+            # Each vote grid is made up of split tables with two active
+            # columns
+            for x in range(0, len(row), 2):
+                if table_stop in row[x].text:
+                    break
+                if x + 1 >= len(row):
+                    self.warning("No vote found for {}".format(row[x].text))
+                    continue
+                vote_cast = columns.nearest(row[x + 1].right)
+
+                name = voter_names(row[x].text)
+                if "Y" == vote_cast[0]:
+                    vote_record["yes"].append(name)
+                elif "N" == vote_cast[0]:
+                    vote_record["no"].append(name)
+                elif "E" == vote_cast[0]:
+                    vote_record["excused"].append(name)
+                elif "A" == vote_cast[0]:
+                    vote_record["absent"].append(name)
+                else:
+                    vote_record["other"].append(name)
+
+        return vote_record, row_heads, grid.row_at(sane_row)
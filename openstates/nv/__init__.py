@@ -2,11 +2,8 @@ from utils.lxmlize import url_xpath
 from .utils import text_after_line_numbers, pdfdata_to_text
 
 from pupa.scrape import Jurisdiction, Organization
-from .people import NVPeopleScraper
 
-# from .committees import NVCommitteeScraper
-from .bills import NVBillScraper
-from .events import NVEventScraper
+from openstates.utils import LazyScrapers
 
 
 class Nevada(Jurisdiction):
@@ -14,12 +11,15 @@ class Nevada(Jurisdiction):
     classification = "government"
     name = "Nevada"
     url = "http://www.leg.state.nv.us/"
-    scrapers = {
-        "people": NVPeopleScraper,
-        # 'committees': NVCommitteeScraper,
-        "bills": NVBillScraper,
-        "events": NVEventScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:NVPeopleScraper",
+            # "committees": "committees:NVCommitteeScraper",
+            "bills": "bills:NVBillScraper",
+            "events": "events:NVEventScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "26th (2010) Special Session",
@@ -4,7 +4,7 @@ import time
 from datetime import datetime
 from collections import defaultdict
 import lxml.html
-from openstates.utils.lxmlize import LXMLMixin
+from openstates.utils.lxmlize import LXMLMixin, parse_response, absolute
 from pupa.scrape import Scraper, Bill
 from urllib.parse import unquote
 
@@ -97,15 +97,16 @@ class NVBillScraper(Scraper, LXMLMixin):
             listing_url = listing_url_base.format(
                 session_slug, doc_type, time.time() * 1000
             )
-            listing_page = lxml.html.fromstring(self.get(listing_url).text)
-            listing_page.make_links_absolute("https://www.leg.state.nv.us")
+            listing_page = parse_response(self.get(listing_url))
             bill_row_xpath = "//table/tr/td/span"
             for row in listing_page.xpath(bill_row_xpath):
-                link_url = row.xpath("a/@href")[0]
+                link_url = absolute(
+                    row.xpath("a/@href")[0], "https://www.leg.state.nv.us"
+                )
                 yield self.scrape_bill(session, session_slug, chamber, link_url)
 
     def scrape_bill(self, session, session_slug, chamber, url):
-        page = lxml.html.fromstring(self.get(url).text)
+        page = parse_response(self.get(url))
         bill_no = page.xpath('//*[@id="item-header"]/text()')[0].strip()
         # state bill id
         internal_id = re.search(r"\/Bill\/(\d+)\/Overview", url).group(1)
@@ -119,7 +120,7 @@ class NVBillScraper(Scraper, LXMLMixin):
             session_slug, internal_id, time.time() * 1000
         )
 
-        bill_page = lxml.html.fromstring(self.get(bill_data_url).text)
+        bill_page = parse_response(self.get(bill_data_url))
 
         short_title = self.get_header_field(bill_page, "Summary:").text
         short_title = short_title.replace(u"\u00a0", " ")
@@ -207,7 +208,7 @@ class NVBillScraper(Scraper, LXMLMixin):
         text_tab_url = text_tab_url_base.format(
             session_slug, internal_id, time.time() * 1000
         )
-        text_page = lxml.html.fromstring(self.get(text_tab_url).text)
+        text_page = parse_response(self.get(text_tab_url))
 
         version_links = text_page.xpath('//*[contains(@class,"text-revision-link")]')
         for link in version_links:
@@ -225,7 +226,7 @@ class NVBillScraper(Scraper, LXMLMixin):
                 session_slug, document_key, time.time() * 1000
             )
 
-            iframe_page = lxml.html.fromstring(self.get(iframe_url).text)
+            iframe_page = parse_response(self.get(iframe_url))
 
             # web-accessible filename is the final URL arg (encoded) in the iframe's SRC:
             # /App/NELIS/REL/80th2019/PDF/Viewer?
@@ -299,7 +300,7 @@ class NVBillScraper(Scraper, LXMLMixin):
         text_tab_url = text_tab_url_base.format(
             session_slug, internal_id, time.time() * 1000
         )
-        text_page = lxml.html.fromstring(self.get(text_tab_url).text)
+        text_page = parse_response(self.get(text_tab_url))
 
         note_links = text_page.xpath('//a[contains(@class,"text-icon-exhibit")]')
         for link in note_links:
@@ -1,13 +1,6 @@
 from pupa.scrape import Jurisdiction, Organization
 
-from openstates.utils import url_xpath
-
-from .bills import NYBillScraper
-from .events import NYEventScraper
-from .people import NYPersonScraper
-
-# from .committees import NYCommitteeScraper
-
+from openstates.utils import url_xpath, LazyScrapers
 
 settings = dict(SCRAPELIB_TIMEOUT=120)
 
@@ -17,12 +10,15 @@ class NewYork(Jurisdiction):
     classification = "government"
     name = "New York"
     url = "http://public.leginfo.state.ny.us/"
-    scrapers = {
-        "bills": NYBillScraper,
-        "events": NYEventScraper,
-        "people": NYPersonScraper,
-        # 'committees': NYCommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": "bills:NYBillScraper",
+            "events": "events:NYEventScraper",
+            "people": "people:NYPersonScraper",
+            # "committees": "committees:NYCommitteeScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2009",
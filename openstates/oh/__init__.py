@@ -1,10 +1,5 @@
 from pupa.scrape import Jurisdiction, Organization
-from openstates.utils import url_xpath
-
-from .people import OHLegislatorScraper
-
-# from .events import OHEventScraper
-from .bills import OHBillScraper
+from openstates.utils import url_xpath, LazyScrapers
 
 
 class Ohio(Jurisdiction):
@@ -12,11 +7,14 @@ class Ohio(Jurisdiction):
     classification = "government"
     name = "Ohio"
     url = "http://www.legislature.state.oh.us/"
-    scrapers = {
-        "people": OHLegislatorScraper,
-        # 'events': OHEventScraper,
-        "bills": OHBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:OHLegislatorScraper",
+            # "events": "events:OHEventScraper",
+            "bills": "bills:OHBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "128",
@@ -10,9 +10,12 @@ import lxml.html
 import pytz
 import re
 
+from openstates.utils import ordered_map, prefetch
+
 
 class OHBillScraper(Scraper):
     _tz = pytz.timezone("US/Eastern")
+    workers = 4
 
     def scrape(self, session=None, chambers=None):
         # Bills endpoint can sometimes take a very long time to load
@@ -97,55 +100,23 @@ class OHBillScraper(Scraper):
                 session=session
             )
             legislators = self.get_legislator_ids(first_page)
-            all_amendments = self.get_other_data_source(
-                first_page, base_url, "amendments"
+            # the four bulk sources are independent, so walk them at once
+            all_amendments, all_fiscals, all_synopsis, all_analysis = ordered_map(
+                lambda source_name: self.get_other_data_source(
+                    first_page, base_url, source_name
+                ),
+                ["amendments", "fiscals", "synopsiss", "analysiss"],
+                workers=4,
             )
-            all_fiscals = self.get_other_data_source(first_page, base_url, "fiscals")
-            all_synopsis = self.get_other_data_source(first_page, base_url, "synopsiss")
-            all_analysis = self.get_other_data_source(first_page, base_url, "analysiss")
-
-            for row in self.get_bill_rows(session):
-                (
-                    spacer,
-                    number_link,
-                    _ga,
-                    title,
-                    primary_sponsor,
-                    status,
-                    spacer,
-                ) = row.xpath("td")
-
-                # S.R.No.1 -> SR1
-                bill_id = number_link.text_content().replace("No.", "")
-                bill_id = bill_id.replace(".", "").replace(" ", "")
-                # put one space back in between type and number
-                bill_id = re.sub(r"([a-zA-Z]+)(\d+)", r"\1 \2", bill_id)
-
-                title = title.text_content().strip()
-                title = re.sub(r"^Title", "", title)
-
-                chamber = "lower" if "H" in bill_id else "upper"
-                classification = "bill" if "B" in bill_id else "resolution"
 
-                bill = Bill(
-                    bill_id,
-                    legislative_session=session,
-                    chamber=chamber,
-                    title=title,
-                    classification=classification,
-                )
-                bill.add_source(number_link.xpath("a/@href")[0])
-
-                # get bill from API
-                bill_api_url = (
-                    "http://search-prod.lis.state.oh.us/solarapi/v1/"
-                    "general_assembly_{}/{}/{}/".format(
-                        session,
-                        "bills" if "B" in bill_id else "resolutions",
-                        bill_id.lower().replace(" ", ""),
-                    )
-                )
-                data = self.get(bill_api_url).json()
+            # bill, action, vote, veto & disapprove JSON is fetched for
+            # several bills at once and then handled here in bill order
+            for bill, bill_api_url, data, docs in ordered_map(
+                lambda stub: stub + self.get_bill_json(base_url, stub[1]),
+                self.get_bill_stubs(session),
+                workers=self.workers,
+            ):
+                bill_id = bill.identifier
 
                 # add title if no short title
                 if not bill.title:
@@ -198,13 +169,8 @@ class OHBillScraper(Scraper):
                         primary=False,
                     )
 
-                try:
-                    action_doc = self.get(base_url + bill_version["action"][0]["link"])
-                except scrapelib.HTTPError:
-                    pass
-                else:
-
-                    actions = action_doc.json()
+                actions = docs["action"]
+                if not isinstance(actions, scrapelib.HTTPError):
                     for action in reversed(actions["items"]):
                         actor = chamber_dict[action["chamber"]]
                         action_desc = action["description"]
@@ -237,12 +203,10 @@ class OHBillScraper(Scraper):
 
                 # votes
                 vote_url = base_url + bill_version["votes"][0]["link"]
-                try:
-                    vote_doc = self.get(vote_url)
-                except scrapelib.HTTPError:
+                votes = docs["votes"]
+                if isinstance(votes, scrapelib.HTTPError):
                     self.warning("Vote page not loading; skipping: {}".format(vote_url))
                     continue
-                votes = vote_doc.json()
                 yield from self.process_vote(
                     votes,
                     vote_url,
@@ -255,12 +219,10 @@ class OHBillScraper(Scraper):
 
                 vote_url = base_url
                 vote_url += bill_version["cmtevotes"][0]["link"]
-                try:
-                    vote_doc = self.get(vote_url)
-                except scrapelib.HTTPError:
+                votes = docs["cmtevotes"]
+                if isinstance(votes, scrapelib.HTTPError):
                     self.warning("Vote page not loading; skipping: {}".format(vote_url))
                     continue
-                votes = vote_doc.json()
                 yield from self.process_vote(
                     votes,
                     vote_url,
@@ -293,7 +255,9 @@ class OHBillScraper(Scraper):
                 # life is fragile. so are our scrapers.
                 if "veto" in bill_version:
                     veto_url = base_url + bill_version["veto"][0]["link"]
-                    veto_json = self.get(veto_url).json()
+                    veto_json = docs["veto"]
+                    if isinstance(veto_json, scrapelib.HTTPError):
+                        raise veto_json
                     if len(veto_json["items"]) > 0:
                         raise AssertionError(
                             "Whoa, a veto! We've never"
@@ -304,7 +268,9 @@ class OHBillScraper(Scraper):
 
                 if "disapprove" in bill_version:
                     disapprove_url = base_url + bill_version["disapprove"][0]["link"]
-                    disapprove_json = self.get(disapprove_url).json()
+                    disapprove_json = docs["disapprove"]
+                    if isinstance(disapprove_json, scrapelib.HTTPError):
+                        raise disapprove_json
                     if len(disapprove_json["items"]) > 0:
                         raise AssertionError(
                             "Whoa, a disapprove! We've never"
@@ -324,23 +290,92 @@ class OHBillScraper(Scraper):
             page = page.json()
             yield page
 
-    def get_bill_rows(self, session, start=1):
+    def get_bill_rows(self, session):
         # bill API endpoint times out so we're now getting this from the normal search
-        bill_url = (
-            "https://www.legislature.ohio.gov/legislation/search?pageSize=500&start={}&"
-            "sort=LegislationNumber&dir=asc&statusCode&generalAssemblies={}"
-            "&legislationTypes=HR,HB,SR,SB,HCR,SCR,HJR,SJR".format(start, session)
-        )
-        doc = self.get(bill_url)
-        doc = lxml.html.fromstring(doc.text)
-        doc.make_links_absolute(bill_url)
-
-        rows = doc.xpath("//tr")[1:]
-        yield from rows
-        if len(rows) == 500:
-            yield from self.get_bill_rows(session, start + 500)
-        # if page is full, get next page - could use pagination info in
-        # //div[id="searchResultsInfo"] to improve this
+        start = 1
+        while True:
+            bill_url = (
+                "https://www.legislature.ohio.gov/legislation/search?pageSize=500"
+                "&start={}&sort=LegislationNumber&dir=asc&statusCode"
+                "&generalAssemblies={}"
+                "&legislationTypes=HR,HB,SR,SB,HCR,SCR,HJR,SJR".format(start, session)
+            )
+            doc = self.get(bill_url)
+            doc = lxml.html.fromstring(doc.text)
+            doc.make_links_absolute(bill_url)
+
+            rows = doc.xpath("//tr")[1:]
+            yield from rows
+            # if page is full, get next page - could use pagination info in
+            # //div[id="searchResultsInfo"] to improve this
+            if len(rows) < 500:
+                break
+            start += 500
+
+    def get_bill_stubs(self, session):
+        """ yields a (bill, bill_api_url) pair for each search result row """
+        for row in prefetch(self.get_bill_rows(session), depth=500):
+            (
+                spacer,
+                number_link,
+                _ga,
+                title,
+                primary_sponsor,
+                status,
+                spacer,
+            ) = row.xpath("td")
+
+            # S.R.No.1 -> SR1
+            bill_id = number_link.text_content().replace("No.", "")
+            bill_id = bill_id.replace(".", "").replace(" ", "")
+            # put one space back in between type and number
+            bill_id = re.sub(r"([a-zA-Z]+)(\d+)", r"\1 \2", bill_id)
+
+            title = title.text_content().strip()
+            title = re.sub(r"^Title", "", title)
+
+            chamber = "lower" if "H" in bill_id else "upper"
+            classification = "bill" if "B" in bill_id else "resolution"
+
+            bill = Bill(
+                bill_id,
+                legislative_session=session,
+                chamber=chamber,
+                title=title,
+                classification=classification,
+            )
+            bill.add_source(number_link.xpath("a/@href")[0])
+
+            bill_api_url = (
+                "http://search-prod.lis.state.oh.us/solarapi/v1/"
+                "general_assembly_{}/{}/{}/".format(
+                    session,
+                    "bills" if "B" in bill_id else "resolutions",
+                    bill_id.lower().replace(" ", ""),
+                )
+            )
+            yield bill, bill_api_url
+
+    def get_bill_json(self, base_url, bill_api_url):
+        """
+        Fetches a bill's API record and the action, vote, veto and disapprove
+        documents linked from its latest version.  Failed fetches of the
+        linked documents are returned in their place as the HTTPError.
+        """
+        data = self.get(bill_api_url).json()
+        bill_version = data["items"][0]
+
+        docs = {}
+        for doc_type in ("action", "votes", "cmtevotes", "veto", "disapprove"):
+            if doc_type not in bill_version:
+                continue
+            try:
+                docs[doc_type] = self.get(
+                    base_url + bill_version[doc_type][0]["link"]
+                ).json()
+            except scrapelib.HTTPError as e:
+                docs[doc_type] = e
+        return data, docs
 
     def get_other_data_source(self, first_page, base_url, source_name):
         # produces a dictionary from bill_id to a list of
@@ -351,7 +386,7 @@ class OHBillScraper(Scraper):
         # api calls
 
         bill_dict = {}
-        for page in self.pages(base_url, first_page + source_name):
+        for page in prefetch(self.pages(base_url, first_page + source_name)):
             for item in page["items"]:
                 billno = item["billno"]
                 if billno not in bill_dict:
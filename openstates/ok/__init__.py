@@ -1,9 +1,6 @@
 from pupa.scrape import Jurisdiction, Organization
-from .people import OKPersonScraper
 
-# from .committees import OKCommitteeScraper
-# from .events import OKEventScraper
-from .bills import OKBillScraper
+from openstates.utils import LazyScrapers
 
 
 class Oklahoma(Jurisdiction):
@@ -11,12 +8,15 @@ class Oklahoma(Jurisdiction):
     classification = "government"
     name = "Oklahoma"
     url = "http://www.oklegislature.gov/"
-    scrapers = {
-        "people": OKPersonScraper,
-        # 'committees': OKCommitteeScraper,
-        # 'events': OKEventScraper,
-        "bills": OKBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:OKPersonScraper",
+            # "committees": "committees:OKCommitteeScraper",
+            # "events": "events:OKEventScraper",
+            "bills": "bills:OKBillScraper",
+        },
+    )
     # Sessions are named on OK's website as "{odd year} regular session" until the even year,
     # when all data rolls over. For example, even year sessions include all odd-year-session bills.
     # We have opted to name sessions {odd-even} Regular Session and treat them as such.
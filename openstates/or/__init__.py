@@ -1,9 +1,6 @@
 from pupa.scrape import Jurisdiction, Organization
-from .people import ORPersonScraper
 
-# from .committees import ORCommitteeScraper
-from .bills import ORBillScraper
-from .votes import ORVoteScraper
+from openstates.utils import LazyScrapers
 
 
 class Oregon(Jurisdiction):
@@ -11,12 +8,15 @@ class Oregon(Jurisdiction):
     classification = "government"
     name = "Oregon"
     url = "https://olis.leg.state.or.us"
-    scrapers = {
-        "people": ORPersonScraper,
-        # 'committees': ORCommitteeScraper,
-        "bills": ORBillScraper,
-        "votes": ORVoteScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:ORPersonScraper",
+            # "committees": "committees:ORCommitteeScraper",
+            "bills": "bills:ORBillScraper",
+            "votes": "votes:ORVoteScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2007 Regular Session",
@@ -1,12 +1,6 @@
 from pupa.scrape import Jurisdiction, Organization
 
-from openstates.utils import url_xpath
-
-from .bills import PABillScraper
-from .events import PAEventScraper
-from .people import PALegislatorScraper
-
-# from .committees import PACommitteeScraper
+from openstates.utils import url_xpath, LazyScrapers
 
 settings = {"SCRAPELIB_RPM": 30}
 
@@ -16,12 +10,15 @@ class Pennsylvania(Jurisdiction):
     classification = "government"
     name = "Pennsylvania"
     url = "http://www.legis.state.pa.us/"
-    scrapers = {
-        "bills": PABillScraper,
-        "events": PAEventScraper,
-        "people": PALegislatorScraper,
-        # 'committees': PACommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": "bills:PABillScraper",
+            "events": "events:PAEventScraper",
+            "people": "people:PALegislatorScraper",
+            # "committees": "committees:PACommitteeScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2009-2010 Regular Session",
@@ -1,8 +1,6 @@
 from pupa.scrape import Jurisdiction, Organization
-from .people import PRPersonScraper
 
-# from .committees import PRCommitteeScraper
-from .bills import PRBillScraper
+from openstates.utils import LazyScrapers
 
 settings = dict(SCRAPELIB_TIMEOUT=300)
 
@@ -12,11 +10,14 @@ class PuertoRico(Jurisdiction):
     classification = "government"
     name = "Puerto Rico"
     url = "http://www.oslpr.org/"
-    scrapers = {
-        "people": PRPersonScraper,
-        # 'committees': PRCommitteeScraper,
-        "bills": PRBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:PRPersonScraper",
+            # "committees": "committees:PRCommitteeScraper",
+            "bills": "bills:PRBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2009-2012",
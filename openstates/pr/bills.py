@@ -4,6 +4,8 @@ import lxml.html
 import datetime
 import itertools
 from pupa.scrape import Scraper, Bill, VoteEvent as Vote
+from openstates.utils import XPathFields
+from openstates.utils.actions import PatternClassifier
 
 
 class NoSuchBill(Exception):
@@ -49,6 +51,10 @@ _classifiers = (
     ),
     ("Ley N", "executive", "executive-signature"),
 )
+_classify_action = PatternClassifier(
+    ((pattern, (actor, atype)) for pattern, actor, atype in _classifiers),
+    default=("", None),
+)
 
 
 class PRBillScraper(Scraper):
@@ -61,6 +67,14 @@ class PRBillScraper(Scraper):
         # 'PR': 'plan de reorganizacion',
     }
 
+    bill_fields = XPathFields(
+        # search for Titulo, accent over i messes up lxml, so use 'tulo'
+        title='//td/b[contains(text(),"tulo")]/../following-sibling::td/text()',
+        authors='//td/b[contains(text(),"Autor")]/../text()',
+        co_authors='//td/b[contains(text(),"Co-autor")]/../text()',
+        tables="//table",
+    )
+
     def clean_name(self, name):
         for ch in ["Sr,", "Sr.", "Sra.", "Rep.", "Sen."]:
             if ch in name:
@@ -138,12 +152,7 @@ class PRBillScraper(Scraper):
                     )
             else:
                 bill.add_document_link(action, action_url, on_duplicate="ignore")
-            for pattern, action_actor, atype in _classifiers:
-                if re.match(pattern, action):
-                    break
-                else:
-                    action_actor = ""
-                    atype = None
+            action_actor, atype = _classify_action(action)
         if action_actor == "":
             if action.find("SENADO") != -1:
                 action_actor = "upper"
@@ -171,10 +180,8 @@ class PRBillScraper(Scraper):
             self.warning("asp error on page, skipping %s", bill_id)
             return
         doc = lxml.html.fromstring(html)
-        # search for Titulo, accent over i messes up lxml, so use 'tulo'
-        title = doc.xpath(
-            u'//td/b[contains(text(),"tulo")]/../following-sibling::td/text()'
-        )
+        fields = self.bill_fields.extract(doc)
+        title = fields["title"]
         if not title:
             raise NoSuchBill()
 
@@ -186,7 +193,7 @@ class PRBillScraper(Scraper):
             classification=bill_type,
         )
 
-        author = doc.xpath(u'//td/b[contains(text(),"Autor")]/../text()')[0]
+        author = fields["authors"][0]
         for aname in author.split(","):
             aname = self.clean_name(aname).strip()
             if aname:
@@ -194,7 +201,7 @@ class PRBillScraper(Scraper):
                     aname, classification="primary", entity_type="person", primary=True
                 )
 
-        co_authors = doc.xpath(u'//td/b[contains(text(),"Co-autor")]/../text()')
+        co_authors = fields["co_authors"]
         if len(co_authors) != 0:
             for co_author in co_authors[1].split(","):
                 bill.add_sponsorship(
@@ -204,7 +211,7 @@ class PRBillScraper(Scraper):
                     primary=False,
                 )
 
-        action_table = doc.xpath("//table")[-1]
+        action_table = fields["tables"][-1]
         bill_vote_chamber = None
         for row in action_table[1:]:
             tds = row.xpath("td")
@@ -1,13 +1,6 @@
 from pupa.scrape import Jurisdiction, Organization
 
-from openstates.utils import url_xpath
-
-from .bills import RIBillScraper
-
-# from .events import RIEventScraper
-from .people import RIPersonScraper
-
-# from .committees import RICommitteeScraper
+from openstates.utils import url_xpath, LazyScrapers
 
 
 class RhodeIsland(Jurisdiction):
@@ -15,12 +8,15 @@ class RhodeIsland(Jurisdiction):
     classification = "government"
     name = "Rhode Island"
     url = "http://www.ri.gov/"
-    scrapers = {
-        "bills": RIBillScraper,
-        # 'events': RIEventScraper,
-        "people": RIPersonScraper,
-        # 'committees': RICommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": "bills:RIBillScraper",
+            # "events": "events:RIEventScraper",
+            "people": "people:RIPersonScraper",
+            # "committees": "committees:RICommitteeScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2012",
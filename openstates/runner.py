@@ -0,0 +1,316 @@
+"""
+    Runs many jurisdictions' scrapes at once.
+
+    Each job is one ``pupa update <state> <scraper>`` process.  Jobs are
+    started longest critical path first, using how long each took last time,
+    so the slowest states (CA, TX, NY...) start straight away instead of
+    behind a queue of quick ones:
+
+        python -m openstates.runner                 # every jurisdiction
+        python -m openstates.runner ca tx ny --workers 8 --scrapers bills,votes
+
+    Politeness is enforced across the whole run: no more than ``--per-host``
+    jobs talk to the same legislature site at a time, each throttled by
+    scrapelib as usual.
+
+    Some jurisdictions need data loaded before their scrapers can run; those
+    steps are jobs of their own that the scrapers depend on (see
+    ``PREREQUISITES``), so they happen once per run.
+"""
+import os
+import sys
+import time
+import shlex
+import logging
+import argparse
+import importlib
+import pkgutil
+import subprocess
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from openstates.utils import JSONStore
+
+logger = logging.getLogger("openstates.runner")
+
+# jurisdiction -> [(name, command, scrapers that need it)]
+PREREQUISITES = {
+    # capublic MySQL database the CA bill & event scrapers query
+    "ca": [("capublic", ["-m", "openstates.ca.download"], ("bills", "events"))],
+    # Access database shared by all NJ scrapers
+    "nj": [
+        (
+            "mdb",
+            ["-m", "openstates.nj.utils"],
+            ("bills", "committees", "events", "people"),
+        )
+    ],
+}
+
+# within a jurisdiction, imports resolve against what earlier scrapers stored
+SCRAPER_REQUIRES = {
+    "committees": ("people",),
+    "bills": ("people",),
+    "votes": ("bills",),
+}
+
+NOT_JURISDICTIONS = {"benchmarks", "tests", "utils"}
+
+
+class Job(object):
+    """One process to run.
+
+    Args:
+        name (str): e.g. ``"tx:bills"``.
+        command (List[str]): Arguments to execute.
+        host (str): Site the job scrapes, for politeness limits.
+        requires (List[str]): Names of jobs that must succeed first.
+    """
+
+    def __init__(self, name, command, host, requires=()):
+        self.name = name
+        self.command = command
+        self.host = host
+        self.requires = set(requires)
+        self.priority = 0.0
+
+    def __repr__(self):
+        return "Job({!r})".format(self.name)
+
+
+def find_jurisdictions():
+    """Lists the jurisdiction packages, e.g. ``["ak", "al", ...]``."""
+    here = os.path.dirname(__file__)
+    return sorted(
+        name
+        for _, name, is_pkg in pkgutil.iter_modules([here])
+        if is_pkg and name not in NOT_JURISDICTIONS
+    )
+
+
+def load_jurisdiction(abbr):
+    """Returns the pupa ``Jurisdiction`` class in ``openstates.<abbr>``."""
+    from pupa.scrape import Jurisdiction
+
+    module = importlib.import_module("openstates." + abbr)
+    for obj in module.__dict__.values():
+        if (
+            isinstance(obj, type)
+            and issubclass(obj, Jurisdiction)
+            and getattr(obj, "division_id", None)
+        ):
+            return obj
+    raise ValueError("no Jurisdiction in openstates." + abbr)
+
+
+def build_jobs(abbrs, scrapers=None, pupa_args=(), datadir="_data"):
+    """Creates the jobs for scraping ``abbrs``, prerequisites included.
+
+    Args:
+        abbrs (List[str]): Jurisdictions to run.
+        scrapers (List[str]): Scraper types to run where available, defaults
+            to all of each jurisdiction's.
+        pupa_args (List[str]): Extra arguments to every ``pupa update``.
+        datadir (str): Each job writes its JSON under its own directory here.
+    Returns:
+        List[Job]
+    """
+    jobs = []
+    for abbr in abbrs:
+        jurisdiction = load_jurisdiction(abbr)
+        host = urlparse(jurisdiction.url).hostname or abbr
+        names = [
+            name
+            for name in jurisdiction.scrapers
+            if scrapers is None or name in scrapers
+        ]
+
+        prerequisites = {}
+        for prereq, args, needed_by in PREREQUISITES.get(abbr, ()):
+            if set(needed_by) & set(names):
+                job = Job(
+                    "{}:{}".format(abbr, prereq), [sys.executable] + list(args), host
+                )
+                jobs.append(job)
+                for name in needed_by:
+                    prerequisites.setdefault(name, []).append(job.name)
+
+        for name in names:
+            requires = prerequisites.get(name, []) + [
+                "{}:{}".format(abbr, other)
+                for other in SCRAPER_REQUIRES.get(name, ())
+                if other in names
+            ]
+            command = [
+                "pupa",
+                "update",
+                abbr,
+                name,
+                "--datadir",
+                os.path.join(datadir, "{}-{}".format(abbr, name)),
+            ] + list(pupa_args)
+            jobs.append(Job("{}:{}".format(abbr, name), command, host, requires))
+    return jobs
+
+
+def prioritize(jobs, runtimes):
+    """Sets each job's priority to the longest chain of runtimes it starts.
+
+    Jobs that have never run are assumed to be as slow as the slowest known
+    job, so they're started early rather than risk ending up on the critical
+    path.
+    """
+    default = max(runtimes.values()) if runtimes else 1.0
+    dependents = {job.name: [] for job in jobs}
+    for job in jobs:
+        for name in job.requires:
+            if name in dependents:
+                dependents[name].append(job)
+
+    done = {}
+
+    def chain(job):
+        if job.name not in done:
+            done[job.name] = runtimes.get(job.name, default) + max(
+                [chain(d) for d in dependents[job.name]] or [0.0]
+            )
+        return done[job.name]
+
+    for job in jobs:
+        job.priority = chain(job)
+
+
+class Runner(object):
+    """Runs jobs in parallel, respecting dependencies and per-host limits.
+
+    Args:
+        jobs (List[Job]): What to run.
+        workers (int): Maximum jobs at once.
+        per_host (int): Maximum jobs at once against one host.
+        logdir (str): Each job's output goes to ``<logdir>/<name>.log``.
+        history (JSONStore): Where runtimes are kept between runs.
+    """
+
+    def __init__(self, jobs, workers=4, per_host=1, logdir="_logs", history=None):
+        self.jobs = {job.name: job for job in jobs}
+        self.workers = workers
+        self.per_host = per_host
+        self.logdir = logdir
+        self.history = history if history is not None else JSONStore("runner")
+        self.runtimes = self.history.get("runtimes", {})
+        # name -> "ok", "failed" or "skipped"
+        self.results = {}
+
+    def _run(self, job, env):
+        path = os.path.join(self.logdir, job.name.replace(":", "-") + ".log")
+        start = time.time()
+        with open(path, "w") as log:
+            code = subprocess.call(
+                job.command, stdout=log, stderr=subprocess.STDOUT, env=env
+            )
+        return code, time.time() - start
+
+    def _ready(self, pending, running_hosts):
+        """Returns the highest-priority job that can start now, if any."""
+        for job in sorted(pending, key=lambda j: (-j.priority, j.name)):
+            if not job.requires.issubset(self.results):
+                continue
+            if running_hosts.get(job.host, 0) >= self.per_host:
+                continue
+            return job
+
+    def run(self):
+        """Runs everything, returning True if every job succeeded."""
+        os.makedirs(self.logdir, exist_ok=True)
+        prioritize(list(self.jobs.values()), self.runtimes)
+
+        env = dict(os.environ, OPENSTATES_RUN_STARTED=str(time.time()))
+        pending = set(self.jobs.values())
+        running = {}
+        running_hosts = {}
+
+        with ThreadPoolExecutor(self.workers) as pool:
+            while pending or running:
+                # anything depending on a failure won't work either
+                for job in list(pending):
+                    if any(
+                        self.results.get(name, "ok") != "ok" for name in job.requires
+                    ):
+                        pending.remove(job)
+                        self.results[job.name] = "skipped"
+                        logger.warning("skipping %s", job.name)
+
+                while len(running) < self.workers:
+                    job = self._ready(pending, running_hosts)
+                    if job is None:
+                        break
+                    pending.remove(job)
+                    running_hosts[job.host] = running_hosts.get(job.host, 0) + 1
+                    logger.info("starting %s", job.name)
+                    running[pool.submit(self._run, job, env)] = job
+
+                if not running:
+                    # requirements that aren't jobs in this run
+                    for job in pending:
+                        self.results[job.name] = "skipped"
+                        logger.warning("skipping %s, missing requirements", job.name)
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    job = running.pop(future)
+                    running_hosts[job.host] -= 1
+                    code, seconds = future.result()
+                    if code == 0:
+                        self.results[job.name] = "ok"
+                        self.runtimes[job.name] = seconds
+                        logger.info("finished %s in %.0fs", job.name, seconds)
+                    else:
+                        self.results[job.name] = "failed"
+                        logger.error(
+                            "%s failed with exit code %s after %.0fs",
+                            job.name,
+                            code,
+                            seconds,
+                        )
+
+        self.history.set("runtimes", self.runtimes)
+        return all(result == "ok" for result in self.results.values())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m openstates.runner",
+        description="Scrape many jurisdictions in parallel.",
+    )
+    parser.add_argument("jurisdictions", nargs="*", help="e.g. ca tx, default all")
+    parser.add_argument("--scrapers", help="comma-separated, e.g. bills,votes")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    parser.add_argument(
+        "--per-host", type=int, default=1, help="jobs at once against one site"
+    )
+    parser.add_argument("--datadir", default="_data")
+    parser.add_argument("--logdir", default="_logs")
+    parser.add_argument(
+        "--pupa-args", default="", help='passed to pupa update, e.g. "--fastmode"'
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s"
+    )
+
+    jobs = build_jobs(
+        args.jurisdictions or find_jurisdictions(),
+        scrapers=args.scrapers.split(",") if args.scrapers else None,
+        pupa_args=shlex.split(args.pupa_args),
+        datadir=args.datadir,
+    )
+    runner = Runner(
+        jobs, workers=args.workers, per_host=args.per_host, logdir=args.logdir
+    )
+    return 0 if runner.run() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
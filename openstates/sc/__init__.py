@@ -1,11 +1,10 @@
 from pupa.scrape import Jurisdiction, Organization
-from .people import SCPersonScraper
-from .bills import SCBillScraper
-from .events import SCEventScraper
 
 import requests
 import lxml.html
 
+from openstates.utils import LazyScrapers
+
 
 class SouthCarolina(Jurisdiction):
     """
@@ -17,11 +16,14 @@ class SouthCarolina(Jurisdiction):
     classification = "government"
     name = "South Carolina"
     url = "http://www.scstatehouse.gov/"
-    scrapers = {
-        "people": SCPersonScraper,
-        "bills": SCBillScraper,
-        "events": SCEventScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:SCPersonScraper",
+            "bills": "bills:SCBillScraper",
+            "events": "events:SCEventScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "119 - (2011-2012)",
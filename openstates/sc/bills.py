@@ -8,6 +8,7 @@ from functools import wraps
 
 from pupa.scrape import Scraper, Bill, VoteEvent
 from pupa.utils.generic import convert_pdf
+from openstates.utils.actions import PrefixClassifier
 import lxml.html
 import urllib
 
@@ -41,15 +42,9 @@ def toggle_http_version(method):
     return wrapper
 
 
-def action_type(action):
-    """
-    Used to standardise the bill actions to the terms specified
-    @ https://opencivicdata.readthedocs.io/en/latest/scrape/bills.html
-    :param scraped action:
-    :return opencivicdata action:
-    """
-    # http://www.scstatehouse.gov/actionsearch.php is very useful for this
-    classifiers = (
+# http://www.scstatehouse.gov/actionsearch.php is very useful for this
+ACTION_CLASSIFIER = PrefixClassifier(
+    (
         ("Adopted", "passage"),
         ("Amended and adopted", ["passage", "amendment-passage"]),
         ("Amended", "amendment-passage"),
@@ -83,12 +78,19 @@ def action_type(action):
         ("Veto overridden", "veto-override-passage"),
         ("Veto sustained", "veto-override-failure"),
         ("Vetoed by Governor", "executive-veto"),
-    )
-    for prefix, atype in classifiers:
-        if action.lower().startswith(prefix.lower()):
-            return atype
-    # otherwise
-    return None
+    ),
+    ignore_case=True,
+)
+
+
+def action_type(action):
+    """
+    Used to standardise the bill actions to the terms specified
+    @ https://opencivicdata.readthedocs.io/en/latest/scrape/bills.html
+    :param scraped action:
+    :return opencivicdata action:
+    """
+    return ACTION_CLASSIFIER(action)
 
 
 class SCBillScraper(Scraper):
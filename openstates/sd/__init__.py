@@ -1,8 +1,8 @@
 from pupa.scrape import Jurisdiction, Organization
 import scrapelib
 import lxml.html
-from .people import SDLegislatorScraper
-from .bills import SDBillScraper
+
+from openstates.utils import LazyScrapers
 
 
 class SouthDakota(Jurisdiction):
@@ -10,7 +10,10 @@ class SouthDakota(Jurisdiction):
     classification = "government"
     name = "South Dakota"
     url = "http://www.sdlegislature.gov/"
-    scrapers = {"people": SDLegislatorScraper, "bills": SDBillScraper}
+    scrapers = LazyScrapers(
+        __name__,
+        {"people": "people:SDLegislatorScraper", "bills": "bills:SDBillScraper"},
+    )
     legislative_sessions = [
         {"_scraped_name": "2009", "identifier": "2009", "name": "2009 Regular Session"},
         {"_scraped_name": "2010", "identifier": "2010", "name": "2010 Regular Session"},
@@ -0,0 +1,86 @@
+import sys
+import shutil
+import tempfile
+import unittest
+
+from openstates.runner import Job, Runner, prioritize
+
+
+class MemoryStore(dict):
+    def set(self, key, value):
+        self[key] = value
+
+
+def job(name, host="example.com", requires=(), code=0):
+    # records when it ran in the log, then exits with ``code``
+    script = "import time; print(time.time()); time.sleep(0.05); exit({})".format(code)
+    return Job(name, [sys.executable, "-c", script], host, requires)
+
+
+class TestPrioritize(unittest.TestCase):
+    def test_critical_path_first(self):
+        jobs = [
+            Job("ca:capublic", [], "ca"),
+            Job("ca:bills", [], "ca", ["ca:capublic"]),
+            Job("tx:bills", [], "tx"),
+            Job("ak:bills", [], "ak"),
+        ]
+        prioritize(jobs, {"ca:capublic": 10, "ca:bills": 50, "tx:bills": 40})
+        priorities = {j.name: j.priority for j in jobs}
+        self.assertEqual(priorities["ca:capublic"], 60)
+        self.assertEqual(priorities["ca:bills"], 50)
+        self.assertEqual(priorities["tx:bills"], 40)
+        # unknown jobs count as the slowest known one
+        self.assertEqual(priorities["ak:bills"], 50)
+
+
+class TestRunner(unittest.TestCase):
+    def setUp(self):
+        self.logdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.logdir)
+
+    def started(self, name):
+        with open("{}/{}.log".format(self.logdir, name.replace(":", "-"))) as f:
+            return float(f.read())
+
+    def test_dependencies_and_history(self):
+        history = MemoryStore()
+        runner = Runner(
+            [job("nj:mdb"), job("nj:bills", requires=["nj:mdb"])],
+            workers=4,
+            per_host=4,
+            logdir=self.logdir,
+            history=history,
+        )
+        self.assertTrue(runner.run())
+        self.assertGreater(self.started("nj:bills"), self.started("nj:mdb"))
+        self.assertEqual(set(history["runtimes"]), {"nj:mdb", "nj:bills"})
+
+    def test_per_host_limit(self):
+        runner = Runner(
+            [job("a:bills", "a.gov"), job("a:votes", "a.gov"), job("b:bills", "b.gov")],
+            workers=4,
+            per_host=1,
+            logdir=self.logdir,
+            history=MemoryStore(),
+        )
+        self.assertTrue(runner.run())
+        a = sorted([self.started("a:bills"), self.started("a:votes")])
+        self.assertGreaterEqual(a[1] - a[0], 0.05)
+
+    def test_failure_skips_dependents(self):
+        runner = Runner(
+            [job("ca:capublic", code=1), job("ca:bills", requires=["ca:capublic"])],
+            logdir=self.logdir,
+            history=MemoryStore(),
+        )
+        self.assertFalse(runner.run())
+        self.assertEqual(
+            runner.results, {"ca:capublic": "failed", "ca:bills": "skipped"}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
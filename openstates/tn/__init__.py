@@ -1,12 +1,6 @@
 from pupa.scrape import Jurisdiction, Organization
 
-from openstates.utils import url_xpath
-
-from .bills import TNBillScraper
-
-# from .committees import TNCommitteeScraper
-from .events import TNEventScraper
-from .people import TNPersonScraper
+from openstates.utils import url_xpath, LazyScrapers
 
 
 class Tennessee(Jurisdiction):
@@ -14,12 +8,15 @@ class Tennessee(Jurisdiction):
     classification = "government"
     name = "Tennessee"
     url = "http://www.capitol.tn.gov/"
-    scrapers = {
-        "bills": TNBillScraper,
-        # 'committees': TNCommitteeScraper,
-        "events": TNEventScraper,
-        "people": TNPersonScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": "bills:TNBillScraper",
+            # "committees": "committees:TNCommitteeScraper",
+            "events": "events:TNEventScraper",
+            "people": "people:TNPersonScraper",
+        },
+    )
     legislative_sessions = [
         # {
         #     "_scraped_name": "106th General Assembly",
@@ -1,12 +1,6 @@
 from pupa.scrape import Jurisdiction, Organization
 
-from openstates.utils import url_xpath
-from .bills import TXBillScraper
-
-# from .committees import TXCommitteeScraper
-from .events import TXEventScraper
-from .people import TXPersonScraper
-from .votes import TXVoteScraper
+from openstates.utils import url_xpath, LazyScrapers
 
 
 class Texas(Jurisdiction):
@@ -14,14 +8,17 @@ class Texas(Jurisdiction):
     classification = "government"
     name = "Texas"
     url = "https://capitol.texas.gov/"
-    scrapers = {
-        "people": TXPersonScraper,
-        # 'committees': TXCommitteeScraper,
-        "bills": TXBillScraper,
-        # Re-enable vote scraper when adding next regular session
-        "votes": TXVoteScraper,
-        "events": TXEventScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:TXPersonScraper",
+            # "committees": "committees:TXCommitteeScraper",
+            "bills": "bills:TXBillScraper",
+            # Re-enable vote scraper when adding next regular session
+            "votes": "votes:TXVoteScraper",
+            "events": "events:TXEventScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "81(R) - 2009",
@@ -24,6 +24,25 @@ class TestVoteParsing(unittest.TestCase):
         self.assertTrue(mv.is_valid)
         self.assertFalse(mv.is_amendment)
 
+    def test_names(self):
+        el = lxml.html.fragment_fromstring(
+            "<div>Yeas \u2014 Martinez Fischer; Bettencourt; Birdwell; Martinez Fischer;"
+            " Campbell; Creighton; Rios Ybarra.</div>"
+        )
+        # the special cases only apply to names that aren't first or last
+        self.assertEqual(
+            votes.names(el),
+            [
+                "Martinez Fischer",
+                "Bettencourt",
+                "Birdwell",
+                "Fischer",
+                "Campbell",
+                "Creighton",
+                "Rios Ybarra",
+            ],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -8,6 +8,8 @@ import collections
 import lxml.html
 from pupa.scrape import Scraper, VoteEvent
 
+from openstates.utils.names import NameResolver
+
 
 def next_tag(el):
     """
@@ -61,15 +63,8 @@ def names(el):
         # probably failed to properly split on semi-colons; try commas:
         split_name_list = text.split(",")
 
-    names = []
-    for name in split_name_list:
-        name = name.strip().replace("\r\n", "").replace("  ", " ")
-
-        if not name:
-            continue
-
-        name = clean_name_special_cases(name)
-        names.append(name)
+    names = [name.strip() for name in split_name_list]
+    names = voter_names.resolve_all(name for name in names if name)
 
     if names:
         # First item in the list will have stuff to ignore before an mdash
@@ -80,6 +75,11 @@ def names(el):
     return names
 
 
+def clean_name(name):
+    name = name.strip().replace("\r\n", "").replace("  ", " ")
+    return clean_name_special_cases(name)
+
+
 def clean_name_special_cases(name):
     if name == "Gonzalez Toureilles":
         name = "Toureilles"
@@ -92,6 +92,9 @@ def clean_name_special_cases(name):
     return name
 
 
+voter_names = NameResolver(clean=clean_name)
+
+
 def clean_starting_name(name):
     return re.split(r"[\u2014:]", name)[-1]
 
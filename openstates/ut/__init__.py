@@ -2,13 +2,7 @@ import re
 
 from pupa.scrape import Jurisdiction, Organization
 
-from openstates.utils import url_xpath
-
-from .people import UTPersonScraper
-from .events import UTEventScraper
-
-# from .committees import UTCommitteeScraper
-from .bills import UTBillScraper
+from openstates.utils import url_xpath, LazyScrapers
 
 
 class Utah(Jurisdiction):
@@ -16,12 +10,15 @@ class Utah(Jurisdiction):
     classification = "government"
     name = "Utah"
     url = "http://le.utah.gov/"
-    scrapers = {
-        "people": UTPersonScraper,
-        "events": UTEventScraper,
-        # 'committees': UTCommitteeScraper,
-        "bills": UTBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:UTPersonScraper",
+            "events": "events:UTEventScraper",
+            # "committees": "committees:UTCommitteeScraper",
+            "bills": "bills:UTBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2011 General Session",
@@ -1,7 +1,15 @@
 import re
 
 from .lxmlize import LXMLMixin  # noqa
-from .lxmlize import url_xpath  # noqa
+from .lxmlize import url_xpath, parse_html, parse_response, absolute  # noqa
+from .lxmlize import XPathFields, compile_xpath  # noqa
+from .concurrency import ordered_map, prefetch, RateLimiter  # noqa
+from .cache import cache_path, fetched_this_run, JSONStore  # noqa
+from .billstore import BillStore  # noqa
+from .snapshots import SessionSnapshots  # noqa
+from .names import NameResolver  # noqa
+from .lazy import LazyScrapers  # noqa
+from .aspnet import PostBackSession, hidden_state, post_back_args  # noqa
 
 
 def validate_phone_number(phone_number):
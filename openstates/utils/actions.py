@@ -1,4 +1,5 @@
 import re
+import functools
 from collections import namedtuple, defaultdict, Iterable
 from six import string_types
 
@@ -144,3 +145,95 @@ class BaseCategorizer(object):
     def post_categorize(self, return_val):
         """A post-categorization hook. Takes & returns attrs dict.  """
         return return_val
+
+
+_END = object()
+
+
+class _TableClassifier(object):
+    """Shared call & memoization for the table classifiers below.
+
+    Actions repeat a lot ("Referred to Committee on ..." for every bill), so
+    recent results are cached.
+    """
+
+    cache_size = 16384
+
+    def __init__(self, default):
+        self.default = default
+        self._cached = functools.lru_cache(maxsize=self.cache_size)(self.classify)
+
+    def __call__(self, action):
+        return self._cached(action)
+
+
+class PrefixClassifier(_TableClassifier):
+    """Classifies an action by the first ``(prefix, value)`` entry of a
+    table that it starts with.
+
+    The table is compiled into a trie up front, so classifying takes one
+    walk over the start of the action however long the table is.
+
+    Args:
+        table (Iterable[tuple]): ``(prefix, value)`` pairs, earlier wins.
+        ignore_case (bool): Compare prefixes case-insensitively.
+        default: Returned for actions no entry matches.
+    """
+
+    def __init__(self, table, ignore_case=False, default=None):
+        super(PrefixClassifier, self).__init__(default)
+        self.ignore_case = ignore_case
+        self._trie = {}
+        for rank, (prefix, value) in enumerate(table):
+            if ignore_case:
+                prefix = prefix.lower()
+            node = self._trie
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node.setdefault(_END, (rank, value))
+
+    def classify(self, action):
+        if self.ignore_case:
+            action = action.lower()
+        node = self._trie
+        best = node.get(_END)
+        for char in action:
+            node = node.get(char)
+            if node is None:
+                break
+            end = node.get(_END)
+            if end is not None and (best is None or end[0] < best[0]):
+                best = end
+        return self.default if best is None else best[1]
+
+
+class PatternClassifier(_TableClassifier):
+    """Classifies an action by the first ``(regex, value)`` entry of a table
+    whose regex matches at its start, as ``re.match`` would.
+
+    The regexes are compiled into one alternation up front, so an action is
+    matched in a single call rather than one per entry.  They may contain
+    groups, but not numbered backreferences.
+
+    Args:
+        table (Iterable[tuple]): ``(regex, value)`` pairs, earlier wins.
+        flags (int): ``re`` flags for all of the regexes.
+        default: Returned for actions no entry matches.
+    """
+
+    def __init__(self, table, flags=0, default=None):
+        super(PatternClassifier, self).__init__(default)
+        alternatives = []
+        self._values = []
+        for rank, (regex, value) in enumerate(table):
+            # the group around each entry is the last to close when it
+            # matches, so lastgroup names the entry
+            alternatives.append("(?P<_{}>{})".format(rank, regex))
+            self._values.append(value)
+        self._regex = re.compile("|".join(alternatives), flags)
+
+    def classify(self, action):
+        match = self._regex.match(action)
+        if match is None:
+            return self.default
+        return self._values[int(match.lastgroup[1:])]
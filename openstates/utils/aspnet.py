@@ -0,0 +1,121 @@
+import re
+from html import unescape
+from urllib.parse import urljoin
+
+import lxml.html
+
+# ASP.NET keeps page state in hidden inputs named __VIEWSTATE,
+# __EVENTVALIDATION and friends; these are all a postback needs, so they are
+# picked out of the raw markup rather than walking every input in the form.
+_STATE_INPUT_RE = re.compile(r"<input\b[^>]*\bname=\"(__\w+)\"[^>]*>", re.I)
+_VALUE_RE = re.compile(r"\bvalue=\"([^\"]*)\"", re.I)
+_FORM_RE = re.compile(r"<form\b[^>]*>", re.I)
+_ATTR_RE = re.compile(r"\b(action|method)=\"([^\"]*)\"", re.I)
+_POST_BACK_RE = re.compile(r"__doPostBack\('([^']*)','([^']*)'\)")
+
+
+def hidden_state(text):
+    """Scans page markup for ASP.NET ``__*`` state fields.
+
+    Args:
+        text (str): HTML of an ASP.NET page.
+    Returns:
+        dict: Field name to value, e.g. ``__VIEWSTATE`` and
+            ``__EVENTVALIDATION``.
+    """
+    state = {}
+    for match in _STATE_INPUT_RE.finditer(text):
+        value = _VALUE_RE.search(match.group(0))
+        state[match.group(1)] = unescape(value.group(1)) if value else ""
+    return state
+
+
+def post_back_args(href):
+    """Returns ``(event_target, event_argument)`` from a __doPostBack link,
+    or None if ``href`` isn't one."""
+    match = _POST_BACK_RE.search(href or "")
+    return match.groups() if match else None
+
+
+class PostBackSession(object):
+    """Pages through an ASP.NET WebForms listing with postbacks.
+
+    Only the hidden state of the last response is kept between requests,
+    and requests go through the scraper, so cookies, throttling and caching
+    all carry over from one postback to the next.
+
+    Args:
+        scraper (Scraper): Scraper to make requests with.
+    """
+
+    def __init__(self, scraper):
+        self.scraper = scraper
+        self.url = None
+        self.action = None
+        self.method = "POST"
+        self.state = {}
+
+    def _load(self, url, text):
+        self.url = url
+        self.state = hidden_state(text)
+        form = _FORM_RE.search(text)
+        attrs = {}
+        if form:
+            for name, value in _ATTR_RE.findall(form.group(0)):
+                attrs[name.lower()] = unescape(value)
+        self.action = urljoin(url, attrs.get("action", ""))
+        self.method = attrs.get("method", "POST").upper()
+
+        page = lxml.html.fromstring(text)
+        page.make_links_absolute(url)
+        return page
+
+    def get(self, url, **kwargs):
+        """Fetches ``url`` and starts a new postback chain from it."""
+        return self._load(url, self.scraper.get(url, **kwargs).text)
+
+    def post_back(self, event_target, event_argument="", **fields):
+        """Triggers a postback from the current page.
+
+        Args:
+            event_target (str): Control that raised the event.
+            event_argument (str): Argument passed with the event.
+            **fields: Any extra form fields the page expects.
+        Returns:
+            Element: The resulting page, with links made absolute.
+        """
+        data = dict(self.state)
+        data.update(fields)
+        data["__EVENTTARGET"] = event_target
+        data["__EVENTARGUMENT"] = event_argument
+        if self.method == "GET":
+            response = self.scraper.get(self.action, params=data)
+        elif self.method == "POST":
+            response = self.scraper.post(self.action, data=data)
+        else:
+            raise AssertionError(
+                "Unrecognized request type found: {}".format(self.method)
+            )
+        return self._load(self.action, response.text)
+
+    def pages(self, url, next_args, **kwargs):
+        """Yields each page of a listing, starting at ``url``.
+
+        The postback for the next page is only issued when the generator is
+        advanced, so wrapping it in ``prefetch`` overlaps that request with
+        whatever the caller does with the current page.
+
+        Args:
+            url (str): First page of the listing.
+            next_args (callable): Given a page, returns the
+                ``(event_target, event_argument)`` of its "next" control, or
+                None on the last page.
+            **kwargs: Passed to the initial GET.
+        """
+        page = self.get(url, **kwargs)
+        while True:
+            yield page
+            args = next_args(page)
+            if not args:
+                return
+            page = self.post_back(*args)
@@ -0,0 +1,124 @@
+"""
+    Bounded-memory storage for bills assembled from several tables.
+
+    Scrapers that read a session's bills from one table and then join
+    sponsors, actions, documents... from others need every bill on hand
+    until the last table is read.  ``BillStore`` keeps the most recently
+    used bills as objects and pickles the rest, compressed, to a SQLite file
+    on disk, so memory no longer grows with the size of the session:
+
+        bills = BillStore()
+        for rec in main_table:
+            bills[rec["id"]] = Bill(...)
+        for rec in sponsor_table:
+            bills[rec["id"]].add_sponsorship(...)
+        for key, bill in bills.drain():
+            yield bill
+
+    Side tables are usually sorted or grouped by bill, so most lookups are
+    of bills still in memory.
+"""
+import os
+import zlib
+import pickle
+import sqlite3
+import tempfile
+from collections import OrderedDict
+
+
+class BillStore(object):
+    """Bills by key, only ``cache_size`` of them kept in memory.
+
+    Bills are looked up by ``store[key]`` and changed in place.  Don't keep
+    a reference to one across lookups of other bills: once it's been
+    written out, later changes to that object are lost.
+
+    Args:
+        cache_size (int): Bills kept as objects.
+        directory (str): Where the spill file goes, defaults to the system
+            temporary directory.
+    """
+
+    def __init__(self, cache_size=500, directory=None):
+        self.cache_size = cache_size
+        fd, self.path = tempfile.mkstemp(suffix=".sqlite", dir=directory)
+        os.close(fd)
+        self._db = sqlite3.connect(self.path)
+        # scratch space, nothing to recover after a crash
+        self._db.execute("PRAGMA journal_mode = OFF")
+        self._db.execute("PRAGMA synchronous = OFF")
+        self._db.execute("CREATE TABLE bills (key TEXT PRIMARY KEY, data BLOB)")
+        # key -> None, in the order bills were added
+        self._keys = OrderedDict()
+        self._live = OrderedDict()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __setitem__(self, key, bill):
+        self._keys.setdefault(key)
+        self._live[key] = bill
+        self._live.move_to_end(key)
+        self._evict()
+
+    def __getitem__(self, key):
+        if key in self._live:
+            self._live.move_to_end(key)
+            return self._live[key]
+        if key not in self._keys:
+            raise KeyError(key)
+        bill = self._load(key)
+        self._live[key] = bill
+        self._evict()
+        return bill
+
+    def get(self, key, default=None):
+        return self[key] if key in self._keys else default
+
+    def _load(self, key):
+        (data,) = self._db.execute(
+            "SELECT data FROM bills WHERE key = ?", (key,)
+        ).fetchone()
+        return pickle.loads(zlib.decompress(data))
+
+    def _evict(self):
+        while len(self._live) > self.cache_size:
+            key, bill = self._live.popitem(last=False)
+            data = zlib.compress(pickle.dumps(bill, pickle.HIGHEST_PROTOCOL))
+            self._db.execute(
+                "INSERT OR REPLACE INTO bills (key, data) VALUES (?, ?)", (key, data)
+            )
+
+    def drain(self):
+        """Yields ``(key, bill)`` for every bill in the order they were added,
+        then closes.
+
+        Bills are forgotten as they're yielded.
+        """
+        try:
+            while self._keys:
+                key, _ = self._keys.popitem(last=False)
+                if key in self._live:
+                    yield key, self._live.pop(key)
+                else:
+                    yield key, self._load(key)
+        finally:
+            self.close()
+
+    def close(self):
+        """Discards any remaining bills and removes the spill file."""
+        self._keys.clear()
+        self._live.clear()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+            os.remove(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
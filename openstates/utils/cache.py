@@ -0,0 +1,71 @@
+import os
+import json
+import tempfile
+
+from pupa import settings
+
+
+def cache_path(*parts):
+    """Builds a path under the pupa cache directory.
+
+    Scrapers use this for state that should outlive a single run, such as
+    indexes of what was seen last time. Parent directories are created.
+
+    Args:
+        *parts (str): Path components below the cache directory.
+    Returns:
+        str: The joined path.
+    """
+    path = os.path.join(settings.CACHE_DIR or "_cache", *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+
+def fetched_this_run(path):
+    """Checks whether ``path`` was written during the current runner run.
+
+    ``openstates.runner`` sets ``OPENSTATES_RUN_STARTED`` for the scrapes it
+    starts, so a download one job made can be reused by the jobs after it.
+    Outside the runner this is always False.
+    """
+    started = os.environ.get("OPENSTATES_RUN_STARTED")
+    return bool(
+        started and os.path.exists(path) and os.path.getmtime(path) >= float(started)
+    )
+
+
+def write_atomic(path, data, mode="w"):
+    """Writes a file via a temporary file, so readers never see partial data."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".part")
+    try:
+        with os.fdopen(fd, mode) as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+class JSONStore(object):
+    """A directory of JSON documents, one per key, in the pupa cache."""
+
+    def __init__(self, *parts):
+        self.directory = cache_path(*parts, "")
+
+    def _path(self, key):
+        return os.path.join(self.directory, key.replace("/", "-") + ".json")
+
+    def get(self, key, default=None):
+        """Returns the document stored under ``key``, or ``default``."""
+        try:
+            with open(self._path(key)) as f:
+                return json.load(f)
+        except (IOError, ValueError):
+            return default
+
+    def set(self, key, value):
+        """Stores ``value`` (anything JSON-serializable) under ``key``."""
+        write_atomic(self._path(key), json.dumps(value))
+
+    def __contains__(self, key):
+        return os.path.exists(self._path(key))
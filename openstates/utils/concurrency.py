@@ -0,0 +1,141 @@
+import time
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import scrapelib
+
+# Workers sharing a scraper also share its requests_per_minute (see
+# _throttle below), so more of them only help while responses are slower
+# than that limit.  Requests made outside scrapelib need a RateLimiter.
+DEFAULT_WORKERS = 4
+
+_DONE = object()
+
+
+class RateLimiter(object):
+    """Spaces out calls made from any number of threads.
+
+    Args:
+        requests_per_minute (int): The limit, 0 for none.
+    """
+
+    def __init__(self, requests_per_minute):
+        self.requests_per_minute = requests_per_minute
+        self.interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        """Blocks until the caller may make its request."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+_limiters_lock = threading.Lock()
+
+
+def _throttle(session):
+    # scrapelib's own reads and writes _last_request without a lock, so
+    # workers would see the same timestamp, sleep alike and fire together
+    limiter = session.__dict__.get("_rate_limiter")
+    if limiter is None or limiter.requests_per_minute != session.requests_per_minute:
+        with _limiters_lock:
+            limiter = session.__dict__.get("_rate_limiter")
+            if (
+                limiter is None
+                or limiter.requests_per_minute != session.requests_per_minute
+            ):
+                limiter = session._rate_limiter = RateLimiter(
+                    session.requests_per_minute
+                )
+    limiter.wait()
+
+
+scrapelib.ThrottledSession._throttle = _throttle
+
+
+def ordered_map(func, iterable, workers=DEFAULT_WORKERS, window=None):
+    """Applies a function to items on a thread pool, yielding results in order.
+
+    ``iterable`` is consumed lazily, and at most ``window`` calls are in
+    flight at once, so it may itself be a (slow) generator.
+
+    Args:
+        func (callable): Function to call with each item.
+        iterable (Iterable): Items to process.
+        workers (int): Number of worker threads.
+        window (int): Maximum number of outstanding calls, defaults to
+            twice the number of workers.
+    Returns:
+        Iterator: Results of ``func``, in the same order as ``iterable``.
+    """
+    window = window or workers * 2
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        try:
+            for item in iterable:
+                pending.append(pool.submit(func, item))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # don't make an early exit wait on work nobody will consume
+            for future in pending:
+                future.cancel()
+
+
+def prefetch(iterable, depth=1):
+    """Runs an iterator ahead of its consumer on a background thread.
+
+    Useful for paginated listings: while the caller works on page N, page
+    N+1 (up to ``depth`` pages) is already being fetched. Exceptions raised
+    by the iterator are re-raised in the consumer.
+
+    Args:
+        iterable (Iterable): Items to produce, typically a page generator.
+        depth (int): Number of items to buffer ahead of the consumer.
+    Returns:
+        Iterator: The items of ``iterable``, in order.
+    """
+    buf = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(entry):
+        while not stop.is_set():
+            try:
+                buf.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+            put((_DONE, None))
+        except BaseException as e:
+            put((_DONE, e))
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, exc = buf.get()
+            if exc is not None:
+                raise exc
+            if item is _DONE:
+                break
+            yield item
+    finally:
+        stop.set()
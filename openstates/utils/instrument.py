@@ -0,0 +1,305 @@
+"""
+Timing of where a scrape spends its time.
+
+``install(directory)`` wraps the calls scrapers spend most of their time
+in and, at the end of each ``do_scrape``, writes a JSON report per
+scraper to ``directory``, e.g. ``tx-TXBillScraper.json``:
+
+    {"jurisdiction": "tx", "scraper": "TXBillScraper",
+     "wall": 812.4, "cpu": 97.1,
+     "phases": {"http": {"calls": 5120, "bytes": 93211044,
+                         "wall": 701.2, "cpu": 12.9}, ...}}
+
+Phases nest (``lxmlize`` calls ``get`` which is ``http``), and each
+phase's times exclude the phases called inside it, so they can be added
+up.  Whatever isn't in a phase is the scraper's own code.
+
+Queries made with ``XPathFields`` or ``LXMLMixin.get_node(s)`` are also
+counted per expression, under ``"xpath"``, to show which ones a
+jurisdiction's parsing time goes to.  These overlap the phases rather
+than being one.
+
+With ``profile_hz`` set, a sampling profiler also runs during each scrape
+and writes the sampled stacks, in the folded format flamegraph tools
+read, to ``tx-TXBillScraper.folded``.
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import functools
+import threading
+from collections import Counter, defaultdict
+
+import lxml.html
+import scrapelib
+import pupa.utils
+import pupa.utils.generic
+from pupa import scrape
+from pupa.scrape.base import Scraper
+
+from .actions import BaseCategorizer
+from . import lxmlize
+from .lxmlize import LXMLMixin
+
+# timings of the scrape in progress, shared with any worker threads it starts
+_current = None
+# per-thread stack of [child wall, child cpu] for the calls being timed
+_local = threading.local()
+
+
+class Timings(object):
+    """Per-phase call counts, bytes and times for one scrape."""
+
+    def __init__(self, jurisdiction, scraper):
+        self.jurisdiction = jurisdiction
+        self.scraper = scraper
+        self.phases = defaultdict(
+            lambda: {"calls": 0, "bytes": 0, "wall": 0.0, "cpu": 0.0}
+        )
+        self.xpath = defaultdict(lambda: {"calls": 0, "wall": 0.0})
+        self._lock = threading.Lock()
+
+    def add(self, phase, wall, cpu, nbytes=0):
+        with self._lock:
+            counts = self.phases[phase]
+            counts["calls"] += 1
+            counts["bytes"] += nbytes
+            counts["wall"] += wall
+            counts["cpu"] += cpu
+
+    def add_xpath(self, expr, wall):
+        with self._lock:
+            counts = self.xpath[expr]
+            counts["calls"] += 1
+            counts["wall"] += wall
+
+    def as_dict(self, wall, cpu):
+        return {
+            "jurisdiction": self.jurisdiction,
+            "scraper": self.scraper,
+            "wall": wall,
+            "cpu": cpu,
+            "phases": dict(self.phases),
+            "xpath": dict(self.xpath),
+        }
+
+
+def _stack():
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+def timed(phase, func, size=None):
+    """Wraps ``func`` so calls made during a scrape are counted as ``phase``.
+
+    Args:
+        phase (str): Name to report the calls under.
+        func (callable): Function to wrap.
+        size (callable): Given ``(args, result)``, returns the bytes handled.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        timings = _current
+        if timings is None:
+            return func(*args, **kwargs)
+
+        stack = _stack()
+        stack.append([0.0, 0.0])
+        nbytes = 0
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        try:
+            result = func(*args, **kwargs)
+            if size:
+                nbytes = size(args, result)
+            return result
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.thread_time() - cpu
+            child_wall, child_cpu = stack.pop()
+            if stack:
+                stack[-1][0] += wall
+                stack[-1][1] += cpu
+            timings.add(phase, wall - child_wall, cpu - child_cpu, nbytes)
+
+    return wrapper
+
+
+def _xpath_timed(func):
+    @functools.wraps(func)
+    def evaluate(xpath, node):
+        timings = _current
+        if timings is None:
+            return func(xpath, node)
+        wall = time.perf_counter()
+        try:
+            return func(xpath, node)
+        finally:
+            timings.add_xpath(xpath.path, time.perf_counter() - wall)
+
+    return evaluate
+
+
+class Sampler(object):
+    """Samples every thread's stack on a CPU-time timer.
+
+    Only usable from the main thread, where signal handlers run.
+    """
+
+    def __init__(self, hz):
+        self.interval = 1.0 / hz
+        self.stacks = Counter()
+
+    def _sample(self, signum, interrupted):
+        handler_thread = threading.get_ident()
+        for thread, frame in sys._current_frames().items():
+            if thread == handler_thread:
+                # start above this handler
+                frame = interrupted
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(
+                    "{}:{}".format(os.path.basename(code.co_filename), code.co_name)
+                )
+                frame = frame.f_back
+            self.stacks[";".join(reversed(names))] += 1
+
+    def start(self):
+        signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self):
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, signal.SIG_DFL)
+
+    def write(self, path):
+        with open(path, "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write("{} {}\n".format(stack, count))
+
+
+def _jurisdiction(scraper):
+    # openstates.tx.bills -> tx
+    parts = type(scraper).__module__.split(".")
+    return parts[1] if len(parts) > 2 else parts[0]
+
+
+def _do_scrape(directory, profile_hz, original):
+    @functools.wraps(original)
+    def do_scrape(self, **kwargs):
+        global _current
+        previous = _current
+        _current = timings = Timings(_jurisdiction(self), type(self).__name__)
+        name = "{}-{}".format(timings.jurisdiction, timings.scraper)
+
+        sampler = None
+        if profile_hz and threading.current_thread() is threading.main_thread():
+            sampler = Sampler(profile_hz)
+            sampler.start()
+
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            return original(self, **kwargs)
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+            _current = previous
+            if sampler:
+                sampler.stop()
+                sampler.write(os.path.join(directory, name + ".folded"))
+
+            report = timings.as_dict(wall, cpu)
+            with open(os.path.join(directory, name + ".json"), "w") as f:
+                json.dump(report, f, indent=2, sort_keys=True)
+            self.info(
+                "timings for %s: %.1fs wall, %.1fs cpu, %s",
+                name,
+                wall,
+                cpu,
+                ", ".join(
+                    "{} {:.1f}s".format(phase, counts["wall"])
+                    for phase, counts in sorted(report["phases"].items())
+                ),
+            )
+
+    return do_scrape
+
+
+def _content_size(args, response):
+    return len(response.content)
+
+
+def _arg_size(args, result):
+    return len(args[0])
+
+
+def _result_size(args, result):
+    return len(result or b"")
+
+
+# (owner, attribute, phase, size)
+_TARGETS = [
+    (scrapelib.Scraper, "request", "http", _content_size),
+    (scrapelib.Scraper, "urlretrieve", "download", None),
+    (lxml.html, "fromstring", "parse", _arg_size),
+    (LXMLMixin, "lxmlize", "lxmlize", None),
+    (BaseCategorizer, "categorize", "categorize", None),
+    (Scraper, "save_object", "save", None),
+] + [
+    (cls, "__init__", "build", None)
+    for cls in (
+        scrape.Bill,
+        scrape.VoteEvent,
+        scrape.Event,
+        scrape.Person,
+        scrape.Organization,
+    )
+]
+
+_installed = []
+
+
+def install(directory, profile_hz=0):
+    """Starts timing scrapes, writing reports to ``directory``.
+
+    Should happen before scrapers are imported, so that names they import
+    directly (``from pupa.utils import convert_pdf``) are the wrapped ones.
+
+    Args:
+        directory (str): Where reports go, created if missing.
+        profile_hz (int): Sampling profiler rate, off if 0.
+    """
+    uninstall()
+    os.makedirs(directory, exist_ok=True)
+
+    for owner, attr, phase, size in _TARGETS:
+        original = owner.__dict__[attr]
+        _installed.append((owner, attr, original))
+        setattr(owner, attr, timed(phase, original, size))
+
+    # pupa.utils re-exports convert_pdf, both need to be the wrapped one
+    convert_pdf = pupa.utils.generic.convert_pdf
+    wrapped = timed("pdf", convert_pdf, _result_size)
+    for owner in (pupa.utils.generic, pupa.utils):
+        _installed.append((owner, "convert_pdf", owner.convert_pdf))
+        owner.convert_pdf = wrapped
+
+    _installed.append((lxmlize, "_evaluate", lxmlize._evaluate))
+    lxmlize._evaluate = _xpath_timed(lxmlize._evaluate)
+
+    _installed.append((Scraper, "do_scrape", Scraper.do_scrape))
+    Scraper.do_scrape = _do_scrape(directory, profile_hz, Scraper.do_scrape)
+
+
+def uninstall():
+    """Removes the wrappers put in place by ``install``."""
+    while _installed:
+        owner, attr, original = _installed.pop()
+        setattr(owner, attr, original)
@@ -0,0 +1,56 @@
+"""
+    Scraper classes imported when a scrape asks for them.
+
+    A jurisdiction's scraper modules import whatever their scrapes need:
+    database drivers, SOAP clients, spreadsheet readers...  Naming them in
+    ``Jurisdiction.scrapers`` as strings instead of classes means loading
+    the jurisdiction, or running just its people scraper, doesn't import
+    all of them:
+
+        scrapers = LazyScrapers(
+            __name__,
+            {"bills": "bills:CABillScraper", "people": "people:CAPersonScraper"},
+        )
+"""
+import importlib
+from collections.abc import Mapping
+
+
+class LazyScrapers(Mapping):
+    """``Jurisdiction.scrapers`` that imports each scraper on first lookup.
+
+    Iterating over it, or checking which scrapers exist, imports nothing.
+
+    Args:
+        package (str): The jurisdiction's package, normally ``__name__``.
+        scrapers (dict): ``{scraper type: "module:ClassName"}``, modules
+            relative to ``package``.
+    """
+
+    def __init__(self, package, scrapers):
+        self.package = package
+        self._specs = dict(scrapers)
+        self._classes = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._classes[key]
+        except KeyError:
+            pass
+        module, _, name = self._specs[key].partition(":")
+        cls = getattr(importlib.import_module("." + module, self.package), name)
+        self._classes[key] = cls
+        return cls
+
+    def __contains__(self, key):
+        # Mapping's would import the scraper to find out
+        return key in self._specs
+
+    def __iter__(self):
+        return iter(self._specs)
+
+    def __len__(self):
+        return len(self._specs)
+
+    def __repr__(self):
+        return "LazyScrapers({!r}, {!r})".format(self.package, self._specs)
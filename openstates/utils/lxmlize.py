@@ -1,20 +1,175 @@
+import re
+import codecs
+import threading
+import functools
+from urllib.parse import urljoin
+
 import requests
+import lxml.etree
 import lxml.html
 
+_CHARSET_RE = re.compile(r"""charset\s*=\s*["']?([\w.:-]+)""", re.I)
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?([\w.:-]+)""", re.I)
+# pages declare their charset in <head>, no need to look further
+_META_SNIFF_SIZE = 4096
+
+# lxml parsers can be reused but not shared between threads
+_parsers = threading.local()
+
+
+def sniff_encoding(content, headers=None):
+    """Finds the charset of an HTML document without decoding it.
+
+    Uses the Content-Type header, then a ``<meta>`` charset near the top of
+    the page.  Failing both, ``text/*`` responses get requests' ISO-8859-1
+    default; anything else is left to lxml.
+
+    Args:
+        content (bytes): The document.
+        headers (dict): Response headers, if any.
+    Returns:
+        str: A codec name, or None.
+    """
+    content_type = (headers or {}).get("content-type", "")
+    match = _CHARSET_RE.search(content_type)
+    if match:
+        encoding = match.group(1)
+    else:
+        match = _META_CHARSET_RE.search(content[:_META_SNIFF_SIZE])
+        if match:
+            encoding = match.group(1).decode("ascii")
+        elif content_type.startswith("text/"):
+            encoding = "ISO-8859-1"
+        else:
+            return None
+
+    try:
+        return codecs.lookup(encoding).name
+    except LookupError:
+        return None
+
+
+def _parser(encoding):
+    cache = getattr(_parsers, "cache", None)
+    if cache is None:
+        cache = _parsers.cache = {}
+    if encoding not in cache:
+        cache[encoding] = lxml.html.HTMLParser(encoding=encoding)
+    return cache[encoding]
+
+
+def parse_html(content, url=None, encoding=None):
+    """Parses an HTML document straight from bytes.
+
+    Links are left as they are; the document remembers ``url`` (or its
+    ``<base href>``) so ``absolute`` can resolve the ones that get read.
+
+    Args:
+        content (bytes): The document.
+        url (str): Where it came from.
+        encoding (str): Its charset, see ``sniff_encoding``.
+    Returns:
+        Element: Root of the document.
+    """
+    page = lxml.html.fromstring(content, base_url=url, parser=_parser(encoding))
+    base = page.xpath("/html/head/base/@href")
+    if base:
+        page.getroottree().docinfo.URL = urljoin(url or "", base[0])
+    return page
+
+
+def parse_response(response):
+    """Parses the HTML of a ``requests`` response without decoding it to str."""
+    content = response.content
+    return parse_html(content, response.url, sniff_encoding(content, response.headers))
+
+
+def absolute(link, base_url=None):
+    """Resolves a link read from a document parsed by ``parse_html``.
+
+    Args:
+        link (str|Element): An attribute value from ``xpath``, e.g.
+            ``//a/@href``, which knows the document it came from, or an
+            element whose ``href`` to resolve.
+        base_url (str): URL to resolve against instead.
+    Returns:
+        str: The absolute URL, or None for an element without ``href``.
+    Raises:
+        TypeError: ``link`` is a plain string and no ``base_url`` was given.
+    """
+    # lxml.etree as well as lxml.html elements
+    if isinstance(link, lxml.etree._Element):
+        element, link = link, link.get("href")
+        if link is None:
+            return None
+    elif base_url is None:
+        if not hasattr(link, "getparent"):
+            raise TypeError(
+                "{!r} wasn't read from a document, pass base_url".format(link)
+            )
+        element = link.getparent()
+    if base_url is None:
+        base_url = element.getroottree().docinfo.URL
+    return urljoin(base_url, link.strip())
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_xpath(expr):
+    """Returns ``expr`` compiled, reusing earlier compilations of it."""
+    return lxml.etree.XPath(expr)
+
+
+def _evaluate(xpath, node):
+    # every query made through this module ends up here, see instrument
+    return xpath(node)
+
+
+class XPathFields(object):
+    """Named XPath expressions compiled once, to be read from a page together.
+
+    Declare them as a class attribute so compilation happens when the class
+    is created::
+
+        class HouseComVote(Page):
+            fields = XPathFields(
+                date='//span[contains(@id, "lblDate")]/text()',
+                yeas='//span[contains(@id, "lblYeas")]/text()',
+            )
+
+            def handle_page(self):
+                fields = self.fields.extract(self.doc)
+
+    Args:
+        **exprs (str): XPath expression for each field name.
+    """
+
+    def __init__(self, **exprs):
+        self.xpaths = {name: compile_xpath(expr) for name, expr in exprs.items()}
+
+    def extract(self, node):
+        """Evaluates every field against ``node``.
+
+        Returns:
+            dict: Field name to XPath result.
+        """
+        return {name: _evaluate(xpath, node) for name, xpath in self.xpaths.items()}
+
 
 def url_xpath(url, path, verify=True):
-    doc = lxml.html.fromstring(requests.get(url, verify=verify).text)
+    doc = parse_response(requests.get(url, verify=verify))
     return doc.xpath(path)
 
 
 class LXMLMixin(object):
     """Mixin for adding LXML helper functions to Open States code."""
 
-    def lxmlize(self, url, raise_exceptions=False):
+    def lxmlize(self, url, raise_exceptions=False, absolute_links=True):
         """Parses document into an LXML object and makes links absolute.
 
         Args:
             url (str): URL of the document to parse.
+            absolute_links (bool): Rewrite every link in the page, pass False
+                to resolve just the ones read with ``absolute``.
         Returns:
             Element: Document node representing the page.
         """
@@ -32,8 +187,9 @@ class LXMLMixin(object):
         if raise_exceptions:
             response.raise_for_status()
 
-        page = lxml.html.fromstring(response.text)
-        page.make_links_absolute(url)
+        page = parse_response(response)
+        if absolute_links:
+            page.make_links_absolute(url)
 
         return page
 
@@ -50,7 +206,7 @@ class LXMLMixin(object):
             Element: First node found that matches the query.
         """
         try:
-            node = base_node.xpath(xpath_query)[0]
+            node = _evaluate(compile_xpath(xpath_query), base_node)[0]
         except IndexError:
             node = None
 
@@ -68,4 +224,4 @@ class LXMLMixin(object):
         Returns:
             List[Element]: All nodes found that match the query.
         """
-        return base_node.xpath(xpath_query)
+        return _evaluate(compile_xpath(xpath_query), base_node)
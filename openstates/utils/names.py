@@ -0,0 +1,105 @@
+"""
+    Canonical legislator names for vote parsers.
+
+    A session's roll calls print the same few hundred names thousands of
+    times.  A ``NameResolver`` cleans each distinct raw spelling once and
+    hands back the same interned string every time after, so parsers skip
+    the repeated cleaning and every vote record for a legislator shares one
+    string instead of holding its own copy:
+
+        voter_names = NameResolver(clean=fix_pdf_name, aliases={"MUQOZ": "MUÑOZ"})
+        for name in voter_names.resolve_all(roll_call_names):
+            vote.yes(name)
+
+    Names the people scrape saved can be loaded up front with ``add_people``
+    so that the roll call spellings listed in a person's ``other_names``
+    resolve to the name the person was saved under.
+"""
+import os
+import sys
+import glob
+import json
+
+
+def collapse_whitespace(name):
+    return " ".join(name.split())
+
+
+class NameResolver(object):
+    """Maps the raw names a jurisdiction's vote records use to canonical ones.
+
+    A raw name is first looked up in ``aliases``, then passed through
+    ``clean`` and the result looked up in ``aliases`` again.  Results are
+    remembered per raw string.
+
+    Args:
+        clean (callable): Turns a raw name into a canonical one, defaults to
+            collapsing whitespace.
+        aliases (dict): Canonical names for raw or cleaned names that
+            ``clean`` alone doesn't fix.
+        names (iterable): Canonical names known in advance.
+    """
+
+    def __init__(self, clean=collapse_whitespace, aliases=None, names=()):
+        self.clean = clean
+        self.aliases = {}
+        self._memo = {}
+        self.add_aliases(aliases or {})
+        self.add_names(names)
+
+    def add_aliases(self, aliases):
+        """Adds ``{variant: canonical name}`` entries."""
+        for variant, name in aliases.items():
+            self.aliases[variant] = sys.intern(name)
+        # an earlier lookup may have been answered without them
+        self._memo.clear()
+
+    def add_names(self, names):
+        """Adds canonical names, which resolve to themselves."""
+        self.add_aliases({name: name for name in names})
+
+    def add_people(self, directory):
+        """Adds the people a scrape saved to ``directory``.
+
+        ``pupa update`` empties the data directory before it scrapes, so this
+        only finds people scraped earlier in the same run.
+
+        Args:
+            directory (str): A pupa data directory holding ``person_*.json``.
+        Returns:
+            int: The number of people found.
+        """
+        aliases = {}
+        paths = glob.glob(os.path.join(directory, "person_*.json"))
+        for path in paths:
+            with open(path) as f:
+                person = json.load(f)
+            for other in person.get("other_names", ()):
+                aliases[other["name"]] = person["name"]
+            aliases[person["name"]] = person["name"]
+        self.add_aliases(aliases)
+        return len(paths)
+
+    def __call__(self, raw):
+        try:
+            return self._memo[raw]
+        except KeyError:
+            pass
+        name = self.aliases.get(raw)
+        if name is None:
+            name = self.clean(raw)
+            name = self.aliases.get(name) or sys.intern(name)
+        self._memo[raw] = name
+        return name
+
+    def resolve_all(self, raws):
+        """Resolves a whole roll call's worth of raw names.
+
+        Returns:
+            list: The canonical names, in the same order.
+        """
+        memo = self._memo
+        return [memo[raw] if raw in memo else self(raw) for raw in raws]
+
+    def __len__(self):
+        return len(self._memo)
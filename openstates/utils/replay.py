@@ -0,0 +1,544 @@
+"""
+    Record and replay of everything scrapers fetch.
+
+    ``record(directory)`` captures each exchange a scrape makes into an
+    archive; ``replay(directory)`` serves them back with no network so a full
+    scrape can be rerun, and profiled, at disk speed.  Both work by patching
+    the transports the scrapers end up in:
+
+        * ``requests`` adapters, which covers ``self.get``/``self.post``/
+          ``self.urlretrieve`` on scrapelib scrapers as well as plain
+          ``requests`` calls and sessions
+        * ``urllib`` openers, which covers ``urlopen``, suds (GA) and
+          scrapelib's ``ftp://`` support
+        * ``ftplib.FTP``, used directly by TX and AR
+
+    An archive is a directory holding ``index.jsonl``, one line per exchange,
+    and ``bodies/``, gzipped response bodies named by their sha1 so repeated
+    content is only stored once.
+
+    Identical requests are replayed in the order they were recorded, the last
+    response repeating once they run out.  A request whose body differs from
+    anything recorded (e.g. it contains today's date) falls back to the
+    responses recorded for the same method and URL.
+"""
+import io
+import os
+import json
+import gzip
+import ftplib
+import hashlib
+import tempfile
+import threading
+import http.client
+import urllib.error
+import urllib.request
+import urllib.response
+from email.parser import Parser
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+
+def _sha1(data):
+    if data is None:
+        return None
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha1(data).hexdigest()
+
+
+class NotRecorded(requests.ConnectionError):
+    """Raised in replay for a request that isn't in the archive."""
+
+
+class BodyWriter(object):
+    """Gzips a response body into the archive as it arrives.
+
+    For transfers too big to hold in memory: ``write`` the chunks, then pass
+    the writer to ``Archive.add`` as the body.  ``discard`` drops it instead.
+    """
+
+    def __init__(self, directory):
+        fd, self._tmp = tempfile.mkstemp(dir=directory, suffix=".part")
+        self._raw = os.fdopen(fd, "wb")
+        self._gzip = gzip.GzipFile(fileobj=self._raw, mode="wb")
+        self._sha1 = hashlib.sha1()
+
+    def write(self, data):
+        self._sha1.update(data)
+        self._gzip.write(data)
+
+    def _close(self):
+        self._gzip.close()
+        self._raw.close()
+
+    def save(self, path):
+        self._close()
+        if os.path.exists(path):
+            os.remove(self._tmp)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(self._tmp, path)
+
+    def discard(self):
+        self._close()
+        os.remove(self._tmp)
+
+    def hexdigest(self):
+        return self._sha1.hexdigest()
+
+
+class Archive(object):
+    """A directory of recorded exchanges.
+
+    Args:
+        directory (str): Where the archive lives, created when recording.
+        mode (str): ``"record"`` or ``"replay"``.
+    """
+
+    def __init__(self, directory, mode):
+        self.directory = directory
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._bodies = os.path.join(directory, "bodies")
+        self._index_path = os.path.join(directory, "index.jsonl")
+
+        if mode == "record":
+            os.makedirs(self._bodies, exist_ok=True)
+            self._index = open(self._index_path, "a")
+        else:
+            # key -> [entries], and a looser (method, url) -> [entries]
+            self._exact = {}
+            self._loose = {}
+            self._served = {}
+            with open(self._index_path) as f:
+                for line in f:
+                    entry = json.loads(line)
+                    method, url, _ = entry["key"]
+                    self._exact.setdefault(tuple(entry["key"]), []).append(entry)
+                    self._loose.setdefault((method, url), []).append(entry)
+
+    def _body_path(self, digest):
+        return os.path.join(self._bodies, digest[:2], digest + ".gz")
+
+    def add(self, method, url, request_body, meta, body):
+        """Stores one exchange.
+
+        Args:
+            method (str): e.g. ``"GET"``, or ``"FTP"`` for ftplib commands.
+            url (str): What was requested.
+            request_body (bytes): Request payload, if any.
+            meta (dict): JSON-serializable response details (status, headers).
+            body (bytes): Response body, or the ``BodyWriter`` it was written to.
+        """
+        if isinstance(body, BodyWriter):
+            digest = body.hexdigest()
+            body.save(self._body_path(digest))
+        else:
+            digest = _sha1(body)
+            self._save_body(digest, body)
+
+        line = json.dumps(
+            {"key": [method, url, _sha1(request_body)], "meta": meta, "body": digest}
+        )
+        with self._lock:
+            self._index.write(line + "\n")
+            self._index.flush()
+
+    def _save_body(self, digest, body):
+        path = self._body_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = "{}.{}.part".format(path, threading.get_ident())
+            with gzip.open(tmp, "wb") as f:
+                f.write(body)
+            os.replace(tmp, path)
+
+    def body_writer(self):
+        """Returns a ``BodyWriter`` for a body to be streamed into the archive."""
+        return BodyWriter(self._bodies)
+
+    def get(self, method, url, request_body=None):
+        """Returns ``(meta, body)`` for a request, or None if never recorded."""
+        key = (method, url, _sha1(request_body))
+        entries = self._exact.get(key)
+        if entries is None:
+            key = (method, url)
+            entries = self._loose.get(key)
+            if entries is None:
+                return None
+
+        with self._lock:
+            n = self._served.get(key, 0)
+            self._served[key] = n + 1
+        entry = entries[min(n, len(entries) - 1)]
+
+        with gzip.open(self._body_path(entry["body"]), "rb") as f:
+            return entry["meta"], f.read()
+
+    def close(self):
+        if self.mode == "record":
+            self._index.close()
+
+
+# requests ###################################################################
+
+
+def _requests_send(archive, original):
+    def send(adapter, request, **kwargs):
+        if archive.mode == "record":
+            response = original(adapter, request, **kwargs)
+            archive.add(
+                request.method,
+                request.url,
+                request.body,
+                {
+                    "status": response.status_code,
+                    "reason": response.reason,
+                    "headers": dict(response.headers),
+                },
+                response.content,
+            )
+            return response
+
+        found = archive.get(request.method, request.url, request.body)
+        if found is None:
+            raise NotRecorded(
+                "{} {} is not in {}".format(
+                    request.method, request.url, archive.directory
+                ),
+                request=request,
+            )
+        meta, body = found
+        response = requests.Response()
+        response.status_code = meta["status"]
+        response.reason = meta["reason"]
+        response.headers = CaseInsensitiveDict(meta["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = io.BytesIO(body)
+        response._content = body
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.connection = adapter
+        return response
+
+    return send
+
+
+# urllib #####################################################################
+
+
+def _headers_text(headers):
+    return "".join("{}: {}\n".format(k, v) for k, v in headers.items())
+
+
+def _parse_headers(text):
+    return Parser(_class=http.client.HTTPMessage).parsestr(text)
+
+
+def _urllib_open(archive, original):
+    def open(opener, fullurl, data=None, *args, **kwargs):
+        if isinstance(fullurl, urllib.request.Request):
+            method = fullurl.get_method()
+            url = fullurl.get_full_url()
+            data = fullurl.data if data is None else data
+        else:
+            method = "POST" if data is not None else "GET"
+            url = fullurl
+
+        if archive.mode == "record":
+            try:
+                response = original(opener, fullurl, data, *args, **kwargs)
+            except urllib.error.HTTPError as e:
+                body = e.read()
+                meta = {
+                    "error": True,
+                    "status": e.code,
+                    "reason": e.msg,
+                    "headers": _headers_text(e.hdrs or {}),
+                }
+                archive.add(method, url, data, meta, body)
+                raise urllib.error.HTTPError(
+                    e.url, e.code, e.msg, e.hdrs, io.BytesIO(body)
+                )
+            body = response.read()
+            meta = {
+                "status": response.getcode(),
+                "url": response.geturl(),
+                "headers": _headers_text(response.info()),
+            }
+            archive.add(method, url, data, meta, body)
+            return urllib.response.addinfourl(
+                io.BytesIO(body), response.info(), meta["url"], meta["status"]
+            )
+
+        found = archive.get(method, url, data)
+        if found is None:
+            raise urllib.error.URLError(
+                "{} {} is not in {}".format(method, url, archive.directory)
+            )
+        meta, body = found
+        headers = _parse_headers(meta["headers"])
+        if meta.get("error"):
+            raise urllib.error.HTTPError(
+                url, meta["status"], meta["reason"], headers, io.BytesIO(body)
+            )
+        return urllib.response.addinfourl(
+            io.BytesIO(body), headers, meta["url"], meta["status"]
+        )
+
+    return open
+
+
+# ftplib #####################################################################
+
+
+_FTP = ftplib.FTP
+
+
+def _ftp_url(ftp, cmd):
+    return "ftp://{}{} {}".format(ftp.host, ftp._replay_cwd, cmd)
+
+
+def _ftp_cwd(cwd, dirname):
+    # tracked locally rather than asking the server, so that recording and
+    # replay agree on the directory a command was sent from
+    return "/" + os.path.normpath(os.path.join(cwd, dirname)).strip("/")
+
+
+class RecordingFTP(_FTP):
+    """An FTP connection that also records command output to the archive.
+
+    Transfers are written to the archive as they arrive rather than held in
+    memory, and a command the server refuses is recorded so that replay
+    refuses it too.
+    """
+
+    archive = None
+    _replay_cwd = "/"
+
+    def cwd(self, dirname):
+        reply = super(RecordingFTP, self).cwd(dirname)
+        self._replay_cwd = _ftp_cwd(self._replay_cwd, dirname)
+        return reply
+
+    def _record(self, cmd, meta, body):
+        self.archive.add("FTP", _ftp_url(self, cmd), None, meta, body)
+
+    def _record_error(self, cmd, e):
+        self._record(cmd, {"error": str(e), "class": type(e).__name__}, b"")
+
+    def sendcmd(self, cmd):
+        try:
+            reply = super(RecordingFTP, self).sendcmd(cmd)
+        except ftplib.Error as e:
+            self._record_error(cmd, e)
+            raise
+        self._record(cmd, {"reply": reply}, b"")
+        return reply
+
+    def voidcmd(self, cmd):
+        # ftplib's doesn't go through sendcmd
+        try:
+            reply = super(RecordingFTP, self).voidcmd(cmd)
+        except ftplib.Error as e:
+            self._record_error(cmd, e)
+            raise
+        self._record(cmd, {"reply": reply}, b"")
+        return reply
+
+    def _transfer(self, cmd, retr, callback, write):
+        writer = self.archive.body_writer()
+
+        def receive(data):
+            write(writer, data)
+            callback(data)
+
+        try:
+            reply = retr(cmd, receive)
+        except BaseException as e:
+            writer.discard()
+            if isinstance(e, ftplib.Error):
+                self._record_error(cmd, e)
+            raise
+        self._record(cmd, {"reply": reply}, writer)
+        return reply
+
+    def retrlines(self, cmd, callback=None):
+        first = True
+
+        def write(writer, line):
+            # stored as the lines joined with "\n", which is how replay splits them
+            nonlocal first
+            if not first:
+                writer.write(b"\n")
+            first = False
+            writer.write(line.encode("utf-8"))
+
+        retr = super(RecordingFTP, self).retrlines
+        return self._transfer(cmd, retr, callback or print, write)
+
+    def retrbinary(self, cmd, callback, *args, **kwargs):
+        def retr(cmd, receive):
+            return super(RecordingFTP, self).retrbinary(cmd, receive, *args, **kwargs)
+
+        return self._transfer(cmd, retr, callback, BodyWriter.write)
+
+
+class ReplayFTP(object):
+    """Stands in for ``ftplib.FTP``, answering commands from the archive.
+
+    Only the commands ``RecordingFTP`` records can be replayed; using any
+    other ``ftplib.FTP`` method raises ``NotImplementedError``.
+    """
+
+    archive = None
+
+    def __init__(self, host="", *args, **kwargs):
+        self.host = host
+        self._replay_cwd = "/"
+
+    def connect(self, host="", *args, **kwargs):
+        if host:
+            self.host = host
+        return "220 replay"
+
+    def login(self, *args, **kwargs):
+        return "230 replay"
+
+    def cwd(self, dirname):
+        self._replay_cwd = _ftp_cwd(self._replay_cwd, dirname)
+        return "250 replay"
+
+    def pwd(self):
+        return self._replay_cwd
+
+    def _get(self, cmd):
+        found = self.archive.get("FTP", _ftp_url(self, cmd))
+        if found is None:
+            raise ftplib.error_perm(
+                "550 {} is not in {}".format(
+                    _ftp_url(self, cmd), self.archive.directory
+                )
+            )
+        meta, body = found
+        if "error" in meta:
+            error = getattr(ftplib, meta.get("class", "error_perm"), ftplib.error_perm)
+            raise error(meta["error"])
+        return meta, body
+
+    def sendcmd(self, cmd):
+        return self._get(cmd)[0]["reply"]
+
+    def voidcmd(self, cmd):
+        reply = self.sendcmd(cmd)
+        if not reply.startswith("2"):
+            raise ftplib.error_reply(reply)
+        return reply
+
+    def retrlines(self, cmd, callback=None):
+        meta, body = self._get(cmd)
+        if body:
+            for line in body.decode("utf-8").split("\n"):
+                (callback or print)(line)
+        return meta["reply"]
+
+    def retrbinary(self, cmd, callback, *args, **kwargs):
+        meta, body = self._get(cmd)
+        callback(body)
+        return meta["reply"]
+
+    # built on retrlines, as they are in ftplib, so they send the same commands
+    nlst = _FTP.nlst
+    dir = _FTP.dir
+
+    def quit(self):
+        return "221 replay"
+
+    def close(self):
+        pass
+
+    def __getattr__(self, name):
+        if not name.startswith("_") and hasattr(_FTP, name):
+            raise NotImplementedError(
+                "ftplib.FTP.{} can't be replayed, only what RecordingFTP "
+                "records".format(name)
+            )
+        raise AttributeError(name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+# installation ###############################################################
+
+_installed = None
+
+
+def _install(directory, mode):
+    global _installed
+    uninstall()
+
+    archive = Archive(directory, mode)
+    ftp_class = RecordingFTP if mode == "record" else ReplayFTP
+    ftp_class = type(ftp_class.__name__, (ftp_class,), {"archive": archive})
+
+    _installed = (
+        archive,
+        HTTPAdapter.send,
+        urllib.request.OpenerDirector.open,
+        ftplib.FTP,
+    )
+    HTTPAdapter.send = _requests_send(archive, HTTPAdapter.send)
+    urllib.request.OpenerDirector.open = _urllib_open(
+        archive, urllib.request.OpenerDirector.open
+    )
+    ftplib.FTP = ftp_class
+    return archive
+
+
+def record(directory):
+    """Records every exchange from here on into the archive at ``directory``.
+
+    Returns:
+        Archive: The archive being written.
+    """
+    return _install(directory, "record")
+
+
+def replay(directory):
+    """Serves requests from the archive at ``directory`` instead of the network.
+
+    Returns:
+        Archive: The archive being read.
+    """
+    return _install(directory, "replay")
+
+
+def recording():
+    """Whether ``record`` is capturing exchanges right now.
+
+    Scrapers that keep their own download cache check this so that a
+    recording includes the downloads a cache hit would have skipped.
+    """
+    return _installed is not None and _installed[0].mode == "record"
+
+
+def uninstall():
+    """Restores the real transports and closes the archive, if installed."""
+    global _installed
+    if _installed is None:
+        return
+    archive, send, open_, ftp_class = _installed
+    HTTPAdapter.send = send
+    urllib.request.OpenerDirector.open = open_
+    ftplib.FTP = ftp_class
+    archive.close()
+    _installed = None
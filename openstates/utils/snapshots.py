@@ -0,0 +1,134 @@
+"""
+    Saved output for legislative sessions that are over.
+
+    Once a session is past its ``end_date`` (plus a grace period for late
+    journal corrections and vetoes) what a scraper yields for it no longer
+    changes.  ``SessionSnapshots`` keeps that output in the pupa cache, under
+    ``snapshots/<version>/<jurisdiction>/<scraper>/<session>.pickle.gz``, and
+    later runs yield it back without touching the network:
+
+        def scrape(self, chamber=None, session=None):
+            snapshots = SessionSnapshots(self)
+            for chamber in chambers:
+                yield from snapshots(self.scrape_chamber(chamber, session),
+                                     session, chamber)
+
+    Sessions without an ``end_date`` are always scraped.  Set
+    ``OPENSTATES_REFRESH_SNAPSHOTS`` to scrape everything again and replace
+    the saved copies.
+
+    Snapshots are pickled pupa objects, so ``<version>`` includes pupa's
+    version as well as ``FORMAT``: after an upgrade, sessions are scraped
+    and saved again rather than unpickled into classes that have changed.
+
+    Only scrapers whose output is split by session can use it.  IL's
+    committee scraper, for one, merges committees across every session in a
+    single pass and is not snapshotted.
+"""
+import os
+import gzip
+import pickle
+import datetime
+import tempfile
+
+import pupa
+
+from .cache import cache_path
+
+GRACE = datetime.timedelta(days=90)
+# bump when what gets pickled, or how, changes
+FORMAT = 1
+
+
+def session_frozen(jurisdiction, session, grace=GRACE, today=None):
+    """Checks whether ``session`` ended more than ``grace`` ago.
+
+    Args:
+        jurisdiction (Jurisdiction): Whose ``legislative_sessions`` to look in.
+        session (str): Session identifier.
+        grace (timedelta): How long after ``end_date`` output may still change.
+        today (date): Defaults to the current date.
+    Returns:
+        bool: False for unknown sessions and those without an ``end_date``.
+    """
+    for s in jurisdiction.legislative_sessions:
+        if s["identifier"] == session:
+            end_date = s.get("end_date")
+            break
+    else:
+        return False
+    if not end_date:
+        return False
+    end = datetime.datetime.strptime(end_date[:10], "%Y-%m-%d").date()
+    return end + grace < (today or datetime.date.today())
+
+
+def _replay(path):
+    with gzip.open(path, "rb") as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+
+def _record(path, objects):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+            for obj in objects:
+                # saved before pupa's pre_save fills it in, as a fresh scrape would yield it
+                pickle.dump(obj, f, pickle.HIGHEST_PROTOCOL)
+                yield obj
+        os.replace(tmp, path)
+    except BaseException:
+        # includes the consumer stopping early: a partial snapshot is no snapshot
+        os.remove(tmp)
+        raise
+
+
+class SessionSnapshots(object):
+    """Replays or records a scraper's output for sessions that are over.
+
+    Args:
+        scraper (Scraper): The scraper whose output is kept, which also gives
+            the jurisdiction and the name the snapshots are stored under.
+        grace (timedelta): How long after ``end_date`` to keep scraping.
+    """
+
+    def __init__(self, scraper, grace=GRACE):
+        self.scraper = scraper
+        self.grace = grace
+        # openstates.nh.bills -> nh
+        module = type(scraper).__module__.split(".")
+        abbr = module[1] if len(module) > 2 else module[0]
+        version = "{}-pupa-{}".format(FORMAT, pupa.__version__)
+        self.directory = cache_path(
+            "snapshots", version, abbr, type(scraper).__name__, ""
+        )
+
+    def path(self, session, *parts):
+        name = "-".join((session,) + parts).replace("/", "-")
+        return os.path.join(self.directory, name + ".pickle.gz")
+
+    def __call__(self, objects, session, *parts):
+        """Yields what ``objects`` would, from a snapshot when there is one.
+
+        Args:
+            objects (iterable): The scrape of ``session``, normally a
+                generator that hasn't started, so nothing is fetched when
+                a snapshot is replayed instead.
+            session (str): Session identifier.
+            *parts (str): Anything else that picks out this slice of the
+                output, e.g. the chamber.
+        """
+        if not session_frozen(self.scraper.jurisdiction, session, self.grace):
+            yield from objects
+            return
+        path = self.path(session, *parts)
+        if os.path.exists(path) and not os.environ.get("OPENSTATES_REFRESH_SNAPSHOTS"):
+            self.scraper.info("replaying snapshot %s", path)
+            yield from _replay(path)
+            return
+        self.scraper.info("session %s is over, saving snapshot %s", session, path)
+        yield from _record(path, objects)
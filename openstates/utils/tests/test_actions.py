@@ -0,0 +1,72 @@
+import unittest
+
+from openstates.utils.actions import PrefixClassifier, PatternClassifier
+
+
+class TestPrefixClassifier(unittest.TestCase):
+    classify = PrefixClassifier(
+        (
+            ("Introduced and adopted", ["introduction", "passage"]),
+            ("Introduced", "introduction"),
+            ("Introduced and read", "reading-1"),
+            ("Referred to Committee", "referral-committee"),
+        ),
+        ignore_case=True,
+    )
+
+    def test_first_entry_wins(self):
+        self.assertEqual(
+            self.classify("Introduced and adopted"), ["introduction", "passage"]
+        )
+        # a longer prefix later in the table loses to a shorter earlier one
+        self.assertEqual(
+            self.classify("Introduced and read first time"), "introduction"
+        )
+
+    def test_ignore_case(self):
+        self.assertEqual(
+            self.classify("REFERRED TO COMMITTEE on Finance"), "referral-committee"
+        )
+        self.assertEqual(
+            PrefixClassifier((("Referred", "referral-committee"),))("referred"), None
+        )
+
+    def test_default(self):
+        self.assertIsNone(self.classify("Intro"))
+        self.assertEqual(PrefixClassifier((), default="other")("Anything"), "other")
+
+
+class TestPatternClassifier(unittest.TestCase):
+    classify = PatternClassifier(
+        (
+            ("Minority Committee Report", None),
+            (".*Ought to Pass", ["committee-passage-favorable"]),
+            ("(House|Senate) sustained Governor's veto", "veto-override-failure"),
+            (r"\s*Amendment(s)? .+ agreed", "amendment-passage"),
+        ),
+        default="other",
+    )
+
+    def test_match(self):
+        self.assertEqual(
+            self.classify("Senate sustained Governor's veto"), "veto-override-failure"
+        )
+        self.assertEqual(
+            self.classify("  Amendments by Smith agreed to"), "amendment-passage"
+        )
+
+    def test_first_entry_wins(self):
+        self.assertIsNone(self.classify("Minority Committee Report: Ought to Pass"))
+        self.assertEqual(
+            self.classify("Majority Committee Report: Ought to Pass"),
+            ["committee-passage-favorable"],
+        )
+
+    def test_anchored(self):
+        self.assertEqual(
+            self.classify("Governor: Senate sustained Governor's veto"), "other"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+
+from openstates.utils.aspnet import PostBackSession, hidden_state, post_back_args
+
+PAGE = """
+<form method="post" action="./List.aspx?s=19RS&amp;r=HB*" id="aspnetForm">
+<input type="hidden" name="__VIEWSTATE" id="__VIEWSTATE" value="dDw&amp;x+/=" />
+<input type="hidden" name="__EVENTVALIDATION" id="__EVENTVALIDATION" value="ev" />
+<input type="text" name="ctl00$Query" value="ignored" />
+</form>
+"""
+
+
+class TestASPNet(unittest.TestCase):
+    def test_hidden_state(self):
+        self.assertEqual(
+            hidden_state(PAGE), {"__VIEWSTATE": "dDw&x+/=", "__EVENTVALIDATION": "ev"},
+        )
+
+    def test_post_back_args(self):
+        href = "javascript:__doPostBack('ctl00$PageBody$Next','Page$2')"
+        self.assertEqual(post_back_args(href), ("ctl00$PageBody$Next", "Page$2"))
+        self.assertIsNone(post_back_args("BillInfo.aspx?i=1"))
+        self.assertIsNone(post_back_args(None))
+
+
+def page(n, viewstate=True):
+    state = (
+        '<input type="hidden" name="__VIEWSTATE" value="vs{}" />'.format(n)
+        if viewstate
+        else ""
+    )
+    return """
+<form method="post" action="./List.aspx?s=19RS">
+{}
+<input type="hidden" name="__EVENTVALIDATION" value="ev{}" />
+<a href="BillInfo.aspx?i={}">bill</a>
+<a href="javascript:__doPostBack('ctl00$Next','')">Next</a>
+</form>
+""".format(
+        state, n, n
+    )
+
+
+class Response(object):
+    def __init__(self, text):
+        self.text = text
+
+
+class StubScraper(object):
+    """Answers the first GET and each POST with the next of ``pages``."""
+
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.requests = []
+
+    def get(self, url, **kwargs):
+        self.requests.append(("GET", url, kwargs.get("params")))
+        return Response(self.pages.pop(0))
+
+    def post(self, url, data=None, **kwargs):
+        self.requests.append(("POST", url, data))
+        return Response(self.pages.pop(0))
+
+
+class TestPostBackSession(unittest.TestCase):
+    url = "https://example.com/Legis/List.aspx?s=19RS"
+
+    def next_args(self, doc):
+        links = doc.xpath("//a[text()='Next']/@href")
+        return post_back_args(links[0]) if links else None
+
+    def test_state_carried_across_posts(self):
+        scraper = StubScraper([page(1), page(2), page(3)])
+        session = PostBackSession(scraper)
+        doc = session.get(self.url, verify=False)
+        session.post_back("ctl00$Next")
+        session.post_back("ctl00$Next", "Page$3", extra="1")
+
+        self.assertEqual(
+            doc.xpath("//a/@href")[0], "https://example.com/Legis/BillInfo.aspx?i=1"
+        )
+        (_, _, first), (_, action, second), (_, _, third) = scraper.requests
+        self.assertEqual(action, "https://example.com/Legis/List.aspx?s=19RS")
+        self.assertIsNone(first)
+        self.assertEqual(
+            second,
+            {
+                "__VIEWSTATE": "vs1",
+                "__EVENTVALIDATION": "ev1",
+                "__EVENTTARGET": "ctl00$Next",
+                "__EVENTARGUMENT": "",
+            },
+        )
+        # each post sends the state of the page before it
+        self.assertEqual(third["__VIEWSTATE"], "vs2")
+        self.assertEqual(third["__EVENTARGUMENT"], "Page$3")
+        self.assertEqual(third["extra"], "1")
+
+    def test_missing_viewstate(self):
+        scraper = StubScraper([page(1), page(2, viewstate=False), page(3)])
+        session = PostBackSession(scraper)
+        session.get(self.url)
+        session.post_back("ctl00$Next")
+        session.post_back("ctl00$Next")
+
+        # state from an earlier page isn't resent
+        data = scraper.requests[-1][2]
+        self.assertNotIn("__VIEWSTATE", data)
+        self.assertEqual(data["__EVENTVALIDATION"], "ev2")
+
+    def test_pages_stops_without_next(self):
+        last = page(2).replace("__doPostBack", "noPostBack")
+        scraper = StubScraper([page(1), last])
+        docs = list(PostBackSession(scraper).pages(self.url, self.next_args))
+        self.assertEqual(len(docs), 2)
+        self.assertEqual([method for method, _, _ in scraper.requests], ["GET", "POST"])
@@ -0,0 +1,59 @@
+import os
+import unittest
+
+from pupa.scrape import Bill
+
+from openstates.utils import BillStore
+
+
+def make_bill(n):
+    return Bill("HB {}".format(n), "2020", "Bill {}".format(n), chamber="lower")
+
+
+class TestBillStore(unittest.TestCase):
+    def setUp(self):
+        self.store = BillStore(cache_size=2)
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_spills_and_reloads(self):
+        for n in range(5):
+            self.store[n] = make_bill(n)
+        self.assertEqual(len(self.store._live), 2)
+        self.assertEqual(len(self.store), 5)
+
+        # changes to a bill survive it being written out and read back
+        self.store[0].add_sponsorship(
+            "Smith", classification="primary", entity_type="person", primary=True
+        )
+        for n in range(1, 5):
+            self.store[n].add_action("Introduced", "2020-01-01", chamber="lower")
+        self.assertEqual(self.store[0].sponsorships[0]["name"], "Smith")
+        self.assertEqual(len(self.store[3].actions), 1)
+
+    def test_lookup(self):
+        bill = make_bill(1)
+        self.store["HB1"] = bill
+        self.assertIn("HB1", self.store)
+        self.assertNotIn("HB2", self.store)
+        self.assertIsNone(self.store.get("HB2"))
+        with self.assertRaises(KeyError):
+            self.store["HB2"]
+
+    def test_drain_in_order(self):
+        for n in range(5):
+            self.store["HB{}".format(n)] = make_bill(n)
+        self.store["HB1"].add_action("Introduced", "2020-01-01", chamber="lower")
+
+        drained = list(self.store.drain())
+        self.assertEqual(
+            [key for key, _ in drained], ["HB0", "HB1", "HB2", "HB3", "HB4"]
+        )
+        self.assertEqual([bill.identifier for _, bill in drained][1], "HB 1")
+        self.assertEqual(len(drained[1][1].actions), 1)
+        self.assertFalse(os.path.exists(self.store.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import time
+import threading
+import unittest
+
+import scrapelib
+
+from openstates.utils.concurrency import ordered_map, prefetch, RateLimiter
+
+
+class TestOrderedMap(unittest.TestCase):
+    def test_preserves_order(self):
+        def slow_square(n):
+            # make early items finish last
+            time.sleep((10 - n) * 0.002)
+            return n * n
+
+        self.assertEqual(
+            list(ordered_map(slow_square, range(10), workers=4)),
+            [n * n for n in range(10)],
+        )
+
+    def test_bounded_window(self):
+        consumed = []
+        lock = threading.Lock()
+
+        def source():
+            for n in range(20):
+                with lock:
+                    consumed.append(n)
+                yield n
+
+        results = ordered_map(lambda n: n, source(), workers=2, window=3)
+        self.assertEqual(next(results), 0)
+        # never more than the window ahead of the consumer
+        self.assertLessEqual(len(consumed), 4)
+        results.close()
+
+    def test_raises(self):
+        def boom(n):
+            if n == 3:
+                raise ValueError(n)
+            return n
+
+        with self.assertRaises(ValueError):
+            list(ordered_map(boom, range(10)))
+
+
+class TestPrefetch(unittest.TestCase):
+    def test_yields_all(self):
+        self.assertEqual(list(prefetch(iter(range(50)), depth=2)), list(range(50)))
+
+    def test_reraises(self):
+        def pages():
+            yield 1
+            raise KeyError("page")
+
+        it = prefetch(pages())
+        self.assertEqual(next(it), 1)
+        with self.assertRaises(KeyError):
+            next(it)
+
+    def test_early_close(self):
+        it = prefetch(iter(range(1000)), depth=1)
+        self.assertEqual(next(it), 0)
+        it.close()
+
+
+class TestRateLimit(unittest.TestCase):
+    def assertSpaced(self, wait, interval):
+        times = []
+        list(ordered_map(lambda n: wait() or times.append(time.monotonic()), range(5)))
+        times.sort()
+        gaps = [b - a for a, b in zip(times, times[1:])]
+        self.assertGreater(min(gaps), interval * 0.8)
+
+    def test_rate_limiter(self):
+        self.assertSpaced(RateLimiter(1200).wait, 0.05)
+
+    def test_scrapelib_throttle_shared_by_workers(self):
+        scraper = scrapelib.Scraper(requests_per_minute=1200)
+        self.assertSpaced(scraper._throttle, 0.05)
+
+    def test_no_limit(self):
+        start = time.monotonic()
+        for _ in range(5):
+            RateLimiter(0).wait()
+        self.assertLess(time.monotonic() - start, 0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
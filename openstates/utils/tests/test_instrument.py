@@ -0,0 +1,62 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+import lxml.html
+from pupa.scrape import Scraper, Organization
+
+from openstates.utils import instrument, XPathFields
+
+
+class Jurisdiction(object):
+    jurisdiction_id = "ocd-jurisdiction/country:us/state:xx/government"
+
+
+class XXScraper(Scraper):
+    fields = XPathFields(name="string(//p)")
+
+    def scrape(self):
+        for n in range(3):
+            page = lxml.html.fromstring("<p>Committee {}</p>".format(n))
+            name = self.fields.extract(page)["name"]
+            org = Organization(name, classification="committee")
+            org.add_source("http://example.com")
+            yield org
+
+
+class TestInstrument(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        instrument.install(os.path.join(self.directory, "timings"), profile_hz=1000)
+
+    def tearDown(self):
+        instrument.uninstall()
+        shutil.rmtree(self.directory)
+
+    def test_report(self):
+        XXScraper(Jurisdiction(), self.directory).do_scrape()
+
+        path = os.path.join(self.directory, "timings", "utils-XXScraper")
+        with open(path + ".json") as f:
+            report = json.load(f)
+        self.assertTrue(os.path.exists(path + ".folded"))
+
+        phases = report["phases"]
+        self.assertEqual(phases["parse"]["calls"], 3)
+        self.assertEqual(phases["parse"]["bytes"], 54)
+        self.assertEqual(phases["build"]["calls"], 3)
+        self.assertEqual(phases["save"]["calls"], 3)
+        self.assertLessEqual(sum(p["wall"] for p in phases.values()), report["wall"])
+        self.assertEqual(report["xpath"]["string(//p)"]["calls"], 3)
+
+    def test_uninstall(self):
+        instrument.uninstall()
+        self.assertFalse(hasattr(lxml.html.fromstring, "__wrapped__"))
+        self.assertFalse(hasattr(instrument.lxmlize._evaluate, "__wrapped__"))
+        self.assertFalse(hasattr(Scraper.do_scrape, "__wrapped__"))
+
+
+if __name__ == "__main__":
+    unittest.main()
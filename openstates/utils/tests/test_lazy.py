@@ -0,0 +1,29 @@
+import unittest
+
+from openstates.utils.lazy import LazyScrapers
+from openstates.utils.textgrid import TextGrid
+
+
+class TestLazyScrapers(unittest.TestCase):
+    def setUp(self):
+        self.scrapers = LazyScrapers(
+            "openstates.utils", {"grid": "textgrid:TextGrid", "bills": "missing:Nope"}
+        )
+
+    def test_nothing_imported_up_front(self):
+        self.assertEqual(list(self.scrapers), ["grid", "bills"])
+        self.assertIn("bills", self.scrapers)
+        self.assertNotIn("events", self.scrapers)
+        self.assertEqual(len(self.scrapers), 2)
+
+    def test_lookup(self):
+        self.assertIs(self.scrapers["grid"], TextGrid)
+        self.assertIs(self.scrapers.get("grid"), TextGrid)
+        with self.assertRaises(ImportError):
+            self.scrapers["bills"]
+        with self.assertRaises(KeyError):
+            self.scrapers["events"]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import unittest
+
+import lxml.etree
+import requests
+
+from openstates.utils.lxmlize import (
+    sniff_encoding,
+    parse_html,
+    parse_response,
+    absolute,
+    XPathFields,
+    LXMLMixin,
+)
+
+
+def response(content, content_type, url="https://example.com/bills/list.html"):
+    r = requests.Response()
+    r._content = content
+    r.headers["Content-Type"] = content_type
+    r.url = url
+    return r
+
+
+class TestSniffEncoding(unittest.TestCase):
+    def test_header(self):
+        headers = {"content-type": "text/html; charset=UTF-8"}
+        self.assertEqual(sniff_encoding(b"<p>", headers), "utf-8")
+
+    def test_meta(self):
+        page = b'<html><head><meta charset="windows-1252"></head></html>'
+        self.assertEqual(sniff_encoding(page, {"content-type": "text/html"}), "cp1252")
+        page = b'<meta http-equiv="Content-Type" content="text/html; charset=utf-8">'
+        self.assertEqual(sniff_encoding(page), "utf-8")
+
+    def test_defaults(self):
+        # what requests' .text would have used
+        self.assertEqual(
+            sniff_encoding(b"<p>", {"content-type": "text/html"}), "iso8859-1"
+        )
+        self.assertIsNone(sniff_encoding(b"<p>", {}))
+        self.assertIsNone(sniff_encoding(b'<meta charset="bogus">', {}))
+
+
+class TestParse(unittest.TestCase):
+    def test_decodes_bytes(self):
+        page = parse_response(
+            response("<p>Muñoz</p>".encode("utf-8"), "text/html; charset=utf-8")
+        )
+        self.assertEqual(page.text_content(), "Muñoz")
+
+        page = parse_response(
+            response(
+                '<meta charset="windows-1252"><p>Muñoz’</p>'.encode("cp1252"),
+                "text/html",
+            )
+        )
+        self.assertEqual(page.xpath("string(//p)"), "Muñoz’")
+
+    def test_lazy_links(self):
+        page = parse_response(
+            response(b'<a href="HB1.html">HB 1</a>', "text/html; charset=utf-8")
+        )
+        href = page.xpath("//a/@href")[0]
+        self.assertEqual(href, "HB1.html")
+        self.assertEqual(absolute(href), "https://example.com/bills/HB1.html")
+        self.assertEqual(
+            absolute(href, "http://other.org/"), "http://other.org/HB1.html"
+        )
+
+    def test_lazy_element_links(self):
+        page = parse_response(
+            response(b'<a href=" HB1.html">HB 1</a><a>none</a>', "text/html")
+        )
+        first, second = page.xpath("//a")
+        self.assertEqual(absolute(first), "https://example.com/bills/HB1.html")
+        self.assertIsNone(absolute(second))
+
+    def test_etree_links(self):
+        doc = lxml.etree.fromstring(
+            b'<feed><link href="HB1.xml"/></feed>',
+            base_url="https://example.com/bills/feed.xml",
+        )
+        link = doc.find("link")
+        self.assertEqual(absolute(link), "https://example.com/bills/HB1.xml")
+        self.assertEqual(
+            absolute(doc.xpath("//link/@href")[0]), "https://example.com/bills/HB1.xml"
+        )
+
+    def test_plain_string(self):
+        self.assertEqual(
+            absolute("HB1.html", "https://example.com/bills/"),
+            "https://example.com/bills/HB1.html",
+        )
+        with self.assertRaises(TypeError):
+            absolute("HB1.html")
+
+    def test_base_href(self):
+        page = parse_html(
+            b'<html><head><base href="/docs/"></head>'
+            b'<body><a href="a.pdf">a</a></body></html>',
+            "https://example.com/bills/list.html",
+        )
+        self.assertEqual(
+            absolute(page.xpath("//a/@href")[0]), "https://example.com/docs/a.pdf"
+        )
+
+
+class TestXPathFields(unittest.TestCase):
+    fields = XPathFields(
+        title="string(//h1)", sponsors="//li/text()", missing="//table"
+    )
+
+    def test_extract(self):
+        page = parse_html(b"<h1>HB 1</h1><ul><li>Smith</li><li>Jones</li></ul>")
+        self.assertEqual(
+            self.fields.extract(page),
+            {"title": "HB 1", "sponsors": ["Smith", "Jones"], "missing": []},
+        )
+
+    def test_mixin_queries(self):
+        page = parse_html(b"<ul><li>Smith</li><li>Jones</li></ul>")
+        mixin = LXMLMixin()
+        self.assertEqual(mixin.get_node(page, "//li/text()"), "Smith")
+        self.assertIsNone(mixin.get_node(page, "//table"))
+        self.assertEqual(len(mixin.get_nodes(page, "//li")), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
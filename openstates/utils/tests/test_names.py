@@ -0,0 +1,49 @@
+import json
+import os
+import tempfile
+import unittest
+
+from openstates.utils.names import NameResolver
+
+
+class TestNameResolver(unittest.TestCase):
+    def setUp(self):
+        self.cleaned = []
+
+        def clean(name):
+            self.cleaned.append(name)
+            return " ".join(name.split()).title()
+
+        self.resolve = NameResolver(clean=clean, aliases={"Mr. Speaker": "Madigan"})
+
+    def test_memoized(self):
+        first = self.resolve("DAVIS  ,WILLIAM".lower())
+        self.assertEqual(first, "Davis ,William")
+        self.assertIs(self.resolve("davis  ,william"), first)
+        self.assertEqual(len(self.cleaned), 1)
+
+    def test_interned(self):
+        # different raw spellings give the very same string
+        names = self.resolve.resolve_all(["JONES", "jones", " Jones ", "JONES"])
+        self.assertEqual(names, ["Jones"] * 4)
+        self.assertEqual(len({id(name) for name in names}), 1)
+        self.assertEqual(len(self.cleaned), 3)
+
+    def test_aliases(self):
+        self.assertEqual(self.resolve("Mr. Speaker"), "Madigan")
+        self.resolve.add_aliases({"Smyth": "Smith"})
+        self.assertEqual(self.resolve("SMYTH"), "Smith")
+
+    def test_add_people(self):
+        self.assertEqual(self.resolve("Bob Smith"), "Bob Smith")
+        with tempfile.TemporaryDirectory() as directory:
+            person = {"name": "Robert Smith", "other_names": [{"name": "Bob Smith"}]}
+            with open(os.path.join(directory, "person_1.json"), "w") as f:
+                json.dump(person, f)
+            self.assertEqual(self.resolve.add_people(directory), 1)
+        self.assertEqual(self.resolve("Bob Smith"), "Robert Smith")
+        self.assertEqual(self.resolve("Robert Smith"), "Robert Smith")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+import ftplib
+import shutil
+import tempfile
+import threading
+import unittest
+import urllib.error
+from unittest import mock
+import urllib.request
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+import requests
+
+from openstates.utils import replay
+
+
+class Handler(BaseHTTPRequestHandler):
+    hits = 0
+
+    def do_GET(self):
+        Handler.hits += 1
+        if self.path == "/missing":
+            self.send_error(404)
+            return
+        body = "{} #{}".format(self.path, Handler.hits).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        body = b"posted " + self.rfile.read(length)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestReplay(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        Handler.hits = 0
+        self.server = HTTPServer(("127.0.0.1", 0), Handler)
+        self.url = "http://127.0.0.1:{}".format(self.server.server_port)
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    def tearDown(self):
+        replay.uninstall()
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.directory)
+
+    def record_then_replay(self, fetch):
+        replay.record(self.directory)
+        recorded = fetch()
+        replay.uninstall()
+        self.server.shutdown()
+
+        replay.replay(self.directory)
+        self.assertEqual(fetch(), recorded)
+        return recorded
+
+    def test_requests(self):
+        def fetch():
+            s = requests.Session()
+            return [
+                s.get(self.url + "/a").text,
+                s.get(self.url + "/a").text,
+                s.post(self.url + "/form", data={"page": "2"}).text,
+                s.get(self.url + "/missing").status_code,
+            ]
+
+        self.assertEqual(
+            self.record_then_replay(fetch), ["/a #1", "/a #2", "posted page=2", 404]
+        )
+
+    def test_urllib(self):
+        def fetch():
+            body = urllib.request.urlopen(self.url + "/b").read()
+            try:
+                urllib.request.urlopen(self.url + "/missing")
+            except urllib.error.HTTPError as e:
+                return body, e.code
+
+        self.assertEqual(self.record_then_replay(fetch), (b"/b #1", 404))
+
+    def test_recording(self):
+        self.assertFalse(replay.recording())
+        replay.record(self.directory)
+        self.assertTrue(replay.recording())
+        replay.uninstall()
+        replay.replay(self.directory)
+        self.assertFalse(replay.recording())
+
+    def test_not_recorded(self):
+        replay.record(self.directory)
+        replay.uninstall()
+        replay.replay(self.directory)
+        with self.assertRaises(replay.NotRecorded):
+            requests.get(self.url + "/never")
+
+    def test_ftp_replay(self):
+        archive = replay.record(self.directory)
+        archive.add(
+            "FTP", "ftp://ftp.example.com/data LIST", None, {"reply": "226"}, b"a\nb"
+        )
+        archive.add(
+            "FTP", "ftp://ftp.example.com/data RETR a", None, {"reply": "226"}, b"AAA"
+        )
+        replay.uninstall()
+
+        replay.replay(self.directory)
+        with ftplib.FTP("ftp.example.com") as ftp:
+            ftp.login()
+            ftp.cwd("/data")
+            lines = []
+            ftp.retrlines("LIST", lines.append)
+            chunks = []
+            ftp.retrbinary("RETR a", chunks.append)
+            with self.assertRaises(ftplib.error_perm):
+                ftp.sendcmd("MDTM a")
+        self.assertEqual(lines, ["a", "b"])
+        self.assertEqual(chunks, [b"AAA"])
+
+    def test_ftp_replay_listings(self):
+        archive = replay.record(self.directory)
+        archive.add("FTP", "ftp://ftp.example.com/ NLST", None, {"reply": "226"}, b"a")
+        archive.add("FTP", "ftp://ftp.example.com/ LIST", None, {"reply": "226"}, b"-a")
+        archive.add("FTP", "ftp://ftp.example.com/ NOOP", None, {"reply": "200"}, b"")
+        replay.uninstall()
+
+        replay.replay(self.directory)
+        ftp = ftplib.FTP("ftp.example.com")
+        self.assertEqual(ftp.nlst(), ["a"])
+        lines = []
+        ftp.dir(lines.append)
+        self.assertEqual(lines, ["-a"])
+        self.assertEqual(ftp.voidcmd("NOOP"), "200")
+        with self.assertRaises(NotImplementedError):
+            ftp.transfercmd("RETR a")
+
+    def test_ftp_record_streams_and_errors(self):
+        def retrbinary(ftp, cmd, callback, blocksize=8192, rest=None):
+            if cmd == "RETR gone":
+                raise ftplib.error_perm("550 gone")
+            for chunk in (b"AA", b"BB"):
+                callback(chunk)
+            return "226 done"
+
+        chunks = []
+        with mock.patch("ftplib.FTP.retrbinary", retrbinary):
+            replay.record(self.directory)
+            ftp = ftplib.FTP()
+            ftp.host = "ftp.example.com"
+            ftp.retrbinary("RETR a", chunks.append)
+            with self.assertRaises(ftplib.error_perm):
+                ftp.retrbinary("RETR gone", chunks.append)
+            replay.uninstall()
+        # handed over as they arrive, not joined up at the end
+        self.assertEqual(chunks, [b"AA", b"BB"])
+
+        replay.replay(self.directory)
+        ftp = ftplib.FTP("ftp.example.com")
+        replayed = []
+        self.assertEqual(ftp.retrbinary("RETR a", replayed.append), "226 done")
+        self.assertEqual(replayed, [b"AABB"])
+        with self.assertRaisesRegex(ftplib.error_perm, "550 gone"):
+            ftp.retrbinary("RETR gone", replayed.append)
+
+
+if __name__ == "__main__":
+    unittest.main()
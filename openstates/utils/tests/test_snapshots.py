@@ -0,0 +1,79 @@
+import os
+import datetime
+import tempfile
+import unittest
+from unittest import mock
+
+from pupa.scrape import Bill
+
+from openstates.utils.snapshots import SessionSnapshots, session_frozen
+
+
+class Jurisdiction(object):
+    legislative_sessions = [
+        {"identifier": "2017", "end_date": "2017-06-30"},
+        {"identifier": "2020"},
+    ]
+
+
+class Scraper(object):
+    jurisdiction = Jurisdiction()
+
+    def info(self, *args):
+        pass
+
+
+class TestSessionSnapshots(unittest.TestCase):
+    def setUp(self):
+        self.cache = tempfile.TemporaryDirectory()
+        patcher = mock.patch("pupa.settings.CACHE_DIR", self.cache.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.cache.cleanup)
+        self.snapshots = SessionSnapshots(Scraper())
+        self.scraped = []
+
+    def scrape(self, session):
+        for n in range(3):
+            self.scraped.append(n)
+            yield Bill("HB {}".format(n), session, "Bill {}".format(n))
+
+    def test_session_frozen(self):
+        juris = Jurisdiction()
+        self.assertTrue(session_frozen(juris, "2017"))
+        self.assertFalse(session_frozen(juris, "2017", today=datetime.date(2017, 8, 1)))
+        self.assertFalse(session_frozen(juris, "2020"))
+        self.assertFalse(session_frozen(juris, "1999"))
+
+    def test_replay(self):
+        first = list(self.snapshots(self.scrape("2017"), "2017", "lower"))
+        self.assertEqual(len(self.scraped), 3)
+        self.assertTrue(os.path.exists(self.snapshots.path("2017", "lower")))
+
+        again = list(self.snapshots(self.scrape("2017"), "2017", "lower"))
+        self.assertEqual(len(self.scraped), 3)
+        self.assertEqual([b.identifier for b in again], ["HB 0", "HB 1", "HB 2"])
+        self.assertEqual([b._id for b in again], [b._id for b in first])
+
+    def test_versioned_path(self):
+        with mock.patch("pupa.__version__", "99.0"):
+            upgraded = SessionSnapshots(Scraper())
+        self.assertNotEqual(
+            upgraded.path("2017", "lower"), self.snapshots.path("2017", "lower")
+        )
+
+    def test_open_session_scraped(self):
+        list(self.snapshots(self.scrape("2020"), "2020"))
+        list(self.snapshots(self.scrape("2020"), "2020"))
+        self.assertEqual(len(self.scraped), 6)
+        self.assertEqual(os.listdir(self.snapshots.directory), [])
+
+    def test_partial_scrape_not_saved(self):
+        objects = self.snapshots(self.scrape("2017"), "2017")
+        next(objects)
+        objects.close()
+        self.assertEqual(os.listdir(self.snapshots.directory), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+from openstates.utils.textgrid import text_boxes, TextGrid, Columns
+
+XML = """<?xml version="1.0" encoding="UTF-8"?>
+<pdf2xml>
+<page number="1" top="0" left="0" height="1000" width="800">
+<text top="141" left="50" width="60" height="12"><b>JONES</b></text>
+<text top="120" left="215" width="10" height="12">X</text>
+<text top="120" left="50" width="60" height="12">SMITH</text>
+<text top="140" left="262" width="8" height="12">X</text>
+<text top="160" left="50" width="60" height="12"></text>
+</page>
+</pdf2xml>
+"""
+
+
+class TestTextGrid(unittest.TestCase):
+    def setUp(self):
+        self.boxes = text_boxes(XML)
+
+    def test_text_boxes(self):
+        self.assertEqual(len(self.boxes), 4)
+        jones = self.boxes[0]
+        self.assertEqual((jones.text, jones.top, jones.right), ("JONES", 141, 110))
+        self.assertTrue(jones.bold)
+        self.assertFalse(self.boxes[1].bold)
+
+    def test_rows(self):
+        grid = TextGrid(self.boxes, tolerance=2)
+        self.assertEqual(grid.tops, [120, 140])
+        self.assertEqual([box.text for box in grid.row_at(141)], ["JONES", "X"])
+        self.assertEqual(len(grid.rows_between(120, 200)), 1)
+        with self.assertRaises(KeyError):
+            grid.row_at(150)
+
+    def test_exact_rows(self):
+        grid = TextGrid(self.boxes)
+        self.assertEqual(grid.tops, [120, 140, 141])
+
+    def test_columns(self):
+        columns = Columns({230: "YES", 270: "NO", 320: "ABS"})
+        self.assertEqual(columns.nearest(225), "YES")
+        self.assertEqual(columns.nearest(100), "YES")
+        self.assertEqual(columns.nearest(255), "NO")
+        self.assertEqual(columns.nearest(900), "ABS")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+    Positional text from ``pdftohtml -xml`` (``convert_pdf(..., type="xml")``).
+
+    Roll calls and directories laid out as a grid come out of pdftohtml as
+    ``<text top= left= width= height=>`` boxes in whatever order the PDF drew
+    them.  ``text_boxes`` reads them from one parse of the XML, ``TextGrid``
+    bins them into rows by their ``top`` and ``Columns`` finds the header a
+    cell falls under.
+"""
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+
+import lxml.etree
+
+
+class TextBox(namedtuple("TextBox", "text left top width height bold")):
+    __slots__ = ()
+
+    @property
+    def right(self):
+        return self.left + self.width
+
+
+def text_boxes(xml):
+    """Reads the text boxes in a ``pdftohtml -xml`` document.
+
+    Text in a ``<b>`` gets its own box, at the position of the ``<text>``
+    around it.  Elements without text of their own are skipped.
+
+    Args:
+        xml (str|bytes): The document.
+    Returns:
+        List[TextBox]: In document order.
+    """
+    if isinstance(xml, str):
+        xml = xml.encode("utf-8")
+    boxes = []
+    for text in lxml.etree.fromstring(xml).iter("text"):
+        position = (
+            int(text.get("left")),
+            int(text.get("top")),
+            int(text.get("width")),
+            int(text.get("height")),
+        )
+        parts = [(text.text, False)] + [(b.text, True) for b in text.findall("b")]
+        for value, bold in parts:
+            if value is not None:
+                boxes.append(TextBox(value.strip(), *position, bold=bold))
+    return boxes
+
+
+class TextGrid(object):
+    """Text boxes binned into rows.
+
+    Boxes whose ``top`` is within ``tolerance`` of the first box in a row
+    join that row, so cells a pixel or two off, e.g. set in a different
+    font, still line up.
+
+    Args:
+        boxes (Iterable[TextBox]): What to lay out.
+        tolerance (int): Vertical slack within a row, in pixels.
+    """
+
+    def __init__(self, boxes, tolerance=0):
+        self.tolerance = tolerance
+        self.tops = []
+        self.rows = []
+        for box in sorted(boxes, key=lambda box: box.top):
+            if self.tops and box.top - self.tops[-1] <= tolerance:
+                self.rows[-1].append(box)
+            else:
+                self.tops.append(box.top)
+                self.rows.append([box])
+        for row in self.rows:
+            row.sort(key=lambda box: box.left)
+
+    def row_at(self, top):
+        """Returns the row holding boxes at ``top``, left to right."""
+        i = bisect_right(self.tops, top) - 1
+        if i < 0 or top - self.tops[i] > self.tolerance:
+            raise KeyError(top)
+        return self.rows[i]
+
+    def rows_between(self, after, until):
+        """Returns the rows starting below ``after`` and no lower than ``until``."""
+        start = bisect_right(self.tops, after)
+        stop = bisect_right(self.tops, until)
+        return self.rows[start:stop]
+
+
+class Columns(object):
+    """Column headers, found from the x position of a cell.
+
+    Args:
+        headers (dict): Header label by x position, e.g. its right edge.
+    """
+
+    def __init__(self, headers):
+        self.headers = dict(headers)
+        self.positions = sorted(self.headers)
+
+    def nearest(self, x):
+        """Returns the label of the header closest to ``x``."""
+        positions = self.positions
+        c = bisect_left(positions, x)
+        if c == 0:
+            position = positions[0]
+        elif c == len(positions):
+            position = positions[-1]
+        elif positions[c] - x < x - positions[c - 1]:
+            position = positions[c]
+        else:
+            position = positions[c - 1]
+        return self.headers[position]
@@ -1,10 +1,7 @@
 import logging
 from pupa.scrape import Jurisdiction, Organization
 
-from openstates.utils import url_xpath
-
-from .people import VaPersonScraper
-from .bills import VaBillScraper
+from openstates.utils import url_xpath, LazyScrapers
 
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -18,7 +15,9 @@ class Virginia(Jurisdiction):
     classification = "government"
     name = "Virginia"
     url = "http://virginiageneralassembly.gov/"
-    scrapers = {"people": VaPersonScraper, "bills": VaBillScraper}
+    scrapers = LazyScrapers(
+        __name__, {"people": "people:VaPersonScraper", "bills": "bills:VaBillScraper"}
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2010 Session",
@@ -6,6 +6,9 @@ import logging
 
 from spatula import Page, Spatula
 from pupa.scrape import Scraper, Bill, VoteEvent
+
+from openstates.utils import ordered_map, prefetch
+from openstates.utils.actions import PatternClassifier
 from .common import SESSION_SITE_IDS
 
 
@@ -48,6 +51,7 @@ ACTION_CLASSIFIERS = (
     ("Bill text as passed", SKIP),
     ("Acts of Assembly", SKIP),
 )
+classify_action = PatternClassifier(ACTION_CLASSIFIERS)
 
 
 class SubjectPage(Page, Spatula):
@@ -71,6 +75,7 @@ class SubjectBillListPage(Page, Spatula):
 
 class BillListPage(Page, Spatula):
     def handle_page(self):
+        """ yields (bill, bill_url, sponsor_url) for each bill on this page """
         bills = self.doc.xpath('//ul[@class="linkSect"]/li')
         for bill in bills:
             link = bill.getchildren()[0]
@@ -97,18 +102,12 @@ class BillListPage(Page, Spatula):
             sponsor_url = BASE_URL + URL_PATTERNS["sponsors"].format(
                 self.kwargs["session_id"], bill_id.replace(" ", "")
             )
+            yield bill, bill_url, sponsor_url
 
-            list(self.scrape_page_items(BillSponsorPage, url=sponsor_url, obj=bill))
-            yield from self.scrape_page_items(BillDetailPage, url=bill_url, obj=bill)
-            bill.subject = self.kwargs["subjects"][bill_id]
-            bill.add_source(bill_url)
-            yield bill
-
+    @property
+    def next_url(self):
         next_url = self.doc.xpath('//a/b[text()="More..."]/../@href')
-        if next_url:
-            yield from self.scrape_page_items(
-                BillListPage, url=next_url[0], **self.kwargs
-            )
+        return next_url[0] if next_url else None
 
 
 class BillSponsorPage(Page, Spatula):
@@ -347,11 +346,7 @@ class BillDetailPage(Page, Spatula):
             cached_vote = cached_action = None
 
             # categorize actions
-            for pattern, atype in ACTION_CLASSIFIERS:
-                if re.match(pattern, action):
-                    break
-            else:
-                atype = None
+            atype = classify_action(action)
 
             # if matched a 'None' atype, don't add the action
             if atype != SKIP:
@@ -428,6 +423,8 @@ def add_pupa_id(vote):
 
 
 class VaBillScraper(Scraper, Spatula):
+    workers = 4
+
     def scrape(self, session=None):
         if not session:
             session = self.jurisdiction.legislative_sessions[-1]["identifier"]
@@ -436,13 +433,36 @@ class VaBillScraper(Scraper, Spatula):
         url = BASE_URL + URL_PATTERNS["list"].format(session_id)
         subject_url = BASE_URL + URL_PATTERNS["subjects"].format(session_id)
         subjects = self.scrape_page(SubjectPage, url=subject_url)
-        yield from self.scrape_page_items(
-            BillListPage,
-            url=url,
-            session=session,
-            session_id=session_id,
-            subjects=subjects,
+
+        # list pages are fetched one ahead of the bills being processed, and
+        # sponsor/detail pages are fetched on a pool; the pages are then
+        # handled here in list order, so output stays deterministic
+        bill_stubs = (
+            stub
+            for page in prefetch(self.list_pages(url, session, session_id))
+            for stub in page.handle_page()
         )
+        for bill, bill_url, sponsor_page, detail_page in ordered_map(
+            self.fetch_bill_pages, bill_stubs, workers=self.workers
+        ):
+            list(sponsor_page.handle_page())
+            yield from detail_page.handle_page()
+            bill.subject = subjects[bill.identifier]
+            bill.add_source(bill_url)
+            yield bill
+
+    def list_pages(self, url, session, session_id):
+        while url:
+            page = BillListPage(self, url=url, session=session, session_id=session_id)
+            yield page
+            url = page.next_url
+
+    def fetch_bill_pages(self, stub):
+        # Page subclasses do their request & parse on construction
+        bill, bill_url, sponsor_url = stub
+        sponsor_page = BillSponsorPage(self, url=sponsor_url, obj=bill)
+        detail_page = BillDetailPage(self, url=bill_url, obj=bill)
+        return bill, bill_url, sponsor_page, detail_page
 
     def accept_response(self, response):
         # check for rate limit pages
@@ -1,11 +1,5 @@
 from pupa.scrape import Jurisdiction, Organization
-from openstates.utils import url_xpath
-from .people import VTPersonScraper
-
-# from .committees import VTCommitteeScraper
-from .bills import VTBillScraper
-from .events import VTEventScraper
-
+from openstates.utils import url_xpath, LazyScrapers
 
 # As of March 2018, Vermont appears to be throttling hits
 # to its website. After a week of production failures, we
@@ -22,12 +16,15 @@ class Vermont(Jurisdiction):
     classification = "government"
     name = "Vermont"
     url = "http://legislature.vermont.gov/"
-    scrapers = {
-        "people": VTPersonScraper,
-        # 'committees': VTCommitteeScraper,
-        "bills": VTBillScraper,
-        "events": VTEventScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:VTPersonScraper",
+            # "committees": "committees:VTCommitteeScraper",
+            "bills": "bills:VTBillScraper",
+            "events": "events:VTEventScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2009-2010 Session",
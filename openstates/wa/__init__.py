@@ -1,9 +1,6 @@
 from pupa.scrape import Jurisdiction, Organization
-from .people import WAPersonScraper
-from .events import WAEventScraper
 
-# from .committees import WACommitteeScraper
-from .bills import WABillScraper
+from openstates.utils import LazyScrapers
 
 settings = dict(SCRAPELIB_TIMEOUT=300)
 
@@ -13,12 +10,15 @@ class Washington(Jurisdiction):
     classification = "government"
     name = "Washington"
     url = "http://www.leg.wa.gov"
-    scrapers = {
-        "people": WAPersonScraper,
-        "events": WAEventScraper,
-        # 'committees': WACommitteeScraper,
-        "bills": WABillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:WAPersonScraper",
+            "events": "events:WAEventScraper",
+            # "committees": "committees:WACommitteeScraper",
+            "bills": "bills:WABillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2009-10",
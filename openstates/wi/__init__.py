@@ -1,12 +1,6 @@
 from pupa.scrape import Jurisdiction, Organization
 
-from openstates.utils import url_xpath
-
-from .bills import WIBillScraper
-from .events import WIEventScraper
-from .people import WIPersonScraper
-
-# from .committees import WICommitteeScraper
+from openstates.utils import url_xpath, LazyScrapers
 
 
 class Wisconsin(Jurisdiction):
@@ -14,12 +8,15 @@ class Wisconsin(Jurisdiction):
     classification = "government"
     name = "Wisconsin"
     url = "http://legis.wisconsin.gov/"
-    scrapers = {
-        "bills": WIBillScraper,
-        "events": WIEventScraper,
-        "people": WIPersonScraper,
-        # 'committees': WICommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": "bills:WIBillScraper",
+            "events": "events:WIEventScraper",
+            "people": "people:WIPersonScraper",
+            # "committees": "committees:WICommitteeScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2009 Regular Session",
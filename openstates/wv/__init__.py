@@ -1,9 +1,6 @@
 from pupa.scrape import Jurisdiction, Organization
 
-from .people import WVPersonScraper
-
-# from .committees import WVCommitteeScraper
-from .bills import WVBillScraper
+from openstates.utils import LazyScrapers
 
 
 class WestVirginia(Jurisdiction):
@@ -11,11 +8,14 @@ class WestVirginia(Jurisdiction):
     classification = "government"
     name = "West Virginia"
     url = "http://www.legis.state.wv.us/"
-    scrapers = {
-        "people": WVPersonScraper,
-        # 'committees': WVCommitteeScraper,
-        "bills": WVBillScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "people": "people:WVPersonScraper",
+            # "committees": "committees:WVCommitteeScraper",
+            "bills": "bills:WVBillScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2011",
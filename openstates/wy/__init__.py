@@ -1,9 +1,6 @@
 from pupa.scrape import Jurisdiction, Organization
 
-from .bills import WYBillScraper
-from .people import WYPersonScraper
-
-# from .committees import WYCommitteeScraper
+from openstates.utils import LazyScrapers
 
 import requests
 import re
@@ -14,11 +11,14 @@ class Wyoming(Jurisdiction):
     classification = "government"
     name = "Wyoming"
     url = "http://legisweb.state.wy.us/"
-    scrapers = {
-        "bills": WYBillScraper,
-        "people": WYPersonScraper,
-        # 'committees': WYCommitteeScraper,
-    }
+    scrapers = LazyScrapers(
+        __name__,
+        {
+            "bills": "bills:WYBillScraper",
+            "people": "people:WYPersonScraper",
+            # "committees": "committees:WYCommitteeScraper",
+        },
+    )
     legislative_sessions = [
         {
             "_scraped_name": "2011",
@@ -1,3 +1,5 @@
+import os
+
 from openstates import transformers
 
 ENABLE_PEOPLE_AND_ORGS = False
@@ -5,5 +7,29 @@ ENABLE_EVENTS = False
 
 IMPORT_TRANSFORMERS = {"bill": {"identifier": transformers.fix_bill_id}}
 
+# OPENSTATES_RECORD=<dir> archives everything a scrape fetches,
+# OPENSTATES_REPLAY=<dir> reruns the scrape from that archive with no network
+if os.environ.get("OPENSTATES_RECORD"):
+    from openstates.utils import replay
+
+    replay.record(os.environ["OPENSTATES_RECORD"])
+elif os.environ.get("OPENSTATES_REPLAY"):
+    from openstates.utils import replay
+
+    replay.replay(os.environ["OPENSTATES_REPLAY"])
+    # nothing to be polite to, and a miss won't succeed on retry
+    SCRAPELIB_RPM = 0
+    SCRAPELIB_RETRY_ATTEMPTS = 0
+
+# OPENSTATES_TIMINGS=<dir> writes a per-scraper JSON timing report there,
+# OPENSTATES_PROFILE=<hz> also samples stacks for a flamegraph
+if os.environ.get("OPENSTATES_TIMINGS"):
+    from openstates.utils import instrument
+
+    instrument.install(
+        os.environ["OPENSTATES_TIMINGS"],
+        profile_hz=int(os.environ.get("OPENSTATES_PROFILE") or 0),
+    )
+
 
 print("loaded Open States pupa settings...")